@@ -9,10 +9,18 @@ This script uses the Nabla API to:
 
 Usage:
     python generate-compliance-csv.py [--tfstate PATH] [--output-dir PATH]
+    python generate-compliance-csv.py --batch DIR|GLOB|MANIFEST [--workers N]
+    python generate-compliance-csv.py --extract-workers N
+    python generate-compliance-csv.py --format parquet|arrow
+    python generate-compliance-csv.py --sqlite DB [--sqlite-only]
+    python generate-compliance-csv.py --profile TRACE.json [--profile-memory]
+    python generate-compliance-csv.py --metrics-file FILE.prom [--progress]
+    python generate-compliance-csv.py --watch [--debounce SECONDS] [--polling]
 
 Environment variables:
     NABLA_CUSTOMER_KEY: Customer API key (required)
     NABLA_API_URL: API endpoint (default: https://api.usenabla.com)
+    NABLA_CACHE_DIR: Response cache directory (default: ~/.cache/nabla/evidence)
 
 Examples:
     # Generate CSV reports from the example Terraform state
@@ -20,387 +28,404 @@ Examples:
 
     # Use custom Terraform state file
     python generate-compliance-csv.py --tfstate /path/to/terraform.tfstate.b64
-"""
 
-import os
-import sys
-import json
-import base64
-import argparse
-import csv
-from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Any
+    # Raw and gzip-compressed states are read as they are, no base64 needed
+    python generate-compliance-csv.py --tfstate /path/to/terraform.tfstate.gz
 
-# Add SDK to path
-sdk_path = Path(__file__).parent.parent / 'sdks' / 'nabla-python' / 'src'
-sys.path.insert(0, str(sdk_path))
+    # Assess every workspace listed in a manifest, 8 at a time
+    python generate-compliance-csv.py --batch workspaces.txt --workers 8
 
-from nabla_py.sdk import Nabla
+    # Re-assess only what changed since yesterday's state (assessment from cache)
+    python generate-compliance-csv.py --tfstate today.tfstate.b64 --previous-tfstate yesterday.tfstate.b64
 
+    # Write typed Parquet tables for analytics instead of CSV (requires pyarrow)
+    python generate-compliance-csv.py --format parquet
 
-class ComplianceCSVGenerator:
-    """Generate CSV reports from compliance assessments"""
+    # Also record every workspace's run in a SQLite database for cross-run queries
+    python generate-compliance-csv.py --batch workspaces.txt --sqlite assessments.db
 
-    def __init__(self, api_key: str, api_url: str = "https://api.usenabla.com"):
-        self.client = Nabla(
-            customer_key=api_key,
-            server_url=api_url
-        )
+    # Find out where a slow run spends its time (open the trace in Perfetto or chrome://tracing)
+    python generate-compliance-csv.py --tfstate big.tfstate.b64 --profile trace.json
 
-    def read_terraform_state_b64(self, file_path: str) -> str:
-        """Read base64-encoded Terraform state file"""
-        with open(file_path, 'r') as f:
-            content = f.read().strip()
-        return content
+    # Extract the inventory of a state with hundreds of thousands of instances on every CPU
+    python generate-compliance-csv.py --tfstate huge.tfstate.b64 --extract-workers 0
 
-    def analyze_terraform_state(
-        self,
-        tfstate_b64: str,
-        name: str = "compliance-assessment",
-        include_diagram: bool = False
-    ) -> Dict:
-        """Call Nabla API to analyze Terraform state"""
-        print(f"\n🔍 Analyzing Terraform state: {name}")
-        print("=" * 70)
+    # Stay running and regenerate only the affected reports whenever a workspace's state changes
+    python generate-compliance-csv.py --batch workspaces.txt --watch
 
-        # Make direct API call using urllib
-        import urllib.request
-        import urllib.error
-        api_url = self.client.sdk_configuration.server_url
-        api_key = self.client.sdk_configuration.security.customer_key
-
-        request_data = json.dumps({
-            "name": name,
-            "format": "json",
-            "content_base64": tfstate_b64,
-            "include_diagram": include_diagram
-        }).encode('utf-8')
-
-        req = urllib.request.Request(
-            f"{api_url}/v1/evidence/terraform",
-            data=request_data,
-            headers={
-                "X-Customer-Key": api_key,
-                "Content-Type": "application/json"
-            }
-        )
+    # Export throughput metrics to node_exporter's textfile collector and watch progress live
+    python generate-compliance-csv.py --metrics-file /var/lib/node_exporter/textfile/nabla.prom --progress
+"""
 
-        try:
-            with urllib.request.urlopen(req) as response:
-                response_data = json.loads(response.read().decode('utf-8'))
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode('utf-8')
-            raise Exception(f"API Error ({e.code}): {error_body}") from e
-
-        print(f"✅ Assessment completed: {response_data.get('id', 'N/A')}")
-        print(f"   Status: {response_data.get('status', 'N/A')}")
-        print(f"   Created: {response_data.get('created_at', 'N/A')}")
-        print("=" * 70)
+import json
+import argparse
+import csv
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Union
+
+from nabla_evidence import cli, profiling
+from nabla_evidence.assessment import AssessmentIndex
+from nabla_evidence.client import EvidenceClient
+from nabla_evidence.columnar import (
+    COLUMNAR_FORMATS, CONTROLS_COLUMNS, FINDINGS_COLUMNS, SUMMARY_COLUMNS,
+    Columns, asset_columns, require_pyarrow, write_columnar
+)
+from nabla_evidence.inventory import (
+    AssetInventory, SharedTags, asset_fieldnames, extract_asset_inventory, iter_asset_inventory
+)
+from nabla_evidence.state import StateFile
+from nabla_evidence.store import AssessmentStore
+
+if TYPE_CHECKING:
+    from nabla_evidence.watch import WarmWorkspace
+
+
+def _asset_csv_row(asset: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten structured asset values (tags, labels, lists, encryption) into CSV cells"""
+    row = dict(asset)
+    if 'encryption' in row:
+        row['encryption'] = 'Enabled' if row['encryption'] and row['encryption'] != 'N/A' else 'N/A'
+    for field, value in row.items():
+        if isinstance(value, SharedTags):
+            row[field] = value.to_json()
+        elif field in ('tags', 'labels') or isinstance(value, (dict, list)):
+            row[field] = json.dumps(value)
+    return row
+
+
+class ComplianceCSVGenerator(EvidenceClient):
+    """Generate CSV reports from compliance assessments"""
 
-        return response_data
+    def index_assessment(self, response: Dict) -> AssessmentIndex:
+        """Build the shared assessment index every report reads from"""
+        return AssessmentIndex(response)
 
-    def extract_asset_inventory(self, tfstate_b64: str) -> List[Dict[str, Any]]:
-        """Extract asset inventory from Terraform state"""
-        try:
-            tfstate_json = base64.b64decode(tfstate_b64).decode('utf-8')
-            tfstate = json.loads(tfstate_json)
-        except Exception as e:
-            print(f"⚠️  Warning: Could not parse Terraform state for inventory: {e}")
-            return []
-
-        inventory = []
-        resources = tfstate.get('resources', [])
-
-        for resource in resources:
-            resource_type = resource.get('type', 'unknown')
-            resource_name = resource.get('name', 'unknown')
-            instances = resource.get('instances', [])
-
-            for idx, instance in enumerate(instances):
-                attrs = instance.get('attributes', {})
-
-                # Extract common attributes
-                asset = {
-                    'asset_id': f"{resource_type}.{resource_name}.{idx}",
-                    'resource_type': resource_type,
-                    'resource_name': resource_name,
-                    'provider': resource.get('provider', 'unknown'),
-                }
-
-                # Add type-specific attributes
-                if resource_type.startswith('aws_'):
-                    asset.update(self._extract_aws_attributes(resource_type, attrs))
-                elif resource_type.startswith('azurerm_'):
-                    asset.update(self._extract_azure_attributes(resource_type, attrs))
-                elif resource_type.startswith('google_'):
-                    asset.update(self._extract_gcp_attributes(resource_type, attrs))
-
-                inventory.append(asset)
-
-        return inventory
-
-    def _extract_aws_attributes(self, resource_type: str, attrs: Dict) -> Dict:
-        """Extract AWS-specific attributes"""
-        common = {
-            'cloud_provider': 'AWS',
-            'id': attrs.get('id', attrs.get('arn', 'N/A')),
-            'region': attrs.get('region', attrs.get('availability_zone', 'N/A')),
-            'tags': json.dumps(attrs.get('tags', {})),
-        }
-
-        if resource_type == 'aws_instance':
-            common.update({
-                'asset_type': 'EC2 Instance',
-                'instance_type': attrs.get('instance_type', 'N/A'),
-                'ami': attrs.get('ami', 'N/A'),
-                'public_ip': attrs.get('public_ip', 'N/A'),
-                'private_ip': attrs.get('private_ip', 'N/A'),
-            })
-        elif resource_type == 'aws_s3_bucket':
-            # Handle versioning (can be a list or dict in Terraform state)
-            versioning = attrs.get('versioning', [])
-            versioning_enabled = False
-            if isinstance(versioning, list) and len(versioning) > 0:
-                versioning_enabled = versioning[0].get('enabled', False)
-            elif isinstance(versioning, dict):
-                versioning_enabled = versioning.get('enabled', False)
-
-            common.update({
-                'asset_type': 'S3 Bucket',
-                'bucket_name': attrs.get('bucket', 'N/A'),
-                'versioning': versioning_enabled,
-                'encryption': 'Enabled' if attrs.get('server_side_encryption_configuration') else 'N/A',
-            })
-        elif resource_type == 'aws_db_instance':
-            common.update({
-                'asset_type': 'RDS Database',
-                'engine': attrs.get('engine', 'N/A'),
-                'engine_version': attrs.get('engine_version', 'N/A'),
-                'instance_class': attrs.get('instance_class', 'N/A'),
-                'storage_encrypted': attrs.get('storage_encrypted', False),
-            })
-        else:
-            common['asset_type'] = resource_type
-
-        return common
-
-    def _extract_azure_attributes(self, resource_type: str, attrs: Dict) -> Dict:
-        """Extract Azure-specific attributes"""
-        return {
-            'cloud_provider': 'Azure',
-            'asset_type': resource_type,
-            'id': attrs.get('id', 'N/A'),
-            'location': attrs.get('location', 'N/A'),
-            'resource_group': attrs.get('resource_group_name', 'N/A'),
-            'tags': json.dumps(attrs.get('tags', {})),
-        }
-
-    def _extract_gcp_attributes(self, resource_type: str, attrs: Dict) -> Dict:
-        """Extract GCP-specific attributes"""
-        return {
-            'cloud_provider': 'GCP',
-            'asset_type': resource_type,
-            'id': attrs.get('id', 'N/A'),
-            'zone': attrs.get('zone', 'N/A'),
-            'project': attrs.get('project', 'N/A'),
-            'labels': json.dumps(attrs.get('labels', {})),
-        }
-
-    def generate_controls_csv(self, response: Dict, output_path: Path):
+    @profiling.traced()
+    def generate_controls_csv(self, assessment: Union[AssessmentIndex, Dict], output_path: Path):
         """Generate CSV report for controls across all frameworks"""
         print(f"\n📝 Generating Controls CSV...")
 
-        assessment = response.get('assessment', {})
-        frameworks = ['nist_800_53', 'nist_800_171', 'nist_800_172', 'cmmc', 'fips_140_2', 'fips_140_3']
-
-        rows = []
-        for fw_key in frameworks:
-            if fw_key not in assessment:
-                continue
-
-            fw_data = assessment[fw_key]
-            framework_name = fw_key.upper().replace('_', ' ')
-            version = fw_data.get('version', 'Unknown')
-            controls = fw_data.get('controls', [])
-
-            for control in controls:
-                rows.append({
-                    'framework': framework_name,
-                    'version': version,
-                    'control_id': control.get('control_id', 'N/A'),
-                    'title': control.get('title', 'N/A'),
-                    'status': control.get('status', 'unknown'),
-                    'findings_count': len(control.get('findings', [])),
-                    'evidence_count': len(control.get('evidence', [])),
-                    'findings': ' | '.join(control.get('findings', [])),
-                    'evidence': ' | '.join(control.get('evidence', [])),
-                })
+        index = AssessmentIndex.of(assessment)
+        fieldnames = [
+            'framework', 'version', 'control_id', 'title', 'status',
+            'findings_count', 'evidence_count', 'findings', 'evidence',
+        ]
 
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            if rows:
-                writer = csv.DictWriter(f, fieldnames=rows[0].keys())
+            if index.controls:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
-                writer.writerows(rows)
-                print(f"✅ Controls CSV: {output_path} ({len(rows)} controls)")
+                writer.writerows({
+                    **row,
+                    'findings': ' | '.join(row['findings']),
+                    'evidence': ' | '.join(row['evidence']),
+                } for row in index.control_rows())
+                print(f"✅ Controls CSV: {output_path} ({len(index.controls)} controls)")
+                profiling.annotate(table='controls', rows=len(index.controls))
             else:
                 print(f"⚠️  No controls found to write to CSV")
+        profiling.wrote(output_path)
 
-    def generate_findings_csv(self, response: Dict, output_path: Path):
+    @profiling.traced()
+    def generate_findings_csv(self, assessment: Union[AssessmentIndex, Dict], output_path: Path):
         """Generate CSV report for individual findings"""
         print(f"\n📝 Generating Findings CSV...")
 
-        assessment = response.get('assessment', {})
-        frameworks = ['nist_800_53', 'nist_800_171', 'nist_800_172', 'cmmc', 'fips_140_2', 'fips_140_3']
-
-        rows = []
-        for fw_key in frameworks:
-            if fw_key not in assessment:
-                continue
-
-            fw_data = assessment[fw_key]
-            framework_name = fw_key.upper().replace('_', ' ')
-            version = fw_data.get('version', 'Unknown')
-            controls = fw_data.get('controls', [])
-
-            for control in controls:
-                control_id = control.get('control_id', 'N/A')
-                title = control.get('title', 'N/A')
-                status = control.get('status', 'unknown')
-
-                # Add each finding as a separate row
-                findings = control.get('findings', [])
-                if findings:
-                    for finding in findings:
-                        rows.append({
-                            'framework': framework_name,
-                            'version': version,
-                            'control_id': control_id,
-                            'control_title': title,
-                            'status': status,
-                            'finding': finding,
-                            'severity': 'High' if status == 'not-satisfied' else 'Info',
-                        })
-                else:
-                    # Add row even if no findings
-                    rows.append({
-                        'framework': framework_name,
-                        'version': version,
-                        'control_id': control_id,
-                        'control_title': title,
-                        'status': status,
-                        'finding': 'No findings' if status == 'satisfied' else 'N/A',
-                        'severity': 'Info',
-                    })
+        index = AssessmentIndex.of(assessment)
+        fieldnames = [
+            'framework', 'version', 'control_id', 'control_title', 'status', 'finding', 'severity',
+        ]
 
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            if rows:
-                writer = csv.DictWriter(f, fieldnames=rows[0].keys())
+            if index.controls:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
-                writer.writerows(rows)
-                print(f"✅ Findings CSV: {output_path} ({len(rows)} findings)")
+                count = 0
+                for row in index.finding_rows():
+                    writer.writerow(row)
+                    count += 1
+                print(f"✅ Findings CSV: {output_path} ({count} findings)")
+                profiling.annotate(table='findings', rows=count)
             else:
                 print(f"⚠️  No findings to write to CSV")
+        profiling.wrote(output_path)
 
-    def generate_asset_inventory_csv(self, asset_inventory: List[Dict[str, Any]], output_path: Path):
-        """Generate CSV report for asset inventory"""
+    @profiling.traced()
+    def generate_asset_inventory_csv(self, asset_inventory: Iterable[Dict[str, Any]], output_path: Path) -> int:
+        """Generate CSV report for asset inventory
+
+        Accepts any iterable, including the iter_asset_inventory generator;
+        the header comes from the static schema registry so rows are written
+        in a single pass as they are produced. Returns the number of assets.
+        """
         print(f"\n📝 Generating Asset Inventory CSV...")
 
-        if not asset_inventory:
+        assets = iter(profiling.count_items(asset_inventory, 'assets'))
+        first = next(assets, None)
+        if first is None:
             print(f"⚠️  No assets to write to CSV")
-            return
-
-        # Get all unique keys across all assets
-        all_keys = set()
-        for asset in asset_inventory:
-            all_keys.update(asset.keys())
-
-        # Sort keys for consistent column order
-        fieldnames = sorted(all_keys)
+            return 0
 
+        count = 1
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+            writer = csv.DictWriter(f, fieldnames=asset_fieldnames(), extrasaction='ignore')
             writer.writeheader()
-            writer.writerows(asset_inventory)
-            print(f"✅ Asset Inventory CSV: {output_path} ({len(asset_inventory)} assets)")
-
-    def generate_summary_csv(self, response: Dict, asset_count: int, output_path: Path):
+            writer.writerow(_asset_csv_row(first))
+            for asset in assets:
+                writer.writerow(_asset_csv_row(asset))
+                count += 1
+            print(f"✅ Asset Inventory CSV: {output_path} ({count} assets)")
+        profiling.wrote(output_path)
+        profiling.annotate(table='assets', rows=count)
+
+        return count
+
+    @profiling.traced()
+    def generate_summary_csv(self, assessment: Union[AssessmentIndex, Dict], asset_count: int, output_path: Path):
         """Generate CSV report for compliance summary"""
         print(f"\n📝 Generating Summary CSV...")
 
-        assessment = response.get('assessment', {})
-        frameworks = ['nist_800_53', 'nist_800_171', 'nist_800_172', 'cmmc', 'fips_140_2', 'fips_140_3']
-
-        rows = []
-        for fw_key in frameworks:
-            if fw_key not in assessment:
-                continue
-
-            fw_data = assessment[fw_key]
-            framework_name = fw_key.upper().replace('_', ' ')
-            version = fw_data.get('version', 'Unknown')
-            summary = fw_data.get('summary', {})
-
-            total = summary.get('total_controls', 0)
-            satisfied = summary.get('satisfied', 0)
-            not_satisfied = summary.get('not_satisfied', 0)
-            not_applicable = summary.get('not_applicable', 0)
-            compliance_pct = (satisfied / total * 100) if total > 0 else 0
-
-            rows.append({
-                'assessment_id': response.get('id', 'N/A'),
-                'framework': framework_name,
-                'version': version,
-                'timestamp': fw_data.get('timestamp', response.get('created_at', 'N/A')),
-                'total_controls': total,
-                'satisfied': satisfied,
-                'not_satisfied': not_satisfied,
-                'not_applicable': not_applicable,
-                'compliance_percentage': f"{compliance_pct:.2f}%",
-                'total_assets': asset_count,
-            })
+        index = AssessmentIndex.of(assessment)
+        fieldnames = [
+            'assessment_id', 'framework', 'version', 'timestamp', 'total_controls', 'satisfied',
+            'not_satisfied', 'not_applicable', 'compliance_percentage', 'total_assets',
+        ]
 
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            if rows:
-                writer = csv.DictWriter(f, fieldnames=rows[0].keys())
+            if index.frameworks:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
-                writer.writerows(rows)
-                print(f"✅ Summary CSV: {output_path} ({len(rows)} frameworks)")
+                writer.writerows({
+                    **row,
+                    'compliance_percentage': f"{row['compliance_percentage']:.2f}%",
+                } for row in index.summary_rows(asset_count))
+                print(f"✅ Summary CSV: {output_path} ({len(index.frameworks)} frameworks)")
+                profiling.annotate(table='summary', rows=len(index.frameworks))
             else:
                 print(f"⚠️  No summary data to write to CSV")
+        profiling.wrote(output_path)
 
-    def print_summary(self, response: Dict, asset_count: int):
+    @profiling.traced()
+    def generate_columnar_table(
+        self,
+        label: str,
+        columns: Columns,
+        rows: Iterable[Dict[str, Any]],
+        output_path: Path,
+        output_format: str
+    ) -> int:
+        """Write one report table as Parquet or Arrow IPC; returns the row count"""
+        format_name = 'Parquet' if output_format == 'parquet' else 'Arrow'
+        print(f"\n📝 Generating {label} {format_name}...")
+        count = write_columnar(output_path, columns, rows, output_format)
+        profiling.wrote(output_path)
+        profiling.annotate(table=output_path.stem, format=output_format, rows=count)
+        print(f"✅ {label} {format_name}: {output_path} ({count} rows)")
+        return count
+
+    def print_summary(self, assessment: Union[AssessmentIndex, Dict], asset_count: int):
         """Print summary of the assessment"""
-        assessment = response.get('assessment', {})
-        frameworks = ['nist_800_53', 'nist_800_171', 'nist_800_172', 'cmmc', 'fips_140_2', 'fips_140_3']
+        index = AssessmentIndex.of(assessment)
 
         print(f"\n📊 Compliance Assessment Summary")
         print("=" * 70)
-        print(f"Assessment ID: {response.get('id', 'N/A')}")
+        print(f"Assessment ID: {index.assessment_id}")
         print(f"Total Assets:  {asset_count}")
         print("=" * 70)
 
-        for fw_key in frameworks:
-            if fw_key not in assessment:
-                continue
+        for fw in index.frameworks:
+            print(f"\n{fw['framework']} {fw['version']}")
+            print(f"  Total Controls:     {fw['total_controls']}")
+            print(f"  ✅ Satisfied:       {fw['satisfied']}")
+            print(f"  ❌ Not Satisfied:   {fw['not_satisfied']}")
+            print(f"  ⊘  Not Applicable:  {fw['not_applicable']}")
+            print(f"  Compliance Rate:    {fw['compliance_percentage']:.2f}%")
+
+        print("=" * 70)
+
+
+def record_run(
+    store: AssessmentStore,
+    assessment: AssessmentIndex,
+    assets: AssetInventory,
+    name: str,
+    state_path: Path
+) -> int:
+    """Record a run in the SQLite store; returns the asset count"""
+    print(f"\n🗄️  Recording run in SQLite...")
+    run_id, asset_count = store.record_run(assessment, assets, name, state_path)
+    print(f"✅ SQLite: {store.path} (run {run_id}, {asset_count} assets)")
+    return asset_count
+
+
+def write_asset_table(
+    generator: ComplianceCSVGenerator,
+    assets: Iterable[Dict[str, Any]],
+    output_dir: Path,
+    output_format: str = 'csv'
+) -> int:
+    """Write the asset inventory table; returns the asset count"""
+    if output_format == 'csv':
+        return generator.generate_asset_inventory_csv(assets, output_dir / 'assets.csv')
+    return generator.generate_columnar_table(
+        'Asset Inventory',
+        asset_columns(asset_fieldnames()),
+        assets,
+        output_dir / f'assets{COLUMNAR_FORMATS[output_format]}',
+        output_format
+    )
+
+
+def write_assessment_tables(
+    generator: ComplianceCSVGenerator,
+    assessment: AssessmentIndex,
+    asset_count: int,
+    output_dir: Path,
+    output_format: str = 'csv',
+    tables: Iterable[str] = ('controls', 'findings', 'summary')
+):
+    """Write the controls, findings and summary tables, or those named in ``tables``"""
+    if output_format == 'csv':
+        if 'controls' in tables:
+            generator.generate_controls_csv(assessment, output_dir / 'controls.csv')
+        if 'findings' in tables:
+            generator.generate_findings_csv(assessment, output_dir / 'findings.csv')
+        if 'summary' in tables:
+            generator.generate_summary_csv(assessment, asset_count, output_dir / 'summary.csv')
+        return
+
+    suffix = COLUMNAR_FORMATS[output_format]
+    for label, columns, rows, filename in (
+        ('Controls', CONTROLS_COLUMNS, assessment.control_rows, 'controls'),
+        ('Findings', FINDINGS_COLUMNS, assessment.finding_rows, 'findings'),
+        ('Summary', SUMMARY_COLUMNS, lambda: assessment.summary_rows(asset_count), 'summary'),
+    ):
+        if filename in tables:
+            generator.generate_columnar_table(
+                label, columns, rows(), output_dir / f'{filename}{suffix}', output_format
+            )
+
+
+@profiling.traced()
+def generate_reports(
+    generator: ComplianceCSVGenerator,
+    tfstate_path: Path,
+    output_dir: Path,
+    name: str,
+    previous_tfstate_path: Optional[Path] = None,
+    previous_response: Optional[Dict] = None,
+    output_format: str = 'csv',
+    store: Optional[AssessmentStore] = None,
+    write_files: bool = True,
+    extract_workers: int = 1
+) -> int:
+    """Run the full report pipeline for one Terraform state; returns the asset count
+
+    ``output_format`` is 'csv' or one of COLUMNAR_FORMATS; columnar files
+    hold the same tables with typed, list-valued and dictionary-encoded
+    columns. With a ``store`` the run is also recorded in the SQLite
+    database; ``write_files=False`` records it there only.
+    ``extract_workers`` > 1 extracts the asset inventory on that many processes.
+    """
+    profiling.annotate(name=name, state=str(tfstate_path))
+
+    # The state is streamed from disk by every stage, never loaded whole, and
+    # sharing one StateFile between them decodes it at most once
+    print("\n📖 Reading Terraform state...")
+    with StateFile(tfstate_path) as state:
+        print(f"✅ Terraform state found ({tfstate_path.stat().st_size} bytes, {state.encoding})")
+
+        # Analyze Terraform state, re-assessing only changed resources in delta mode
+        if previous_tfstate_path is not None:
+            with StateFile(previous_tfstate_path) as previous_state:
+                response = generator.analyze_terraform_state_delta(
+                    previous_state,
+                    state,
+                    previous_response,
+                    name=name,
+                    include_diagram=False
+                )
+        else:
+            response = generator.analyze_terraform_state(
+                state,
+                name=name,
+                include_diagram=False
+            )
+        assessment = generator.index_assessment(response)
+
+        if not write_files:
+            print("=" * 70)
+            assets = extract_asset_inventory(state, extract_workers)
+            asset_count = record_run(store, assessment, assets, name, state.path)
+            print("=" * 70)
+            generator.print_summary(assessment, asset_count)
+            return asset_count
+
+        # Create output directory
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Generate reports
+        print(f"\n💾 Generating {output_format.upper()} reports...")
+        print("=" * 70)
+
+        # Stream the asset inventory straight from the state file to disk, or
+        # keep it in the compact container when the store needs the same assets
+        if store is not None:
+            assets = extract_asset_inventory(state, extract_workers)
+        else:
+            assets = iter_asset_inventory(state, extract_workers)
+        asset_count = write_asset_table(generator, assets, output_dir, output_format)
 
-            fw_data = assessment[fw_key]
-            framework_name = fw_key.upper().replace('_', ' ')
-            version = fw_data.get('version', 'Unknown')
-            summary = fw_data.get('summary', {})
+        write_assessment_tables(generator, assessment, asset_count, output_dir, output_format)
 
-            total = summary.get('total_controls', 0)
-            satisfied = summary.get('satisfied', 0)
-            compliance_pct = (satisfied / total * 100) if total > 0 else 0
+        if store is not None:
+            record_run(store, assessment, assets, name, state.path)
 
-            print(f"\n{framework_name} {version}")
-            print(f"  Total Controls:     {total}")
-            print(f"  ✅ Satisfied:       {satisfied}")
-            print(f"  ❌ Not Satisfied:   {summary.get('not_satisfied', 0)}")
-            print(f"  ⊘  Not Applicable:  {summary.get('not_applicable', 0)}")
-            print(f"  Compliance Rate:    {compliance_pct:.2f}%")
+        print("=" * 70)
 
+        # Print summary
+        generator.print_summary(assessment, asset_count)
+
+        return asset_count
+
+
+@profiling.traced()
+def refresh_reports(
+    generator: ComplianceCSVGenerator,
+    workspace: 'WarmWorkspace',
+    output_dir: Path,
+    name: str,
+    output_format: str = 'csv',
+    store: Optional[AssessmentStore] = None,
+    write_files: bool = True
+) -> int:
+    """Watch mode pipeline: bring a warm workspace up to date and rewrite only affected tables
+
+    Returns the asset count.
+    """
+    profiling.annotate(name=name, state=str(workspace.tfstate_path))
+
+    tables = workspace.refresh(generator, name)
+    asset_count = len(workspace.inventory)
+    if not tables:
+        print("📂 Reports unchanged")
+        return asset_count
+    assessment = generator.index_assessment(workspace.response)
+
+    if write_files:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        print(f"\n💾 Regenerating {output_format.upper()} reports: {', '.join(sorted(tables))}")
         print("=" * 70)
+        if 'assets' in tables:
+            write_asset_table(generator, workspace.inventory, output_dir, output_format)
+        write_assessment_tables(generator, assessment, asset_count, output_dir, output_format, tables)
+        print("=" * 70)
+
+    if store is not None:
+        record_run(store, assessment, workspace.inventory, name, workspace.tfstate_path)
+
+    generator.print_summary(assessment, asset_count)
+    return asset_count
 
 
 def main():
@@ -409,119 +434,81 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog=__doc__
     )
-    parser.add_argument(
-        '--tfstate',
-        default='examples/fedramp-complex.tfstate.b64',
-        help='Path to base64-encoded Terraform state file'
+    cli.add_common_arguments(
+        parser,
+        output_dir='output/compliance-csv',
+        output_help='Output directory for CSV reports',
+        name='compliance-assessment',
+        watch_help='Keep running and regenerate the affected reports whenever a state file changes'
     )
     parser.add_argument(
-        '--output-dir',
-        default='output/compliance-csv',
-        help='Output directory for CSV reports'
+        '--format',
+        dest='output_format',
+        choices=['csv', *COLUMNAR_FORMATS],
+        default='csv',
+        help='Report file format; parquet and arrow write typed columnar files (requires pyarrow)'
     )
     parser.add_argument(
-        '--name',
-        default='compliance-assessment',
-        help='Name for the assessment'
+        '--sqlite-only',
+        action='store_true',
+        help='With --sqlite, record the run in the database without writing report files'
     )
 
     args = parser.parse_args()
 
-    # Get API key from environment
-    api_key = os.environ.get('NABLA_CUSTOMER_KEY')
-    if not api_key:
-        print("❌ Error: NABLA_CUSTOMER_KEY environment variable not set")
-        print("\nSet your API key:")
-        print("  export NABLA_CUSTOMER_KEY='your-api-key-here'")
-        sys.exit(1)
-
-    # Get API URL from environment or use default
-    api_url = os.environ.get('NABLA_API_URL', 'https://api.usenabla.com')
-
-    # Resolve paths
-    script_dir = Path(__file__).parent.parent
-    tfstate_path = script_dir / args.tfstate
-    output_dir = script_dir / args.output_dir
-
-    if not tfstate_path.exists():
-        print(f"❌ Error: Terraform state file not found: {tfstate_path}")
-        sys.exit(1)
-
-    print("=" * 70)
-    print("🚀 Compliance CSV Report Generator")
-    print("=" * 70)
-    print(f"API URL:          {api_url}")
-    print(f"Terraform State:  {tfstate_path}")
-    print(f"Output Directory: {output_dir}")
-    print("=" * 70)
-
-    try:
-        # Initialize generator
-        generator = ComplianceCSVGenerator(api_key, api_url)
-
-        # Read Terraform state
-        print("\n📖 Reading Terraform state...")
-        tfstate_b64 = generator.read_terraform_state_b64(tfstate_path)
-        print(f"✅ Terraform state loaded ({len(tfstate_b64)} bytes)")
-
-        # Extract asset inventory
-        print("\n📦 Extracting asset inventory...")
-        asset_inventory = generator.extract_asset_inventory(tfstate_b64)
-        print(f"✅ Found {len(asset_inventory)} assets")
-
-        # Analyze Terraform state
-        response = generator.analyze_terraform_state(
-            tfstate_b64,
-            name=args.name,
-            include_diagram=False
-        )
-
-        # Create output directory
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate CSV reports
-        print(f"\n💾 Generating CSV reports...")
-        print("=" * 70)
-
-        generator.generate_controls_csv(
-            response,
-            output_dir / 'controls.csv'
-        )
-
-        generator.generate_findings_csv(
-            response,
-            output_dir / 'findings.csv'
-        )
-
-        generator.generate_asset_inventory_csv(
-            asset_inventory,
-            output_dir / 'assets.csv'
+    cli.check_common_arguments(parser, args)
+    if args.sqlite_only and not args.sqlite:
+        parser.error('--sqlite-only requires --sqlite')
+    if args.output_format != 'csv':
+        try:
+            require_pyarrow()
+        except RuntimeError as e:
+            parser.error(str(e))
+
+    base_dir = Path(__file__).parent.parent
+
+    def generate(generator, tfstate_path, output_dir, name, store, **delta):
+        return generate_reports(
+            generator, tfstate_path, output_dir, name,
+            output_format=args.output_format,
+            store=store,
+            write_files=not args.sqlite_only,
+            extract_workers=args.extract_workers,
+            **delta
         )
 
-        generator.generate_summary_csv(
-            response,
-            len(asset_inventory),
-            output_dir / 'summary.csv'
+    def refresh(generator, workspace, output_dir, name, store):
+        return refresh_reports(
+            generator, workspace, output_dir, name,
+            output_format=args.output_format,
+            store=store,
+            write_files=not args.sqlite_only
         )
 
-        print("=" * 70)
+    def finish(output_dir: Path):
+        if args.sqlite_only:
+            print(f"\n✅ Run recorded in SQLite database: {base_dir / args.sqlite}")
+            return
 
-        # Print summary
-        generator.print_summary(response, len(asset_inventory))
-
-        print("\n✅ CSV report generation complete!")
-        print(f"\n📂 All CSV files saved to: {output_dir}")
-        print("\n📊 Generated CSV files:")
-        print(f"  • Controls:  {output_dir / 'controls.csv'}")
-        print(f"  • Findings:  {output_dir / 'findings.csv'}")
-        print(f"  • Assets:    {output_dir / 'assets.csv'}")
-        print(f"  • Summary:   {output_dir / 'summary.csv'}")
-
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+        report_type = args.output_format.upper()
+        suffix = COLUMNAR_FORMATS.get(args.output_format, '.csv')
+        print(f"\n✅ {report_type} report generation complete!")
+        print(f"\n📂 All {report_type} files saved to: {output_dir}")
+        print(f"\n📊 Generated {report_type} files:")
+        print(f"  • Controls:  {output_dir / f'controls{suffix}'}")
+        print(f"  • Findings:  {output_dir / f'findings{suffix}'}")
+        print(f"  • Assets:    {output_dir / f'assets{suffix}'}")
+        print(f"  • Summary:   {output_dir / f'summary{suffix}'}")
+
+    cli.run(
+        args,
+        base_dir,
+        'Compliance CSV Report Generator',
+        ComplianceCSVGenerator,
+        generate,
+        refresh,
+        finish=finish
+    )
 
 
 if __name__ == '__main__':
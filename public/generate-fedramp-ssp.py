@@ -10,10 +10,17 @@ This script uses the Nabla API to:
 
 Usage:
     python generate-fedramp-ssp.py [--tfstate PATH] [--output-dir PATH] [--format FORMAT]
+    python generate-fedramp-ssp.py --batch DIR|GLOB|MANIFEST [--workers N]
+    python generate-fedramp-ssp.py --extract-workers N
+    python generate-fedramp-ssp.py --sqlite DB
+    python generate-fedramp-ssp.py --profile TRACE.json [--profile-memory]
+    python generate-fedramp-ssp.py --metrics-file FILE.prom [--progress]
+    python generate-fedramp-ssp.py --watch [--debounce SECONDS] [--polling]
 
 Environment variables:
     NABLA_CUSTOMER_KEY: Customer API key (required)
     NABLA_API_URL: API endpoint (default: https://api.usenabla.com)
+    NABLA_CACHE_DIR: Response cache directory (default: ~/.cache/nabla/evidence)
 
 Examples:
     # Generate SSP from the example Terraform state
@@ -22,225 +29,78 @@ Examples:
     # Use custom Terraform state file
     python generate-fedramp-ssp.py --tfstate /path/to/terraform.tfstate.b64
 
+    # Raw and gzip-compressed states are read as they are, no base64 needed
+    python generate-fedramp-ssp.py --tfstate /path/to/terraform.tfstate.gz
+
     # Generate OSCAL format output
     python generate-fedramp-ssp.py --format oscal
-"""
 
-import os
-import sys
-import json
-import base64
-import argparse
-from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Any
+    # Write compact (non-indented) JSON documents for a very large inventory
+    python generate-fedramp-ssp.py --tfstate big.tfstate.b64 --compact
 
-# Add SDK to path
-sdk_path = Path(__file__).parent.parent / 'sdks' / 'nabla-python' / 'src'
-sys.path.insert(0, str(sdk_path))
+    # Assess every workspace state in a directory, 8 at a time
+    python generate-fedramp-ssp.py --batch states/ --workers 8
 
-from nabla_py.sdk import Nabla
-from nabla_py import models
+    # Re-assess only what changed since yesterday's state (assessment from cache)
+    python generate-fedramp-ssp.py --tfstate today.tfstate.b64 --previous-tfstate yesterday.tfstate.b64
 
+    # Also record the run in a SQLite database for cross-run queries
+    python generate-fedramp-ssp.py --sqlite assessments.db
 
-class FedRAMPSSPGenerator:
-    """Generate FedRAMP SSP and Asset Inventory from Terraform state"""
+    # Find out where a slow run spends its time (open the trace in Perfetto or chrome://tracing)
+    python generate-fedramp-ssp.py --tfstate big.tfstate.b64 --profile trace.json
 
-    def __init__(self, api_key: str, api_url: str = "https://api.usenabla.com"):
-        self.client = Nabla(
-            customer_key=api_key,
-            server_url=api_url
-        )
+    # Extract the inventory of a state with hundreds of thousands of instances on every CPU
+    python generate-fedramp-ssp.py --tfstate huge.tfstate.b64 --extract-workers 0
 
-    def read_terraform_state_b64(self, file_path: str) -> str:
-        """Read base64-encoded Terraform state file"""
-        with open(file_path, 'r') as f:
-            content = f.read().strip()
-        return content
+    # Stay running and regenerate the SSP within seconds whenever the state changes
+    python generate-fedramp-ssp.py --tfstate prod.tfstate.b64 --watch
 
-    def analyze_terraform_state(
-        self,
-        tfstate_b64: str,
-        name: str = "fedramp-production",
-        output_format: str = "json",
-        include_diagram: bool = True
-    ) -> Dict:
-        """Call Nabla API to analyze Terraform state"""
-        print(f"\n🔍 Analyzing Terraform state: {name}")
-        print("=" * 70)
-
-        # Map format string to literal format value
-        format_map = {
-            "oscal": "oscal",
-            "yaml": "yaml",
-            "json": "json",
-        }
-        format_value = format_map.get(output_format.lower(), "json")
-
-        # Make direct API call to bypass SDK validation issues
-        import urllib.request
-        import urllib.error
-        api_url = self.client.sdk_configuration.server_url
-        api_key = self.client.sdk_configuration.security.customer_key
-
-        request_data = json.dumps({
-            "name": name,
-            "format": format_value,
-            "content_base64": tfstate_b64,
-            "include_diagram": include_diagram
-        }).encode('utf-8')
-
-        req = urllib.request.Request(
-            f"{api_url}/v1/evidence/terraform",
-            data=request_data,
-            headers={
-                "X-Customer-Key": api_key,
-                "Content-Type": "application/json"
-            }
-        )
+    # Export throughput metrics to node_exporter's textfile collector and watch progress live
+    python generate-fedramp-ssp.py --metrics-file /var/lib/node_exporter/textfile/nabla.prom --progress
+"""
 
-        try:
-            with urllib.request.urlopen(req) as response:
-                response_data = json.loads(response.read().decode('utf-8'))
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode('utf-8')
-            raise Exception(f"API Error ({e.code}): {error_body}") from e
+import time
+import argparse
+from pathlib import Path
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-        print(f"✅ Assessment completed: {response_data.get('id', 'N/A')}")
-        print(f"   Status: {response_data.get('status', 'N/A')}")
-        print(f"   Created: {response_data.get('created_at', 'N/A')}")
-        print("=" * 70)
+from nabla_evidence import cli, profiling
+from nabla_evidence.artifacts import ARTIFACT_WORKERS, atomic_write, write_artifacts
+from nabla_evidence.assessment import FRAMEWORKS, AssessmentIndex
+from nabla_evidence.client import EvidenceClient
+from nabla_evidence.inventory import AssetInventory, extract_asset_inventory, json_default
+from nabla_evidence.jsonstream import write_json
+from nabla_evidence.state import StateFile
+from nabla_evidence.store import AssessmentStore
 
-        return response_data
-
-    def extract_asset_inventory(self, tfstate_b64: str) -> List[Dict[str, Any]]:
-        """Extract asset inventory from Terraform state"""
-        # Decode the base64 Terraform state
-        try:
-            tfstate_json = base64.b64decode(tfstate_b64).decode('utf-8')
-            tfstate = json.loads(tfstate_json)
-        except Exception as e:
-            print(f"⚠️  Warning: Could not parse Terraform state for inventory: {e}")
-            return []
-
-        inventory = []
-        resources = tfstate.get('resources', [])
-
-        for resource in resources:
-            resource_type = resource.get('type', 'unknown')
-            resource_name = resource.get('name', 'unknown')
-            instances = resource.get('instances', [])
-
-            for idx, instance in enumerate(instances):
-                attrs = instance.get('attributes', {})
-
-                # Extract common attributes
-                asset = {
-                    'asset_id': f"{resource_type}.{resource_name}.{idx}",
-                    'resource_type': resource_type,
-                    'resource_name': resource_name,
-                    'provider': resource.get('provider', 'unknown'),
-                }
-
-                # Add type-specific attributes
-                if resource_type.startswith('aws_'):
-                    asset.update(self._extract_aws_attributes(resource_type, attrs))
-                elif resource_type.startswith('azurerm_'):
-                    asset.update(self._extract_azure_attributes(resource_type, attrs))
-                elif resource_type.startswith('google_'):
-                    asset.update(self._extract_gcp_attributes(resource_type, attrs))
-
-                inventory.append(asset)
-
-        return inventory
-
-    def _extract_aws_attributes(self, resource_type: str, attrs: Dict) -> Dict:
-        """Extract AWS-specific attributes"""
-        common = {
-            'cloud_provider': 'AWS',
-            'id': attrs.get('id', attrs.get('arn', 'N/A')),
-            'region': attrs.get('region', attrs.get('availability_zone', 'N/A')),
-            'tags': attrs.get('tags', {}),
-        }
+if TYPE_CHECKING:
+    from nabla_evidence.watch import WarmWorkspace
 
-        if resource_type == 'aws_instance':
-            common.update({
-                'asset_type': 'EC2 Instance',
-                'instance_type': attrs.get('instance_type', 'N/A'),
-                'ami': attrs.get('ami', 'N/A'),
-                'public_ip': attrs.get('public_ip', 'N/A'),
-                'private_ip': attrs.get('private_ip', 'N/A'),
-            })
-        elif resource_type == 'aws_s3_bucket':
-            # Handle versioning (can be a list or dict in Terraform state)
-            versioning = attrs.get('versioning', [])
-            versioning_enabled = False
-            if isinstance(versioning, list) and len(versioning) > 0:
-                versioning_enabled = versioning[0].get('enabled', False)
-            elif isinstance(versioning, dict):
-                versioning_enabled = versioning.get('enabled', False)
-
-            # Handle encryption configuration (can be a list or dict)
-            encryption = attrs.get('server_side_encryption_configuration', 'N/A')
-            if isinstance(encryption, list) and len(encryption) > 0:
-                encryption = encryption[0]
-
-            common.update({
-                'asset_type': 'S3 Bucket',
-                'bucket_name': attrs.get('bucket', 'N/A'),
-                'versioning': versioning_enabled,
-                'encryption': encryption,
-            })
-        elif resource_type == 'aws_db_instance':
-            common.update({
-                'asset_type': 'RDS Database',
-                'engine': attrs.get('engine', 'N/A'),
-                'engine_version': attrs.get('engine_version', 'N/A'),
-                'instance_class': attrs.get('instance_class', 'N/A'),
-                'storage_encrypted': attrs.get('storage_encrypted', False),
-            })
-        else:
-            common['asset_type'] = resource_type
-
-        return common
-
-    def _extract_azure_attributes(self, resource_type: str, attrs: Dict) -> Dict:
-        """Extract Azure-specific attributes"""
-        return {
-            'cloud_provider': 'Azure',
-            'asset_type': resource_type,
-            'id': attrs.get('id', 'N/A'),
-            'location': attrs.get('location', 'N/A'),
-            'resource_group': attrs.get('resource_group_name', 'N/A'),
-            'tags': attrs.get('tags', {}),
-        }
 
-    def _extract_gcp_attributes(self, resource_type: str, attrs: Dict) -> Dict:
-        """Extract GCP-specific attributes"""
-        return {
-            'cloud_provider': 'GCP',
-            'asset_type': resource_type,
-            'id': attrs.get('id', 'N/A'),
-            'zone': attrs.get('zone', 'N/A'),
-            'project': attrs.get('project', 'N/A'),
-            'labels': attrs.get('labels', {}),
-        }
+class FedRAMPSSPGenerator(EvidenceClient):
+    """Generate FedRAMP SSP and Asset Inventory from Terraform state"""
 
+    @profiling.traced()
     def generate_ssp_document(
         self,
         response: Dict,
-        asset_inventory: List[Dict[str, Any]]
-    ) -> str:
-        """Generate FedRAMP SSP document from assessment"""
+        asset_inventory: Union[AssetInventory, List[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Generate FedRAMP SSP document from assessment
+
+        The document references the inventory rather than copying it;
+        ``save_artifacts`` streams it to disk.
+        """
         assessment = response.get('assessment', {})
 
         # Handle both single assessment and multi-framework responses
         # If assessment contains framework keys, extract the first one
-        frameworks = ['nist_800_53', 'nist_800_171', 'nist_800_172', 'cmmc', 'fips_140_2', 'fips_140_3']
         actual_assessment = None
         framework_name = 'Unknown'
 
-        for fw in frameworks:
+        for fw in FRAMEWORKS:
             if fw in assessment:
                 actual_assessment = assessment[fw]
                 framework_name = fw.upper().replace('_', ' ')
@@ -297,7 +157,7 @@ class FedRAMPSSPGenerator:
             }
         }
 
-        return json.dumps(ssp, indent=2, default=str)
+        return ssp
 
     def _format_controls(self, controls: List[Dict]) -> List[Dict]:
         """Format control assessments for SSP"""
@@ -312,7 +172,8 @@ class FedRAMPSSPGenerator:
             })
         return formatted
 
-    def generate_asset_inventory(self, asset_inventory: List[Dict[str, Any]]) -> str:
+    @profiling.traced()
+    def generate_asset_inventory(self, asset_inventory: Union[AssetInventory, List[Dict[str, Any]]]) -> Dict[str, Any]:
         """Generate standalone Asset Inventory document"""
         inventory_doc = {
             'asset_inventory': {
@@ -329,7 +190,7 @@ class FedRAMPSSPGenerator:
                 'assets': asset_inventory,
             }
         }
-        return json.dumps(inventory_doc, indent=2, default=str)
+        return inventory_doc
 
     def _count_by_field(self, inventory: List[Dict], field: str) -> Dict[str, int]:
         """Count assets by a specific field"""
@@ -339,14 +200,23 @@ class FedRAMPSSPGenerator:
             counts[value] = counts.get(value, 0) + 1
         return counts
 
+    @profiling.traced()
     def save_artifacts(
         self,
         response: Dict,
-        ssp_doc: str,
-        inventory_doc: str,
-        output_dir: Path
+        ssp_doc: Dict[str, Any],
+        inventory_doc: Dict[str, Any],
+        output_dir: Path,
+        indent: Optional[int] = 2,
+        artifact_workers: int = ARTIFACT_WORKERS
     ):
-        """Save all generated artifacts"""
+        """Save all generated artifacts
+
+        JSON documents are streamed to disk one control or asset at a time;
+        ``indent=None`` writes them compact. Every file is written to a
+        temporary name and renamed into place, so a crash never leaves a
+        partial artifact.
+        """
         output_dir.mkdir(parents=True, exist_ok=True)
 
         print(f"\n💾 Saving artifacts to: {output_dir}")
@@ -354,48 +224,43 @@ class FedRAMPSSPGenerator:
 
         # Save SSP document
         ssp_path = output_dir / 'fedramp-ssp.json'
-        with open(ssp_path, 'w') as f:
-            f.write(ssp_doc)
+        with atomic_write(ssp_path, encoding='utf-8') as f:
+            write_json(ssp_doc, f, indent, default=json_default)
+        profiling.wrote(ssp_path)
         print(f"✅ SSP Document: {ssp_path}")
 
         # Save Asset Inventory
         inventory_path = output_dir / 'asset-inventory.json'
-        with open(inventory_path, 'w') as f:
-            f.write(inventory_doc)
+        with atomic_write(inventory_path, encoding='utf-8') as f:
+            write_json(inventory_doc, f, indent, default=json_default)
+        profiling.wrote(inventory_path)
         print(f"✅ Asset Inventory: {inventory_path}")
 
-        # Save raw assessment
+        # Save artifacts from API response, spooled or decoded in chunks, on a thread pool
+        started = time.perf_counter()
+        writes = write_artifacts(response.get('artifacts', []), output_dir, workers=artifact_workers)
+        elapsed = time.perf_counter() - started
+        for write in writes:
+            label = 'Artifact:' if write.kind == 'artifact' else 'Diagram: '
+            if write.error is not None:
+                print(f"⚠️  Warning: Could not save {write.kind} {write.path.name}: {write.error}")
+            else:
+                rate = f", {write.throughput / 1e6:.1f} MB/s" if write.size >= 1e6 and not write.spooled else ''
+                print(f"✅ {label} {write.path} ({write.size} bytes{rate})")
+        written = [write for write in writes if write.error is None]
+        if written:
+            total = sum(write.size for write in written)
+            decoded = sum(write.size for write in written if not write.spooled)
+            rate = f" ({decoded / elapsed / 1e6:.1f} MB/s decoded)" if decoded >= 1e6 and elapsed > 0 else ''
+            print(f"📊 Artifacts: {len(written)} files, {total} bytes in {elapsed:.2f}s{rate}")
+
+        # Save raw assessment; spooled artifacts are referenced by their saved path
         assessment_path = output_dir / 'raw-assessment.json'
-        with open(assessment_path, 'w') as f:
-            json.dump(response, f, indent=2, default=str)
+        with atomic_write(assessment_path, encoding='utf-8') as f:
+            write_json(response, f, indent, default=str)
+        profiling.wrote(assessment_path)
         print(f"✅ Raw Assessment: {assessment_path}")
 
-        # Save artifacts from API response
-        artifacts = response.get('artifacts', [])
-        for idx, artifact in enumerate(artifacts):
-            filename = artifact.get('filename') or f'artifact-{idx}'
-            artifact_path = output_dir / filename
-
-            # Decode and save artifact content
-            content_base64 = artifact.get('content_base64')
-            if content_base64:
-                try:
-                    content = base64.b64decode(content_base64)
-                    with open(artifact_path, 'wb') as f:
-                        f.write(content)
-                    size_bytes = artifact.get('size_bytes', len(content))
-                    print(f"✅ Artifact: {artifact_path} ({size_bytes} bytes)")
-                except Exception as e:
-                    print(f"⚠️  Warning: Could not save artifact {filename}: {e}")
-
-            # Save diagram if present
-            diagram = artifact.get('diagram')
-            if diagram:
-                diagram_path = output_dir / f'{filename}.mmd'
-                with open(diagram_path, 'w') as f:
-                    f.write(diagram)
-                print(f"✅ Diagram: {diagram_path}")
-
         print("=" * 70)
 
     def print_summary(
@@ -407,11 +272,10 @@ class FedRAMPSSPGenerator:
         assessment = response.get('assessment', {})
 
         # Handle both single assessment and multi-framework responses
-        frameworks = ['nist_800_53', 'nist_800_171', 'nist_800_172', 'cmmc', 'fips_140_2', 'fips_140_3']
         actual_assessment = None
         framework_name = 'Unknown'
 
-        for fw in frameworks:
+        for fw in FRAMEWORKS:
             if fw in assessment:
                 actual_assessment = assessment[fw]
                 framework_name = fw.upper().replace('_', ' ')
@@ -456,21 +320,132 @@ class FedRAMPSSPGenerator:
                 print(f"  ... and {len(not_satisfied) - 10} more")
 
 
+@profiling.traced()
+def generate_ssp(
+    generator: FedRAMPSSPGenerator,
+    tfstate_path: Path,
+    output_dir: Path,
+    name: str,
+    output_format: str = 'json',
+    include_diagram: bool = True,
+    previous_tfstate_path: Optional[Path] = None,
+    previous_response: Optional[Dict] = None,
+    store: Optional[AssessmentStore] = None,
+    indent: Optional[int] = 2,
+    artifact_workers: int = ARTIFACT_WORKERS,
+    extract_workers: int = 1
+) -> int:
+    """Run the full SSP pipeline for one Terraform state; returns the asset count
+
+    With a ``store`` the run is also recorded in the SQLite database.
+    ``extract_workers`` > 1 extracts the asset inventory on that many processes.
+    """
+    profiling.annotate(name=name, state=str(tfstate_path))
+
+    # The state is streamed from disk by every stage, never loaded whole, and
+    # sharing one StateFile between them decodes it at most once
+    print("\n📖 Reading Terraform state...")
+    with StateFile(tfstate_path) as state:
+        print(f"✅ Terraform state found ({tfstate_path.stat().st_size} bytes, {state.encoding})")
+
+        # Extract asset inventory
+        print("\n📦 Extracting asset inventory...")
+        asset_inventory = extract_asset_inventory(state, extract_workers)
+        print(f"✅ Found {len(asset_inventory)} assets")
+
+        # Analyze Terraform state, re-assessing only changed resources in delta mode
+        if previous_tfstate_path is not None:
+            with StateFile(previous_tfstate_path) as previous_state:
+                response = generator.analyze_terraform_state_delta(
+                    previous_state,
+                    state,
+                    previous_response,
+                    name=name,
+                    output_format=output_format,
+                    include_diagram=include_diagram
+                )
+        else:
+            response = generator.analyze_terraform_state(
+                state,
+                name=name,
+                output_format=output_format,
+                include_diagram=include_diagram
+            )
+
+    # Generate documents
+    print("\n📝 Generating FedRAMP SSP document...")
+    ssp_doc = generator.generate_ssp_document(response, asset_inventory)
+
+    print("📝 Generating Asset Inventory document...")
+    inventory_doc = generator.generate_asset_inventory(asset_inventory)
+
+    # Save artifacts
+    generator.save_artifacts(response, ssp_doc, inventory_doc, output_dir, indent, artifact_workers)
+
+    if store is not None:
+        print("\n🗄️  Recording run in SQLite...")
+        run_id, _ = store.record_run(AssessmentIndex(response), asset_inventory, name, tfstate_path)
+        print(f"✅ SQLite: {store.path} (run {run_id})")
+
+    # Print summary
+    generator.print_summary(response, len(asset_inventory))
+
+    return len(asset_inventory)
+
+
+@profiling.traced()
+def refresh_ssp(
+    generator: FedRAMPSSPGenerator,
+    workspace: 'WarmWorkspace',
+    output_dir: Path,
+    name: str,
+    output_format: str = 'json',
+    include_diagram: bool = True,
+    store: Optional[AssessmentStore] = None,
+    indent: Optional[int] = 2,
+    artifact_workers: int = ARTIFACT_WORKERS
+) -> int:
+    """Watch mode pipeline: bring a warm workspace up to date and rewrite the SSP if it changed
+
+    Returns the asset count.
+    """
+    profiling.annotate(name=name, state=str(workspace.tfstate_path))
+
+    if not workspace.refresh(generator, name, output_format, include_diagram):
+        print("📂 SSP unchanged")
+        return len(workspace.inventory)
+
+    print("\n📝 Generating FedRAMP SSP document...")
+    ssp_doc = generator.generate_ssp_document(workspace.response, workspace.inventory)
+
+    print("📝 Generating Asset Inventory document...")
+    inventory_doc = generator.generate_asset_inventory(workspace.inventory)
+
+    generator.save_artifacts(workspace.response, ssp_doc, inventory_doc, output_dir, indent, artifact_workers)
+
+    if store is not None:
+        print("\n🗄️  Recording run in SQLite...")
+        run_id, _ = store.record_run(
+            AssessmentIndex(workspace.response), workspace.inventory, name, workspace.tfstate_path
+        )
+        print(f"✅ SQLite: {store.path} (run {run_id})")
+
+    generator.print_summary(workspace.response, len(workspace.inventory))
+    return len(workspace.inventory)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Generate FedRAMP SSP and Asset Inventory from Terraform state',
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog=__doc__
     )
-    parser.add_argument(
-        '--tfstate',
-        default='examples/fedramp-complex.tfstate.b64',
-        help='Path to base64-encoded Terraform state file'
-    )
-    parser.add_argument(
-        '--output-dir',
-        default='output/fedramp-ssp',
-        help='Output directory for generated artifacts'
+    cli.add_common_arguments(
+        parser,
+        output_dir='output/fedramp-ssp',
+        output_help='Output directory for generated artifacts',
+        name='fedramp-production',
+        watch_help='Keep running and regenerate the SSP whenever a state file changes'
     )
     parser.add_argument(
         '--format',
@@ -478,91 +453,66 @@ def main():
         default='json',
         help='Output format for assessment'
     )
-    parser.add_argument(
-        '--name',
-        default='fedramp-production',
-        help='Name for the assessment'
-    )
     parser.add_argument(
         '--no-diagram',
         action='store_true',
         help='Disable architecture diagram generation'
     )
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        help='Write the JSON documents without indentation'
+    )
+    parser.add_argument(
+        '--artifact-workers',
+        type=int,
+        default=ARTIFACT_WORKERS,
+        help='Response artifacts written to disk concurrently'
+    )
 
     args = parser.parse_args()
 
-    # Get API key from environment
-    api_key = os.environ.get('NABLA_CUSTOMER_KEY')
-    if not api_key:
-        print("❌ Error: NABLA_CUSTOMER_KEY environment variable not set")
-        print("\nSet your API key:")
-        print("  export NABLA_CUSTOMER_KEY='your-api-key-here'")
-        sys.exit(1)
-
-    # Get API URL from environment or use default
-    api_url = os.environ.get('NABLA_API_URL', 'https://api.usenabla.com')
-
-    # Resolve paths
-    script_dir = Path(__file__).parent.parent
-    tfstate_path = script_dir / args.tfstate
-    output_dir = script_dir / args.output_dir
-
-    if not tfstate_path.exists():
-        print(f"❌ Error: Terraform state file not found: {tfstate_path}")
-        sys.exit(1)
-
-    print("=" * 70)
-    print("🚀 FedRAMP SSP and Asset Inventory Generator")
-    print("=" * 70)
-    print(f"API URL:          {api_url}")
-    print(f"Terraform State:  {tfstate_path}")
-    print(f"Output Directory: {output_dir}")
-    print(f"Output Format:    {args.format}")
-    print("=" * 70)
-
-    try:
-        # Initialize generator
-        generator = FedRAMPSSPGenerator(api_key, api_url)
-
-        # Read Terraform state
-        print("\n📖 Reading Terraform state...")
-        tfstate_b64 = generator.read_terraform_state_b64(tfstate_path)
-        print(f"✅ Terraform state loaded ({len(tfstate_b64)} bytes)")
-
-        # Extract asset inventory
-        print("\n📦 Extracting asset inventory...")
-        asset_inventory = generator.extract_asset_inventory(tfstate_b64)
-        print(f"✅ Found {len(asset_inventory)} assets")
+    cli.check_common_arguments(parser, args)
+    if args.artifact_workers < 1:
+        parser.error('--artifact-workers must be at least 1')
 
-        # Analyze Terraform state
-        response = generator.analyze_terraform_state(
-            tfstate_b64,
-            name=args.name,
+    def generate(generator, tfstate_path, output_dir, name, store, **delta):
+        return generate_ssp(
+            generator, tfstate_path, output_dir, name,
             output_format=args.format,
-            include_diagram=not args.no_diagram
+            include_diagram=not args.no_diagram,
+            store=store,
+            indent=None if args.compact else 2,
+            artifact_workers=args.artifact_workers,
+            extract_workers=args.extract_workers,
+            **delta
         )
 
-        # Generate documents
-        print("\n📝 Generating FedRAMP SSP document...")
-        ssp_doc = generator.generate_ssp_document(response, asset_inventory)
-
-        print("📝 Generating Asset Inventory document...")
-        inventory_doc = generator.generate_asset_inventory(asset_inventory)
-
-        # Save artifacts
-        generator.save_artifacts(response, ssp_doc, inventory_doc, output_dir)
-
-        # Print summary
-        generator.print_summary(response, len(asset_inventory))
+    def refresh(generator, workspace, output_dir, name, store):
+        return refresh_ssp(
+            generator, workspace, output_dir, name,
+            output_format=args.format,
+            include_diagram=not args.no_diagram,
+            store=store,
+            indent=None if args.compact else 2,
+            artifact_workers=args.artifact_workers
+        )
 
+    def finish(output_dir: Path):
         print("\n✅ FedRAMP SSP and Asset Inventory generation complete!")
         print(f"\n📂 All artifacts saved to: {output_dir}")
 
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+    cli.run(
+        args,
+        Path(__file__).parent.parent,
+        'FedRAMP SSP and Asset Inventory Generator',
+        FedRAMPSSPGenerator,
+        generate,
+        refresh,
+        details=[('Output Format', args.format)],
+        outputs='artifacts',
+        finish=finish
+    )
 
 
 if __name__ == '__main__':
@@ -0,0 +1,71 @@
+"""Shared core of the Nabla evidence report generators
+
+Modules:
+    state           streaming readers for raw, gzip and base64 Terraform states
+    inventory       asset inventory extraction
+    resource_types  field-projection specs for common resource types
+    assessment      indexed view of an assessment response
+    jsonstream      streaming JSON writer for large documents
+    client          evidence API client (submission, retries, delta mode)
+    response        streaming response parsing with artifact spooling
+    transport       keep-alive HTTP connection pool
+    cache           on-disk response cache
+    delta           state diffing and delta assessment merging
+    batch           concurrent multi-workspace runs
+    artifacts       atomic, concurrent artifact writing
+    columnar        Parquet / Arrow IPC export (optional pyarrow)
+    store           SQLite store of assessment runs
+    synthetic       synthetic states and responses for benchmarks
+    bench           stage-by-stage pipeline benchmarks
+    mockserver      local stand-in for the evidence API (load testing)
+    profiling       per-stage timing spans and Chrome trace export
+    metrics         Prometheus textfile metrics and progress line
+    watch           watch mode: warm re-runs when a state file changes
+    parallel        sharded inventory extraction on a process pool
+    cli             command line and run loop shared by the generator scripts
+
+The names in ``__all__`` can be imported from the package itself; each is
+loaded from its module on first access, so ``import nabla_evidence`` does
+not pull in the HTTP stack. Run ``python -m nabla_evidence`` to check the
+import-time budget.
+"""
+
+import importlib
+
+_EXPORTS = {
+    'APIError': 'client',
+    'AmbiguousAddresses': 'delta',
+    'AssessmentIndex': 'assessment',
+    'AssessmentStore': 'store',
+    'AssetInventory': 'inventory',
+    'DEFAULT_CACHE_DIR': 'cache',
+    'EvidenceClient': 'client',
+    'HTTPTransport': 'transport',
+    'ResponseCache': 'cache',
+    'RetryPolicy': 'client',
+    'StateFile': 'state',
+    'asset_fieldnames': 'inventory',
+    'diff_states': 'delta',
+    'discover_state_files': 'batch',
+    'extract_asset_inventory': 'inventory',
+    'iter_asset_inventory': 'inventory',
+    'iter_resource_instances': 'state',
+    'iter_state_resources': 'state',
+    'json_default': 'inventory',
+    'read_response': 'response',
+    'run_batch': 'batch',
+    'write_json': 'jsonstream',
+    'write_artifacts': 'artifacts',
+    'write_columnar': 'columnar',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
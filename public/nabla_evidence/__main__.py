@@ -0,0 +1,89 @@
+"""Check the import-time budget of the evidence core
+
+Usage:
+    python -m nabla_evidence [--budget-ms MS] [--runs N] [MODULE ...]
+
+The modules are imported together in a fresh interpreter with
+``-X importtime``; their cost is everything the import adds on top of a
+bare interpreter start, best of ``--runs``. Exits non-zero when the total is
+over budget, so CI can keep the report CLIs' cold start in check.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Modules the report generators import at startup
+STARTUP_MODULES = [
+    'nabla_evidence.client',
+    'nabla_evidence.inventory',
+    'nabla_evidence.assessment',
+    'nabla_evidence.batch',
+    'nabla_evidence.cli',
+]
+
+# Budget in milliseconds for importing STARTUP_MODULES together with a warm
+# bytecode cache. The standard-library floor (json, typing, pathlib, hashlib)
+# is most of it; importing http.client, ssl or the SDK eagerly exceeds it.
+IMPORT_BUDGET_MS = 70.0
+
+
+def _importtime(code: str) -> Dict[str, int]:
+    """Cumulative microseconds of each top-level import made while running code"""
+    package_root = str(Path(__file__).resolve().parent.parent)
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [package_root, env.get('PYTHONPATH')]))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        env=env, capture_output=True, text=True, check=True
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        # Nested imports are indented below the import that triggered them
+        if not name.startswith('  '):
+            timings[name.strip()] = int(cumulative)
+    return timings
+
+
+def import_costs(modules: List[str], runs: int = 10) -> Dict[str, float]:
+    """Best-of-runs milliseconds added by importing modules together
+
+    Keys are the top-level imports the statement triggered (requested
+    modules and the standard library modules they pulled in).
+    """
+    best: Dict[str, float] = {}
+    for _ in range(runs):
+        baseline = _importtime('pass')
+        timings = _importtime('import ' + ', '.join(modules))
+        costs = {name: us / 1000 for name, us in timings.items() if name not in baseline}
+        if not best or sum(costs.values()) < sum(best.values()):
+            best = costs
+    return best
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Measure the import time of the evidence core against a budget'
+    )
+    parser.add_argument('modules', nargs='*', default=STARTUP_MODULES, help='Modules imported together')
+    parser.add_argument('--budget-ms', type=float, default=IMPORT_BUDGET_MS, help='Budget for the whole import')
+    parser.add_argument('--runs', type=int, default=10, help='Fresh interpreters to try (the best run is kept)')
+    args = parser.parse_args(argv)
+
+    costs = import_costs(args.modules, args.runs)
+    total = sum(costs.values())
+    for name, ms in sorted(costs.items(), key=lambda item: -item[1]):
+        print(f"   {name:<32} {ms:6.1f} ms")
+    ok = total <= args.budget_ms
+    print(f"{'✅' if ok else '❌'} {'total':<32} {total:6.1f} ms (budget {args.budget_ms:g} ms)")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
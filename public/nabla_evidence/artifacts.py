@@ -0,0 +1,160 @@
+"""Atomic, concurrent writing of report artifacts
+
+Every file is written to a hidden temporary file next to its destination
+and renamed over it once complete, so an interrupted run never leaves a
+half-written artifact behind. Content already spooled while the response
+was read is moved into place; inline base64 content is decoded in
+fixed-size chunks straight to disk. The artifacts of a response are written
+on a bounded thread pool.
+"""
+
+import contextlib
+import errno
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional
+
+from .profiling import span
+from .response import is_spooled
+from .state import _iter_b64_decoded
+
+# Base64 characters decoded per chunk when writing an artifact
+ARTIFACT_CHUNK_SIZE = 1 << 20
+
+# Artifacts written concurrently by default
+ARTIFACT_WORKERS = 4
+
+
+@contextlib.contextmanager
+def atomic_write(path: Path, mode: str = 'w', **kwargs) -> Iterator[IO]:
+    """Open a temporary file next to path; it replaces path only on success
+
+    The temporary file is created with ``open``, not ``mkstemp``, so the
+    result gets the usual umask permissions.
+    """
+    tmp_path = path.with_name(f'.{path.name}.{os.urandom(4).hex()}.tmp')
+    try:
+        with open(tmp_path, mode.replace('w', 'x'), **kwargs) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+class ArtifactWrite:
+    """Outcome of writing one artifact file
+
+    ``spooled`` writes only moved content decoded while the response was
+    read, so their throughput says nothing about decoding.
+    """
+
+    __slots__ = ('kind', 'path', 'spooled', 'size', 'seconds', 'error')
+
+    def __init__(self, kind: str, path: Path, spooled: bool = False):
+        self.kind = kind
+        self.path = path
+        self.spooled = spooled
+        self.size = 0
+        self.seconds = 0.0
+        self.error: Optional[Exception] = None
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second"""
+        return self.size / self.seconds if self.seconds > 0 else 0.0
+
+
+def _write_base64(path: Path, content_base64: str, chunk_size: int) -> int:
+    size = 0
+    with atomic_write(path, 'wb') as f:
+        for chunk in _iter_b64_decoded(content_base64, chunk_size):
+            f.write(chunk)
+            size += len(chunk)
+    return size
+
+
+def _copy_file(path: Path, source: str):
+    with open(source, 'rb') as src, atomic_write(path, 'wb') as dst:
+        shutil.copyfileobj(src, dst, ARTIFACT_CHUNK_SIZE)
+
+
+def _place_content(path: Path, artifact: Dict[str, Any]) -> int:
+    """Move spooled content into place; copy content saved by an earlier run"""
+    source = artifact['content_file']
+    if is_spooled(source):
+        try:
+            os.replace(source, path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # The spool is on another filesystem
+            _copy_file(path, source)
+            os.unlink(source)
+    elif not os.path.exists(path) or not os.path.samefile(source, path):
+        _copy_file(path, source)
+    artifact['content_file'] = str(path)
+    return path.stat().st_size
+
+
+def _content_error(path: Path, message: str) -> int:
+    raise ValueError(message)
+
+
+def _write_text(path: Path, text: str) -> int:
+    with atomic_write(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return path.stat().st_size
+
+
+def _run(write: ArtifactWrite, writer, *args) -> ArtifactWrite:
+    started = time.perf_counter()
+    with span('write_artifact', 'io', file=write.path.name, spooled=write.spooled) as trace:
+        try:
+            write.size = writer(write.path, *args)
+        except Exception as e:
+            write.error = e
+        trace.set(bytes_written=write.size)
+    write.seconds = time.perf_counter() - started
+    return write
+
+
+def write_artifacts(
+    artifacts: List[Dict[str, Any]],
+    output_dir: Path,
+    workers: int = ARTIFACT_WORKERS,
+    chunk_size: int = ARTIFACT_CHUNK_SIZE
+) -> List[ArtifactWrite]:
+    """Write the ``artifacts`` of an API response into output_dir
+
+    Each artifact's content (a spooled ``content_file`` or inline
+    ``content_base64``) goes to its ``filename`` and its ``diagram``, if any,
+    to ``<filename>.mmd``; a moved ``content_file`` is updated to the saved
+    path. Failures are reported on the returned writes (in artifact order)
+    rather than raised, so one bad artifact does not lose the others.
+    """
+    jobs = []
+    for idx, artifact in enumerate(artifacts):
+        filename = artifact.get('filename') or f'artifact-{idx}'
+        content_base64 = artifact.get('content_base64')
+        if artifact.get('content_file'):
+            jobs.append((ArtifactWrite('artifact', output_dir / filename, True), _place_content, artifact))
+        elif artifact.get('content_error'):
+            jobs.append((ArtifactWrite('artifact', output_dir / filename), _content_error, artifact['content_error']))
+        elif content_base64:
+            jobs.append((ArtifactWrite('artifact', output_dir / filename), _write_base64, content_base64, chunk_size))
+        diagram = artifact.get('diagram')
+        if diagram:
+            jobs.append((ArtifactWrite('diagram', output_dir / f'{filename}.mmd'), _write_text, diagram))
+    if not jobs:
+        return []
+    if len(jobs) == 1 or workers <= 1:
+        return [_run(*job) for job in jobs]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(jobs)), thread_name_prefix='artifact') as executor:
+        return list(executor.map(lambda job: _run(*job), jobs))
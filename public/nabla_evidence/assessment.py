@@ -0,0 +1,108 @@
+"""Indexed view of an evidence assessment response"""
+
+from typing import Any, Dict, Iterator, List, Union
+
+
+# Framework keys in the order they appear in reports
+FRAMEWORKS = ['nist_800_53', 'nist_800_171', 'nist_800_172', 'cmmc', 'fips_140_2', 'fips_140_3']
+
+
+class AssessmentIndex:
+    """Normalized, indexed view of an evidence response built in one pass
+
+    Every CSV writer and the console summary read from this object, so the
+    raw ``response['assessment']`` tree is traversed exactly once. Controls
+    are flattened into shared records in report order.
+    """
+
+    def __init__(self, response: Dict):
+        self.assessment_id = response.get('id', 'N/A')
+        self.created_at = response.get('created_at', 'N/A')
+        self.frameworks: List[Dict[str, Any]] = []
+        self.controls: List[Dict[str, Any]] = []
+
+        assessment = response.get('assessment', {})
+        for fw_key in FRAMEWORKS:
+            if fw_key not in assessment:
+                continue
+
+            fw_data = assessment[fw_key]
+            framework_name = fw_key.upper().replace('_', ' ')
+            version = fw_data.get('version', 'Unknown')
+            summary = fw_data.get('summary', {})
+
+            total = summary.get('total_controls', 0)
+            satisfied = summary.get('satisfied', 0)
+            self.frameworks.append({
+                'framework': framework_name,
+                'version': version,
+                'timestamp': fw_data.get('timestamp', self.created_at),
+                'total_controls': total,
+                'satisfied': satisfied,
+                'not_satisfied': summary.get('not_satisfied', 0),
+                'not_applicable': summary.get('not_applicable', 0),
+                'compliance_percentage': (satisfied / total * 100) if total > 0 else 0,
+            })
+
+            for control in fw_data.get('controls', []):
+                record = {
+                    'framework': framework_name,
+                    'version': version,
+                    'control_id': control.get('control_id', 'N/A'),
+                    'title': control.get('title', 'N/A'),
+                    'status': control.get('status', 'unknown'),
+                    'findings': control.get('findings', []),
+                    'evidence': control.get('evidence', []),
+                }
+                self.controls.append(record)
+
+    @classmethod
+    def of(cls, assessment: Union['AssessmentIndex', Dict]) -> 'AssessmentIndex':
+        """Return assessment itself if already indexed, else index the raw response"""
+        return assessment if isinstance(assessment, cls) else cls(assessment)
+
+    def control_rows(self) -> Iterator[Dict[str, Any]]:
+        """One report row per control, with findings and evidence kept as lists"""
+        for control in self.controls:
+            yield {
+                'framework': control['framework'],
+                'version': control['version'],
+                'control_id': control['control_id'],
+                'title': control['title'],
+                'status': control['status'],
+                'findings_count': len(control['findings']),
+                'evidence_count': len(control['evidence']),
+                'findings': control['findings'],
+                'evidence': control['evidence'],
+            }
+
+    def finding_rows(self) -> Iterator[Dict[str, Any]]:
+        """One report row per finding, plus a placeholder row for controls without any"""
+        for control in self.controls:
+            status = control['status']
+            row = {
+                'framework': control['framework'],
+                'version': control['version'],
+                'control_id': control['control_id'],
+                'control_title': control['title'],
+                'status': status,
+            }
+
+            # Add each finding as a separate row
+            findings = control['findings']
+            if findings:
+                severity = 'High' if status == 'not-satisfied' else 'Info'
+                for finding in findings:
+                    yield {**row, 'finding': finding, 'severity': severity}
+            else:
+                # Add row even if no findings
+                yield {**row, 'finding': 'No findings' if status == 'satisfied' else 'N/A', 'severity': 'Info'}
+
+    def summary_rows(self, asset_count: int) -> Iterator[Dict[str, Any]]:
+        """One report row per framework"""
+        for fw in self.frameworks:
+            yield {
+                **fw,
+                'assessment_id': self.assessment_id,
+                'total_assets': asset_count,
+            }
@@ -0,0 +1,163 @@
+"""Run one pipeline over many Terraform workspaces concurrently"""
+
+import contextlib
+import glob
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterator, List
+
+
+STATE_SUFFIXES = ('.tfstate.b64', '.tfstate.gz', '.b64', '.tfstate')
+
+# Files a batch directory is searched for
+STATE_PATTERNS = ('*.tfstate.b64', '*.tfstate.gz', '*.tfstate')
+
+
+def discover_state_files(source: Path) -> List[Path]:
+    """Resolve a batch source (directory, glob pattern or manifest) to state files
+
+    A directory is searched for STATE_PATTERNS files, a path containing glob
+    characters is expanded, and any other file is read as a manifest listing one
+    state path per line (blank lines and ``#`` comments are ignored).
+    """
+    if source.is_dir():
+        return sorted({path for pattern in STATE_PATTERNS for path in source.glob(pattern)})
+    if glob.has_magic(str(source)):
+        return sorted(Path(p) for p in glob.glob(str(source), recursive=True))
+    paths = []
+    with open(source, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                path = Path(line)
+                paths.append(path if path.is_absolute() else source.parent / path)
+    return paths
+
+
+def workspace_names(tfstate_paths: List[Path]) -> List[str]:
+    """Derive a unique output directory name for each state file"""
+    names = []
+    seen: Dict[str, int] = {}
+    for path in tfstate_paths:
+        name = path.name
+        for suffix in STATE_SUFFIXES:
+            if name.endswith(suffix):
+                name = name[:-len(suffix)]
+                break
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        names.append(f"{name}-{count + 1}" if count else name)
+    return names
+
+
+class WorkspaceOutput:
+    """stdout stand-in that prefixes each workspace's lines with its name
+
+    Pipelines print as they go. While several run at once, each thread's
+    output is held until a line is complete and then written as
+    ``[workspace] line`` under one lock, so lines of different workspaces
+    never interleave. Threads outside ``workspace()`` write through as is.
+    """
+
+    def __init__(self, stream: IO[str]):
+        self.stream = stream
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def workspace(self, name: str) -> Iterator[None]:
+        """Prefix what the current thread prints with ``name`` inside the block"""
+        self._local.name = name
+        self._local.pending = ''
+        try:
+            yield
+        finally:
+            if self._local.pending:
+                self.write('\n')
+            self._local.name = None
+
+    def write(self, text: str) -> int:
+        name = getattr(self._local, 'name', None)
+        if name is None:
+            with self._lock:
+                return self.stream.write(text)
+        lines = (self._local.pending + text).split('\n')
+        self._local.pending = lines.pop()
+        if lines:
+            block = ''.join(f"[{name}] {line}".rstrip() + '\n' for line in lines)
+            with self._lock:
+                self.stream.write(block)
+        return len(text)
+
+    def flush(self):
+        with self._lock:
+            self.stream.flush()
+
+    def __getattr__(self, name: str):
+        return getattr(self.stream, name)
+
+
+def run_batch(
+    job: Callable[[Path, Path, str], Any],
+    tfstate_paths: List[Path],
+    output_dir: Path,
+    workers: int
+) -> bool:
+    """Run ``job(tfstate_path, workspace_dir, workspace)`` for every state concurrently
+
+    Jobs are I/O bound (file reads and the blocking API call), so a thread
+    pool gives the concurrency without one interpreter per workspace.
+    While it runs, each line a job prints is prefixed with its workspace
+    name (see ``WorkspaceOutput``). A workspace whose state is missing or
+    unreadable fails on its own like any other. Returns True when every
+    workspace succeeded.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    names = workspace_names(tfstate_paths)
+    total_bytes = 0
+    failures = []
+
+    output = WorkspaceOutput(sys.stdout)
+
+    def run_workspace(path: Path, name: str) -> int:
+        with output.workspace(name):
+            size = path.stat().st_size
+            job(path, output_dir / name, name)
+            return size
+
+    started = time.perf_counter()
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(run_workspace, path, name): name
+                for path, name in zip(tfstate_paths, names)
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    total_bytes += future.result()
+                    print(f"✅ Workspace complete: {name}")
+                except Exception as e:
+                    failures.append((name, e))
+                    print(f"❌ Workspace failed: {name}: {e}")
+    finally:
+        sys.stdout = output.stream
+    elapsed = time.perf_counter() - started
+
+    print(f"\n📊 Batch Summary")
+    print("=" * 70)
+    print(f"Workspaces:   {len(tfstate_paths)} ({len(tfstate_paths) - len(failures)} succeeded, {len(failures)} failed)")
+    print(f"Workers:      {workers}")
+    print(f"Wall Clock:   {elapsed:.2f}s")
+    if elapsed > 0:
+        print(f"Throughput:   {len(tfstate_paths) / elapsed:.2f} workspaces/s, "
+              f"{total_bytes / elapsed / 1e6:.2f} MB/s of state")
+    for name, error in sorted(failures):
+        print(f"  • {name}: {error}")
+    print("=" * 70)
+
+    return not failures
@@ -0,0 +1,316 @@
+"""Stage-by-stage benchmarks of the report pipeline on synthetic data
+
+Usage:
+    python -m nabla_evidence.bench [--instances N ...] [--controls N] [--findings N]
+                                   [--artifacts N] [--artifact-kb KB] [--repeat N]
+                                   [--json OUT] [--baseline JSON] [--tolerance FRACTION]
+
+For each instance count a synthetic state (see ``nabla_evidence.synthetic``)
+and a synthetic assessment response are generated, then every stage of the
+CLIs runs on its own: reading and decoding the state, parsing it, extraction
+(serial, and sharded over SHARDED_WORKERS processes), each CSV report, the
+SSP documents and artifact saving. Times are the best of ``--repeat`` runs;
+peak memory is measured in one more run under tracemalloc, since tracing
+slows the code down, and counts only what the stage itself allocates (the
+parent process only, for the sharded stage). With ``--baseline``, a stage that is slower or
+larger than the baseline by more than ``--tolerance`` fails the run.
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .assessment import AssessmentIndex
+from .inventory import extract_asset_inventory
+from .profiling import format_bytes
+from .response import read_response
+from .state import STATE_CHUNK_SIZE, _read_mapped, _state_file, iter_resource_instances
+from .synthetic import parse_count, synthetic_response, write_synthetic_state
+
+# Time regressions below this many seconds are treated as noise
+MIN_SECONDS = 0.01
+
+# Peak-memory regressions below this many bytes are treated as noise
+MIN_PEAK_BYTES = 1 << 20
+
+# Processes of the sharded extraction stage
+SHARDED_WORKERS = max(2, os.cpu_count() or 1)
+
+
+def _load_script(filename: str):
+    """Import one of the hyphenated report CLIs next to the package"""
+    path = Path(__file__).resolve().parent.parent / filename
+    spec = importlib.util.spec_from_file_location(filename[:-3].replace('-', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class Workload:
+    """Inputs shared by the stages for one instance count"""
+
+    def __init__(self, work_dir: Path, instances: int, response: Dict[str, Any], seed: int):
+        self.work_dir = work_dir
+        self.instances = instances
+        self.state_path = work_dir / f'state-{instances}.tfstate.b64'
+        self.state_size = write_synthetic_state(self.state_path, instances, seed)
+        self.response_doc = response
+        self.response_body = json.dumps(response).encode('utf-8')
+        self.index = AssessmentIndex(response)
+        self.inventory = extract_asset_inventory(self.state_path)
+        self.output_dir = work_dir / f'out-{instances}'
+        self.output_dir.mkdir(exist_ok=True)
+        self._scripts: Dict[str, Any] = {}
+
+    def generator(self, filename: str, class_name: str):
+        if filename not in self._scripts:
+            self._scripts[filename] = getattr(_load_script(filename), class_name)('bench-key')
+        return self._scripts[filename]
+
+    def response(self) -> Dict[str, Any]:
+        """Parse the response body as the client does, spooling its artifacts"""
+        return read_response(self.response_chunks())
+
+    def response_chunks(self):
+        body = memoryview(self.response_body)
+        return (bytes(body[start:start + STATE_CHUNK_SIZE]) for start in range(0, len(body), STATE_CHUNK_SIZE))
+
+
+def _csv(workload: Workload):
+    return workload.generator('generate-compliance-csv.py', 'ComplianceCSVGenerator')
+
+
+def _ssp(workload: Workload):
+    return workload.generator('generate-fedramp-ssp.py', 'FedRAMPSSPGenerator')
+
+
+def _save_artifacts_args(workload: Workload) -> Tuple:
+    ssp = _ssp(workload)
+    response = workload.response()
+    return (
+        ssp, response,
+        ssp.generate_ssp_document(response, workload.inventory),
+        ssp.generate_asset_inventory(workload.inventory),
+        workload.output_dir / 'ssp',
+    )
+
+
+def _save_artifacts(ssp, response, ssp_doc, inventory_doc, output_dir: Path) -> int:
+    output_dir.mkdir(exist_ok=True)
+    ssp.save_artifacts(response, ssp_doc, inventory_doc, output_dir)
+    return sum(path.stat().st_size for path in output_dir.iterdir())
+
+
+def _read_response(workload: Workload) -> int:
+    response = workload.response()
+    # Nothing moves the spooled content into place; do not let it pile up
+    for artifact in response.get('artifacts') or []:
+        if artifact.get('content_file'):
+            os.unlink(artifact['content_file'])
+    return len(workload.response_body)
+
+
+# Stage name, unit of the item count, setup (untimed) and the timed call.
+# The call returns how many units it processed.
+Stage = Tuple[str, str, Callable[[Workload], Tuple], Callable[..., int]]
+
+STAGES: List[Stage] = [
+    ('read', 'B', lambda w: (w.state_path,),
+     lambda path: sum(len(chunk) for chunk in _read_mapped(path))),
+    ('decode', 'B', lambda w: (w.state_path,),
+     lambda path: sum(len(chunk) for chunk in _state_file(path).iter_decoded())),
+    ('parse', 'instances', lambda w: (w.state_path,),
+     lambda path: sum(1 for _ in iter_resource_instances(path))),
+    ('extract_asset_inventory', 'assets', lambda w: (w.state_path,),
+     lambda path: len(extract_asset_inventory(path))),
+    ('extract_inventory_sharded', 'assets', lambda w: (w.state_path,),
+     lambda path: len(extract_asset_inventory(path, SHARDED_WORKERS))),
+    ('read_response', 'B', lambda w: (w,), _read_response),
+    ('generate_controls_csv', 'controls', lambda w: (_csv(w), w.index, w.output_dir / 'controls.csv'),
+     lambda gen, index, path: (gen.generate_controls_csv(index, path), len(index.controls))[1]),
+    ('generate_findings_csv', 'controls', lambda w: (_csv(w), w.index, w.output_dir / 'findings.csv'),
+     lambda gen, index, path: (gen.generate_findings_csv(index, path), len(index.controls))[1]),
+    ('generate_asset_inventory_csv', 'assets', lambda w: (_csv(w), w.inventory, w.output_dir / 'assets.csv'),
+     lambda gen, inventory, path: gen.generate_asset_inventory_csv(inventory, path)),
+    ('generate_summary_csv', 'frameworks', lambda w: (_csv(w), w.index, len(w.inventory), w.output_dir / 'summary.csv'),
+     lambda gen, index, count, path: (gen.generate_summary_csv(index, count, path), len(index.frameworks))[1]),
+    ('generate_ssp_document', 'assets', lambda w: (_ssp(w), w.response_doc, w.inventory),
+     lambda gen, response, inventory: (gen.generate_ssp_document(response, inventory), len(inventory))[1]),
+    ('generate_asset_inventory', 'assets', lambda w: (_ssp(w), w.inventory),
+     lambda gen, inventory: (gen.generate_asset_inventory(inventory), len(inventory))[1]),
+    ('save_artifacts', 'B', _save_artifacts_args, _save_artifacts),
+]
+
+
+def _time_stage(stage: Stage, workload: Workload, repeat: int) -> Tuple[float, int]:
+    _, _, setup, run = stage
+    best = float('inf')
+    items = 0
+    for _ in range(repeat):
+        args = setup(workload)
+        started = time.perf_counter()
+        items = run(*args)
+        best = min(best, time.perf_counter() - started)
+        del args
+    return best, items
+
+
+def _peak_memory(stage: Stage, workload: Workload) -> int:
+    _, _, setup, run = stage
+    args = setup(workload)
+    tracemalloc.start()
+    try:
+        run(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _format_rate(items: int, unit: str, seconds: float) -> str:
+    if seconds <= 0 or not items:
+        return ''
+    rate = items / seconds
+    if unit == 'B':
+        return f'{format_bytes(rate)}/s'
+    return f'{rate:,.0f} {unit}/s'
+
+
+def run_benchmarks(
+    instance_counts: Sequence[int],
+    work_dir: Path,
+    stages: Sequence[Stage] = STAGES,
+    controls: int = 300,
+    findings: int = 3,
+    frameworks: int = 2,
+    artifacts: int = 4,
+    artifact_bytes: int = 1 << 20,
+    repeat: int = 3,
+    memory: bool = True,
+    seed: int = 0
+) -> List[Dict[str, Any]]:
+    """Run every stage for each instance count; returns one result per stage and count"""
+    response = synthetic_response(
+        controls=controls,
+        findings=findings,
+        frameworks=frameworks,
+        artifacts=artifacts,
+        artifact_bytes=artifact_bytes,
+        seed=seed
+    )
+    results = []
+    for instances in instance_counts:
+        started = time.perf_counter()
+        workload = Workload(work_dir, instances, response, seed)
+        print(f"\n📏 {instances:,} instances: state {format_bytes(workload.state_size)} base64, "
+              f"{len(workload.inventory):,} assets, response {format_bytes(len(workload.response_body))} "
+              f"(generated in {time.perf_counter() - started:.1f}s)")
+        print(f"   {'stage':<30} {'time':>9} {'peak':>10}  rate")
+        for stage in stages:
+            name, unit = stage[0], stage[1]
+            # The report CLIs print progress; keep the table readable
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                seconds, items = _time_stage(stage, workload, repeat)
+                peak = _peak_memory(stage, workload) if memory else None
+            results.append({
+                'instances': instances,
+                'stage': name,
+                'seconds': seconds,
+                'peak_bytes': peak,
+                'items': items,
+                'unit': unit,
+            })
+            peak_text = format_bytes(peak) if peak is not None else '-'
+            print(f"   {name:<30} {seconds * 1000:7.1f}ms {peak_text:>10}  {_format_rate(items, unit, seconds)}")
+    return results
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float) -> List[str]:
+    """Regressions of results against a baseline run, as messages"""
+    previous = {(entry['instances'], entry['stage']): entry for entry in baseline}
+    regressions = []
+    for entry in results:
+        base = previous.get((entry['instances'], entry['stage']))
+        if base is None:
+            continue
+        label = f"{entry['stage']} @ {entry['instances']:,}"
+        if entry['seconds'] > base['seconds'] * (1 + tolerance) and entry['seconds'] - base['seconds'] > MIN_SECONDS:
+            regressions.append(f"{label}: {base['seconds'] * 1000:.1f}ms -> {entry['seconds'] * 1000:.1f}ms")
+        if (
+            entry.get('peak_bytes') is not None and base.get('peak_bytes') is not None
+            and entry['peak_bytes'] > base['peak_bytes'] * (1 + tolerance)
+            and entry['peak_bytes'] - base['peak_bytes'] > MIN_PEAK_BYTES
+        ):
+            regressions.append(
+                f"{label}: peak {format_bytes(base['peak_bytes'])} -> {format_bytes(entry['peak_bytes'])}"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the report pipeline stage by stage on synthetic data')
+    parser.add_argument('--instances', nargs='+', type=parse_count, default=[1_000, 10_000, 100_000],
+                        help='Resource instance counts, e.g. 1k 100k 1m (default: 1k 10k 100k)')
+    parser.add_argument('--stages', nargs='+', choices=[stage[0] for stage in STAGES], help='Only run these stages')
+    parser.add_argument('--controls', type=int, default=300, help='Controls per framework')
+    parser.add_argument('--findings', type=int, default=3, help='Findings per not-satisfied control')
+    parser.add_argument('--frameworks', type=int, default=2, help='Frameworks in the response')
+    parser.add_argument('--artifacts', type=int, default=4, help='Inline artifacts in the response')
+    parser.add_argument('--artifact-kb', type=int, default=1024, help='Size of each artifact in KiB')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per stage (the best is kept)')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc peak-memory run')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for the synthetic data')
+    parser.add_argument('--work-dir', type=Path, help='Directory for states and outputs (default: a temporary one)')
+    parser.add_argument('--json', type=Path, dest='json_path', help='Write the results to this JSON file')
+    parser.add_argument('--baseline', type=Path, help='Results JSON of an earlier run to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed slowdown or memory growth over the baseline (default: 0.25)')
+    args = parser.parse_args(argv)
+
+    stages = [stage for stage in STAGES if not args.stages or stage[0] in args.stages]
+    with contextlib.ExitStack() as stack:
+        if args.work_dir:
+            args.work_dir.mkdir(parents=True, exist_ok=True)
+            work_dir = args.work_dir
+        else:
+            work_dir = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix='nabla-bench-')))
+        results = run_benchmarks(
+            args.instances,
+            work_dir,
+            stages,
+            controls=args.controls,
+            findings=args.findings,
+            frameworks=args.frameworks,
+            artifacts=args.artifacts,
+            artifact_bytes=args.artifact_kb * 1024,
+            repeat=max(1, args.repeat),
+            memory=not args.no_memory,
+            seed=args.seed
+        )
+
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump({'python': sys.version.split()[0], 'results': results}, f, indent=2)
+        print(f"\n✅ Results: {args.json_path}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline['results'], args.tolerance)
+        for message in regressions:
+            print(f"❌ {message}")
+        if regressions:
+            return 1
+        print(f"✅ No regressions over {args.baseline} (tolerance {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
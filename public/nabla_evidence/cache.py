@@ -0,0 +1,104 @@
+"""On-disk cache of evidence API responses"""
+
+import contextlib
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from .profiling import traced
+from .response import iter_chunks, read_response, write_response
+from .state import _iter_state_decoded
+
+
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'nabla' / 'evidence'
+
+
+class ResponseCache:
+    """Content-addressed on-disk cache of /v1/evidence/terraform responses
+
+    Entries are keyed by a SHA-256 of the decoded state plus the request
+    options, expire ``ttl_seconds`` after they were written, and are evicted
+    least-recently-used first once the directory grows past ``max_bytes``.
+    Recency is tracked through each entry's access time, which is bumped
+    explicitly on every hit so it does not depend on mount options.
+    Entries hold the response JSON with artifact content inline; reading one
+    back spools that content to disk again.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path = DEFAULT_CACHE_DIR,
+        max_bytes: int = 512 * 1024 * 1024,
+        ttl_seconds: float = 7 * 24 * 3600,
+        refresh: bool = False
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.refresh = refresh
+
+    @staticmethod
+    @traced('cache.key')
+    def key(tfstate: Union[str, os.PathLike], name: str, output_format: str, include_diagram: bool) -> str:
+        """Hash the decoded state and the request options into a cache key"""
+        digest = hashlib.sha256()
+        for chunk in _iter_state_decoded(tfstate):
+            digest.update(chunk)
+        digest.update(b'\0')
+        digest.update(json.dumps([name, output_format, include_diagram]).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    @traced('cache.get')
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached response for key, or None on a miss or refresh"""
+        if self.refresh:
+            return None
+        path = self._path(key)
+        try:
+            stat = path.stat()
+            if time.time() - stat.st_mtime > self.ttl_seconds:
+                path.unlink()
+                return None
+            with open(path, 'rb') as f:
+                response = read_response(iter_chunks(f))
+            os.utime(path, (time.time(), stat.st_mtime))
+        except (OSError, ValueError):
+            return None
+        return response
+
+    @traced('cache.put')
+    def put(self, key: str, response: Dict):
+        """Atomically store a response and evict entries beyond the size bound"""
+        import tempfile
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                write_response(response, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for path in self.cache_dir.glob('*.json'):
+            with contextlib.suppress(OSError):
+                stat = path.stat()
+                entries.append((stat.st_atime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            with contextlib.suppress(OSError):
+                path.unlink()
+            total -= size
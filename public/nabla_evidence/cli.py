@@ -0,0 +1,419 @@
+"""Command line shared by the report generator scripts
+
+Both scripts take the same state, batch, API, cache, watch and observability
+options and drive their pipeline the same way; only the report options and
+the pipeline itself differ. A script adds its own arguments next to
+``add_common_arguments``, validates them after ``check_common_arguments``
+and hands its pipeline to ``run``:
+
+    generate(generator, tfstate_path, output_dir, name, store,
+             previous_tfstate_path=None, previous_response=None) -> asset count
+    refresh(generator, workspace, output_dir, name, store) -> asset count
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Callable, Optional, Sequence, Tuple, Type
+
+from . import metrics, profiling
+from .cache import DEFAULT_CACHE_DIR, ResponseCache
+from .client import EvidenceClient, RetryPolicy
+
+DEFAULT_API_URL = 'https://api.usenabla.com'
+DEFAULT_TFSTATE = 'examples/fedramp-complex.tfstate.b64'
+
+# Watch mode defaults: seconds a state file must be quiet before a change is
+# reported, and seconds between checks when polling (the longest inotify wait)
+DEBOUNCE_SECONDS = 2.0
+POLL_INTERVAL = 2.0
+
+
+def add_common_arguments(
+    parser: argparse.ArgumentParser,
+    output_dir: str,
+    output_help: str,
+    name: str,
+    watch_help: str
+):
+    """Add the options every report generator takes"""
+    parser.add_argument(
+        '--tfstate',
+        default=DEFAULT_TFSTATE,
+        help='Path to the Terraform state file: raw JSON, gzip-compressed or base64-encoded'
+    )
+    parser.add_argument(
+        '--batch',
+        help='Assess many states: a directory of *.tfstate, *.tfstate.gz and *.tfstate.b64 files, '
+             'a glob pattern or a manifest file listing one state path per line'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Number of workspaces assessed concurrently in batch mode'
+    )
+    parser.add_argument(
+        '--extract-workers',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Processes extracting the asset inventory of a large state in shards '
+             '(default: 1, serial; 0 uses every CPU)'
+    )
+    parser.add_argument(
+        '--output-dir',
+        default=output_dir,
+        help=output_help
+    )
+    parser.add_argument(
+        '--name',
+        default=name,
+        help='Name for the assessment'
+    )
+    parser.add_argument(
+        '--sqlite',
+        metavar='DB',
+        help='Also record the run (assessment, controls, findings, assets, summary) in this SQLite database'
+    )
+    parser.add_argument(
+        '--previous-tfstate',
+        help='Delta mode: previous state file; only resources changed since it are re-assessed'
+    )
+    parser.add_argument(
+        '--previous-assessment',
+        help='Delta mode: raw assessment JSON for --previous-tfstate (default: look it up in the cache)'
+    )
+    parser.add_argument(
+        '--pool-size',
+        type=int,
+        default=10,
+        help='Maximum idle keep-alive connections kept in the HTTP pool'
+    )
+    parser.add_argument(
+        '--pool-per-host',
+        type=int,
+        help='Maximum concurrent connections per API host (default: --workers)'
+    )
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=300,
+        help='Per-attempt API timeout in seconds'
+    )
+    parser.add_argument(
+        '--deadline',
+        type=float,
+        default=900,
+        help='Overall time budget in seconds for one API call, including retries'
+    )
+    parser.add_argument(
+        '--max-attempts',
+        type=int,
+        default=5,
+        help='Maximum attempts per API call for 429/5xx replies and network errors'
+    )
+    parser.add_argument(
+        '--hedge',
+        action='store_true',
+        help='Send a duplicate request when a reply is slower than the observed p95 latency'
+    )
+    parser.add_argument(
+        '--hedge-after',
+        type=float,
+        help='With --hedge, fixed delay in seconds before the duplicate request (default: p95)'
+    )
+    parser.add_argument(
+        '--no-compress',
+        action='store_true',
+        help='Send the request body uncompressed instead of streaming it gzip-encoded'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always call the API and do not store responses in the cache'
+    )
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Ignore cached responses but store the fresh ones'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        default=os.environ.get('NABLA_CACHE_DIR', str(DEFAULT_CACHE_DIR)),
+        help='Directory for cached API responses'
+    )
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=168,
+        help='Hours before a cached response expires'
+    )
+    parser.add_argument(
+        '--cache-max-mb',
+        type=int,
+        default=512,
+        help='Size bound of the response cache in megabytes'
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help=watch_help
+    )
+    parser.add_argument(
+        '--debounce',
+        type=float,
+        default=DEBOUNCE_SECONDS,
+        metavar='SECONDS',
+        help='With --watch, wait until a state file has been quiet this long before re-running'
+    )
+    parser.add_argument(
+        '--poll-interval',
+        type=float,
+        default=POLL_INTERVAL,
+        metavar='SECONDS',
+        help='With --watch, seconds between checks when polling'
+    )
+    parser.add_argument(
+        '--polling',
+        action='store_true',
+        help='With --watch, poll file sizes and mtimes instead of using inotify'
+    )
+    parser.add_argument(
+        '--profile',
+        metavar='TRACE',
+        help='Write per-stage timings, memory peaks and byte counts as a Chrome trace JSON file'
+    )
+    parser.add_argument(
+        '--profile-memory',
+        action='store_true',
+        help='With --profile, also record tracemalloc peak memory per stage (slows Python code down)'
+    )
+    parser.add_argument(
+        '--metrics-file',
+        metavar='FILE',
+        help='At exit, write throughput and latency metrics to FILE in the Prometheus textfile format'
+    )
+    parser.add_argument(
+        '--progress',
+        action='store_true',
+        help='Show a live progress line with throughput on stderr'
+    )
+
+
+def check_common_arguments(parser: argparse.ArgumentParser, args: argparse.Namespace):
+    """Validate the common options; ``--extract-workers 0`` becomes the CPU count"""
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+    if args.extract_workers < 0:
+        parser.error('--extract-workers must not be negative')
+    args.extract_workers = args.extract_workers or os.cpu_count() or 1
+    if args.pool_size < 1 or (args.pool_per_host is not None and args.pool_per_host < 1):
+        parser.error('--pool-size and --pool-per-host must be at least 1')
+    if args.max_attempts < 1:
+        parser.error('--max-attempts must be at least 1')
+    if args.previous_assessment and not args.previous_tfstate:
+        parser.error('--previous-assessment requires --previous-tfstate')
+    if args.batch and args.previous_tfstate:
+        parser.error('--previous-tfstate cannot be combined with --batch')
+    if args.profile_memory and not args.profile:
+        parser.error('--profile-memory requires --profile')
+    if args.watch and args.previous_tfstate:
+        parser.error('--watch cannot be combined with --previous-tfstate')
+    if args.debounce < 0 or args.poll_interval <= 0:
+        parser.error('--debounce must not be negative and --poll-interval must be positive')
+
+
+def run(
+    args: argparse.Namespace,
+    base_dir: Path,
+    title: str,
+    generator_class: Type[EvidenceClient],
+    generate: Callable[..., int],
+    refresh: Callable[..., int],
+    details: Sequence[Tuple[str, str]] = (),
+    outputs: str = 'reports',
+    finish: Optional[Callable[[Path], None]] = None
+):
+    """Run a report generator in single-state, batch or watch mode and exit
+
+    Relative paths in ``args`` are resolved against ``base_dir``.
+    ``details`` are extra (label, value) lines for the banner, ``outputs``
+    names what a workspace directory holds, and ``finish`` reports the
+    output directory after a single-state run.
+    """
+    from .batch import discover_state_files, run_batch, workspace_names
+    from .store import AssessmentStore
+
+    # Get API key from environment
+    api_key = os.environ.get('NABLA_CUSTOMER_KEY')
+    if not api_key:
+        print("❌ Error: NABLA_CUSTOMER_KEY environment variable not set")
+        print("\nSet your API key:")
+        print("  export NABLA_CUSTOMER_KEY='your-api-key-here'")
+        sys.exit(1)
+
+    # Get API URL from environment or use default
+    api_url = os.environ.get('NABLA_API_URL', DEFAULT_API_URL)
+
+    retry_policy = RetryPolicy(
+        deadline=args.deadline,
+        attempt_timeout=args.timeout,
+        max_attempts=args.max_attempts,
+        hedge=args.hedge,
+        hedge_after=args.hedge_after
+    )
+
+    cache = None
+    if not args.no_cache:
+        cache = ResponseCache(
+            Path(args.cache_dir),
+            max_bytes=args.cache_max_mb * 1024 * 1024,
+            ttl_seconds=args.cache_ttl * 3600,
+            refresh=args.refresh
+        )
+
+    # Resolve paths
+    output_dir = base_dir / args.output_dir
+    store = AssessmentStore(base_dir / args.sqlite) if args.sqlite else None
+    if args.profile:
+        profiling.enable(base_dir / args.profile, memory=args.profile_memory)
+    if args.metrics_file or args.progress:
+        metrics.enable(
+            base_dir / args.metrics_file if args.metrics_file else None,
+            progress=args.progress,
+            labels={'name': args.name}
+        )
+
+    def banner(suffix: str, *lines: Tuple[str, str]):
+        print("=" * 70)
+        print(f"🚀 {title}{suffix}")
+        print("=" * 70)
+        for label, value in (('API URL', api_url), *lines, ('Output Directory', output_dir), *details):
+            print(f"{label + ':':<18}{value}")
+        if store is not None:
+            print(f"SQLite Database:  {store.path}")
+        print("=" * 70)
+
+    def make_generator() -> EvidenceClient:
+        return generator_class(
+            api_key,
+            api_url,
+            cache=cache,
+            compress_uploads=not args.no_compress,
+            retry_policy=retry_policy,
+            pool_size=args.pool_size,
+            max_per_host=args.pool_per_host or args.workers
+        )
+
+    if args.batch:
+        batch_source = base_dir / args.batch
+        if not batch_source.exists() and not glob.has_magic(str(batch_source)):
+            print(f"❌ Error: Batch source not found: {batch_source}")
+            sys.exit(1)
+        tfstate_paths = discover_state_files(batch_source)
+        if not tfstate_paths:
+            print(f"❌ Error: No Terraform state files found in: {batch_source}")
+            sys.exit(1)
+
+        banner(
+            ' (batch)',
+            ('Batch Source', batch_source),
+            ('Workspaces', len(tfstate_paths)),
+            ('Workers', args.workers)
+        )
+
+        generator = make_generator()
+        if args.watch:
+            from .watch import WarmWorkspace, watch
+
+            workspaces = {
+                path: (
+                    WarmWorkspace(path, args.extract_workers),
+                    output_dir / workspace,
+                    f"{args.name}-{workspace}"
+                )
+                for path, workspace in zip(tfstate_paths, workspace_names(tfstate_paths))
+            }
+
+            def refresh_workspace(path: Path):
+                workspace, workspace_dir, name = workspaces[path]
+                refresh(generator, workspace, workspace_dir, name, store)
+                metrics.flush()
+
+            sys.exit(watch(tfstate_paths, refresh_workspace, args.debounce, args.poll_interval, args.polling))
+
+        succeeded = run_batch(
+            lambda path, workspace_dir, workspace: generate(
+                generator, path, workspace_dir, f"{args.name}-{workspace}", store
+            ),
+            tfstate_paths,
+            output_dir,
+            args.workers
+        )
+        print(f"\n📂 Workspace {outputs} saved under: {output_dir}")
+        sys.exit(0 if succeeded else 1)
+
+    tfstate_path = base_dir / args.tfstate
+
+    if not tfstate_path.exists():
+        print(f"❌ Error: Terraform state file not found: {tfstate_path}")
+        sys.exit(1)
+
+    previous_tfstate_path = None
+    previous_response = None
+    if args.previous_tfstate:
+        previous_tfstate_path = base_dir / args.previous_tfstate
+        if not previous_tfstate_path.exists():
+            print(f"❌ Error: Previous Terraform state file not found: {previous_tfstate_path}")
+            sys.exit(1)
+    if args.previous_assessment:
+        previous_assessment_path = base_dir / args.previous_assessment
+        try:
+            with open(previous_assessment_path, 'r', encoding='utf-8') as f:
+                previous_response = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"❌ Error: Could not read previous assessment {previous_assessment_path}: {e}")
+            sys.exit(1)
+
+    state_lines = [('Terraform State', tfstate_path)]
+    if previous_tfstate_path is not None:
+        state_lines.append(('Previous State', previous_tfstate_path))
+    banner('', *state_lines)
+
+    try:
+        # Initialize generator
+        generator = make_generator()
+
+        if args.watch:
+            from .watch import WarmWorkspace, watch
+
+            workspace = WarmWorkspace(tfstate_path, args.extract_workers)
+
+            def refresh_state(path: Path):
+                refresh(generator, workspace, output_dir, args.name, store)
+                metrics.flush()
+
+            sys.exit(watch([tfstate_path], refresh_state, args.debounce, args.poll_interval, args.polling))
+
+        generate(
+            generator,
+            tfstate_path,
+            output_dir,
+            args.name,
+            store,
+            previous_tfstate_path=previous_tfstate_path,
+            previous_response=previous_response
+        )
+
+        if finish is not None:
+            finish(output_dir)
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
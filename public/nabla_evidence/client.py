@@ -0,0 +1,564 @@
+"""Client for the Nabla evidence API
+
+The generated SDK (``nabla_py``) and the HTTP stack are only imported when
+a call actually needs them, so importing this module stays cheap for
+runs served from the response cache or stopped by argument errors.
+"""
+
+import collections
+import json
+import os
+import random
+import sys
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from .cache import ResponseCache
+from .delta import AmbiguousAddresses, StateDelta, diff_states, merge_delta_assessment
+from .profiling import span, traced
+from .response import discard_spooled, iter_chunks, read_response
+from .state import STATE_CHUNK_SIZE, _iter_state_base64, _state_base64_size
+
+if TYPE_CHECKING:
+    from .transport import HTTPTransport, RequestBody
+
+
+# Generated Python SDK inside the repository checkout
+SDK_PATH = Path(__file__).resolve().parents[2] / 'sdks' / 'nabla-python' / 'src'
+
+# Output formats the evidence endpoint accepts; anything else falls back to json
+OUTPUT_FORMATS = ('json', 'yaml', 'oscal')
+
+
+def _format_value(output_format: str) -> str:
+    """Map a user-supplied output format to the literal API value"""
+    output_format = output_format.lower()
+    return output_format if output_format in OUTPUT_FORMATS else "json"
+
+
+# HTTP statuses that mean the server cannot take a gzip/chunked body, with why
+UPLOAD_FALLBACK_STATUSES = {
+    411: "chunked request bodies need a Content-Length",
+    415: "gzip Content-Encoding is not supported",
+}
+
+
+def iter_request_body(
+    fields: Dict[str, Any],
+    tfstate: Union[str, os.PathLike],
+    chunk_size: int = STATE_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Yield the evidence request JSON with content_base64 streamed from the state
+
+    Base64 is copied through in chunks (whitespace stripped) from a base64
+    state and encoded from the JSON of a raw or gzip state (see
+    ``StateFile``), so the body is never assembled in memory. Base64 needs
+    no JSON escaping.
+    """
+    yield _request_body_head(fields)
+    yield from _iter_state_base64(tfstate, chunk_size)
+    yield b'"}'
+
+
+def _request_body_head(fields: Dict[str, Any]) -> bytes:
+    head = json.dumps(fields)[:-1]
+    return (head + (', ' if fields else '') + '"content_base64": "').encode('utf-8')
+
+
+def request_body_size(fields: Dict[str, Any], tfstate: Union[str, os.PathLike]) -> int:
+    """Length of the iter_request_body body, for a plain (non-chunked) upload"""
+    return len(_request_body_head(fields)) + _state_base64_size(tfstate) + 2
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Gzip-compress a byte stream incrementally"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+# Statuses worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+
+class APIError(Exception):
+    """Evidence API failure carrying the HTTP status, error body and reply headers"""
+
+    def __init__(self, message: str, status: Optional[int] = None, body: str = '', headers=None):
+        super().__init__(message)
+        self.status = status
+        self.body = body
+        self.headers = headers
+
+
+class RetryPolicy:
+    """Deadline, per-attempt timeout, backoff and hedging settings for API calls
+
+    Backoff is exponential with full jitter. With ``hedge`` enabled, a second
+    identical request is started once an attempt has been outstanding for
+    ``hedge_after`` seconds, or for the observed p95 latency when that is
+    None and enough samples exist; whichever reply arrives first wins.
+    """
+
+    def __init__(
+        self,
+        deadline: float = 900.0,
+        attempt_timeout: float = 300.0,
+        max_attempts: int = 5,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        hedge: bool = False,
+        hedge_after: Optional[float] = None
+    ):
+        self.deadline = deadline
+        self.attempt_timeout = attempt_timeout
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.hedge = hedge
+        self.hedge_after = hedge_after
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential delay before retry number attempt + 1"""
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+
+
+class LatencyTracker:
+    """Sliding window of successful request latencies"""
+
+    MIN_SAMPLES = 20
+
+    def __init__(self, window: int = 200):
+        self._samples = collections.deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def p95(self) -> Optional[float]:
+        """95th percentile latency, or None until MIN_SAMPLES are recorded"""
+        with self._lock:
+            if len(self._samples) < self.MIN_SAMPLES:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+def _discard_reply(future):
+    """Drop the spooled artifacts of a hedged request that lost the race"""
+    if not future.cancelled() and future.exception() is None:
+        discard_spooled(future.result())
+
+
+def _retry_after_seconds(headers) -> Optional[float]:
+    """Parse a Retry-After header given either as seconds or as an HTTP date"""
+    value = headers.get('Retry-After') if headers is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    import email.utils
+
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class EvidenceClient:
+    """Submit Terraform states to /v1/evidence/terraform and collect assessments
+
+    Holds the credentials, response cache, connection pool and retry policy
+    shared by every report generator. Without an explicit ``transport`` a
+    pool of ``pool_size``/``max_per_host`` connections is created on first
+    use, or the process-wide pool when neither is given.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str = "https://api.usenabla.com",
+        cache: Optional[ResponseCache] = None,
+        compress_uploads: bool = True,
+        transport: Optional['HTTPTransport'] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        pool_size: Optional[int] = None,
+        max_per_host: Optional[int] = None
+    ):
+        self.api_key = api_key
+        self.api_url = api_url
+        self.cache = cache
+        self.compress_uploads = compress_uploads
+        self._transport = transport
+        self._pool_options = {
+            key: value for key, value in (('pool_size', pool_size), ('max_per_host', max_per_host))
+            if value is not None
+        }
+        self._transport_lock = threading.Lock()
+        self._compress_lock = threading.Lock()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.latency = LatencyTracker()
+        self._client = None
+
+    @property
+    def client(self):
+        """Generated SDK client, imported and constructed on first use"""
+        if self._client is None:
+            if SDK_PATH.is_dir() and str(SDK_PATH) not in sys.path:
+                sys.path.insert(0, str(SDK_PATH))
+            from nabla_py.sdk import Nabla
+
+            self._client = Nabla(
+                customer_key=self.api_key,
+                server_url=self.api_url
+            )
+        return self._client
+
+    @property
+    def transport(self) -> 'HTTPTransport':
+        """Keep-alive connection pool shared by every API call of this client"""
+        with self._transport_lock:
+            if self._transport is None:
+                from .transport import HTTPTransport, shared_transport
+
+                if self._pool_options:
+                    self._transport = HTTPTransport(**self._pool_options)
+                else:
+                    self._transport = shared_transport()
+            return self._transport
+
+    def read_terraform_state_b64(self, file_path: Union[str, os.PathLike]) -> str:
+        """Read a Terraform state file (raw, gzip or base64) as base64 text"""
+        return b''.join(_iter_state_base64(Path(file_path))).decode('ascii')
+
+    @traced()
+    def analyze_terraform_state(
+        self,
+        tfstate: Union[str, os.PathLike],
+        name: str = "compliance-assessment",
+        output_format: str = "json",
+        include_diagram: bool = False
+    ) -> Dict:
+        """Call Nabla API to analyze Terraform state
+
+        ``tfstate`` is a state path (``str`` or path-like, raw, gzip or
+        base64), a ``StateFile`` or in-memory base64 content. The request
+        body is streamed gzip-compressed with chunked transfer encoding; if
+        the server rejects that, the plain JSON body is sent.
+        """
+        print(f"\n🔍 Analyzing Terraform state: {name}")
+        print("=" * 70)
+
+        format_value = _format_value(output_format)
+
+        # Serve unchanged states from the response cache
+        cache_key, cached = self._lookup_cache(tfstate, name, format_value, include_diagram)
+        if cached is not None:
+            return cached
+
+        response_data = self._submit_state(tfstate, name, format_value, include_diagram)
+        self._complete_assessment(cache_key, response_data)
+
+        return response_data
+
+    def _lookup_cache(
+        self,
+        tfstate: Union[str, os.PathLike],
+        name: str,
+        format_value: str,
+        include_diagram: bool
+    ) -> Tuple[Optional[str], Optional[Dict]]:
+        """Return the cache key and the cached response, if any"""
+        if self.cache is None:
+            return None, None
+        cache_key = self.cache.key(tfstate, name, format_value, include_diagram)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            print(f"♻️  Using cached assessment: {cached.get('id', 'N/A')}")
+            print(f"   Status: {cached.get('status', 'N/A')}")
+            print(f"   Created: {cached.get('created_at', 'N/A')}")
+            print("=" * 70)
+        return cache_key, cached
+
+    def _complete_assessment(self, cache_key: Optional[str], response_data: Dict):
+        """Cache a finished assessment and report it"""
+        if cache_key is not None and response_data.get('status') != 'failed':
+            self.cache.put(cache_key, response_data)
+
+        print(f"✅ Assessment completed: {response_data.get('id', 'N/A')}")
+        print(f"   Status: {response_data.get('status', 'N/A')}")
+        print(f"   Created: {response_data.get('created_at', 'N/A')}")
+        print("=" * 70)
+
+    def _submit_state(
+        self,
+        tfstate: Union[str, os.PathLike],
+        name: str,
+        format_value: str,
+        include_diagram: bool
+    ) -> Dict:
+        """POST the state to the evidence endpoint and return the decoded reply
+
+        The body is streamed gzip-compressed unless the server has rejected
+        that before, in which case the plain JSON body is streamed with a
+        Content-Length instead of chunked encoding. Only a status in
+        UPLOAD_FALLBACK_STATUSES turns compression off, once per client.
+        """
+        # Make direct API call to bypass SDK validation issues
+        url = f"{self.api_url}/v1/evidence/terraform"
+        fields = {"name": name, "format": format_value, "include_diagram": include_diagram}
+
+        if self.compress_uploads:
+            try:
+                return self._request_json(
+                    "POST",
+                    url,
+                    lambda: gzip_chunks(iter_request_body(fields, tfstate)),
+                    {"Content-Encoding": "gzip"}
+                )
+            except APIError as e:
+                if e.status not in UPLOAD_FALLBACK_STATUSES:
+                    raise
+                self._disable_compression(e.status)
+
+        return self._request_json(
+            "POST",
+            url,
+            lambda: iter_request_body(fields, tfstate),
+            {"Content-Length": str(request_body_size(fields, tfstate))}
+        )
+
+    def _disable_compression(self, status: int):
+        """Send later uploads uncompressed, reporting why the first time"""
+        with self._compress_lock:
+            if not self.compress_uploads:
+                return
+            self.compress_uploads = False
+        print(f"⚠️  Compressed upload rejected ({status}: {UPLOAD_FALLBACK_STATUSES[status]}), "
+              f"sending uploads uncompressed")
+
+    def _request_json(
+        self,
+        method: str,
+        url: str,
+        data: 'RequestBody' = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Dict:
+        """Make a JSON API call with an overall deadline, retries and optional hedging
+
+        429/5xx replies and network errors (including per-attempt timeouts)
+        are retried with jittered exponential backoff, honouring Retry-After.
+        Other error statuses raise APIError immediately.
+        """
+        from .transport import TRANSPORT_ERRORS
+
+        request_headers = {
+            "X-Customer-Key": self.api_key,
+            "Content-Type": "application/json",
+            **(headers or {})
+        }
+        policy = self.retry_policy
+        deadline = time.monotonic() + policy.deadline
+        attempt = 0
+        while True:
+            timeout = min(policy.attempt_timeout, max(deadline - time.monotonic(), 0.001))
+            try:
+                return self._attempt_json(method, url, data, request_headers, timeout)
+            except APIError as e:
+                if e.status not in RETRYABLE_STATUSES:
+                    raise
+                error, reason = e, f"HTTP {e.status}"
+                delay = _retry_after_seconds(e.headers)
+                if delay is None:
+                    delay = policy.backoff(attempt)
+            except TRANSPORT_ERRORS as e:
+                error, reason = e, str(e) or type(e).__name__
+                delay = policy.backoff(attempt)
+
+            attempt += 1
+            if attempt >= policy.max_attempts:
+                raise error
+            if time.monotonic() + delay >= deadline:
+                raise APIError(
+                    f"API deadline of {policy.deadline:g}s exceeded after {attempt} attempts: {reason}"
+                ) from error
+            print(f"⚠️  Attempt {attempt} failed ({reason}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+    def _attempt_json(
+        self,
+        method: str,
+        url: str,
+        data: 'RequestBody',
+        headers: Dict[str, str],
+        timeout: float
+    ) -> Dict:
+        """One attempt, hedged with a duplicate request if it outlives hedge_after"""
+        policy = self.retry_policy
+        hedge_after = policy.hedge_after if policy.hedge_after is not None else self.latency.p95()
+        if not policy.hedge or hedge_after is None or hedge_after >= timeout:
+            return self._send_json(method, url, data, headers, timeout)
+
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            pending = {executor.submit(self._send_json, method, url, data, headers, timeout)}
+            done, _ = wait(pending, timeout=hedge_after)
+            if not done:
+                print(f"⏱️  No reply after {hedge_after:.1f}s, sending hedged request")
+                pending.add(executor.submit(self._send_json, method, url, data, headers, timeout))
+
+            error = None
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        response_data = future.result()
+                    except Exception as e:
+                        error = error or e
+                        continue
+                    for loser in (done | pending) - {future}:
+                        loser.add_done_callback(_discard_reply)
+                    return response_data
+            raise error
+        finally:
+            # The losing request finishes in the background, frees its connection
+            # and has its spooled artifacts removed
+            executor.shutdown(wait=False)
+
+    def _send_json(
+        self,
+        method: str,
+        url: str,
+        data: 'RequestBody',
+        headers: Dict[str, str],
+        timeout: float
+    ) -> Dict:
+        """Send a single request on the pooled transport and decode the reply
+
+        The reply is parsed as it streams in and inline artifact content is
+        spooled to disk (see ``read_response``). Error statuses raise
+        APIError carrying the status, body and headers.
+        """
+        started = time.monotonic()
+        with span('api.request', method=method, url=url) as request, self.transport.request(
+            method, url, body=request.count_body(data, 'request_bytes', 'upload_seconds'),
+            headers=headers, timeout=timeout
+        ) as response:
+            request.set(status=response.status)
+            if response.status >= 400:
+                payload = response.read()
+                request.set(response_bytes=len(payload))
+            else:
+                response_data = read_response(request.count_chunks(
+                    iter_chunks(response), 'response_bytes', 'download_seconds'
+                ))
+        if response.status >= 400:
+            error_body = payload.decode('utf-8', errors='replace')
+            raise APIError(
+                f"API Error ({response.status}): {error_body}", response.status, error_body, response.headers
+            )
+        self.latency.record(time.monotonic() - started)
+        return response_data
+
+    @traced()
+    def analyze_terraform_state_delta(
+        self,
+        previous_tfstate: Union[str, os.PathLike],
+        tfstate: Union[str, os.PathLike],
+        previous_response: Optional[Dict] = None,
+        name: str = "compliance-assessment",
+        output_format: str = "json",
+        include_diagram: bool = False
+    ) -> Dict:
+        """Re-assess only resources that changed since previous_tfstate
+
+        The previous assessment is taken from previous_response or, failing
+        that, from the response cache. Changed and dependent resources are
+        submitted as a reduced state and the result is merged into the
+        previous assessment. Falls back to a full assessment when no
+        previous assessment is available or a ``type.name`` address repeats
+        (e.g. across modules), since the merge matches findings by address.
+        """
+        format_value = _format_value(output_format)
+
+        if previous_response is None and self.cache is not None:
+            previous_response = self.cache.get(
+                self.cache.key(previous_tfstate, name, format_value, include_diagram)
+            )
+        if previous_response is None:
+            print("\n⚠️  No previous assessment available, running a full assessment")
+            return self.analyze_terraform_state(
+                tfstate,
+                name=name,
+                output_format=output_format,
+                include_diagram=include_diagram
+            )
+
+        print(f"\n🔀 Diffing against previous state (base assessment {previous_response.get('id', 'N/A')})")
+        try:
+            delta = diff_states(previous_tfstate, tfstate)
+        except AmbiguousAddresses as e:
+            print(f"⚠️  {e}, running a full assessment")
+            return self.analyze_terraform_state(
+                tfstate,
+                name=name,
+                output_format=output_format,
+                include_diagram=include_diagram
+            )
+        merged = self.assess_delta(
+            delta,
+            previous_response,
+            name=name,
+            output_format=output_format,
+            include_diagram=include_diagram
+        )
+
+        # Store the merged result under the new state so the next delta can build on it
+        if self.cache is not None and merged is not previous_response:
+            self.cache.put(self.cache.key(tfstate, name, format_value, include_diagram), merged)
+        return merged
+
+    def assess_delta(
+        self,
+        delta: StateDelta,
+        previous_response: Dict,
+        name: str = "compliance-assessment",
+        output_format: str = "json",
+        include_diagram: bool = False
+    ) -> Dict:
+        """Assess a delta's resources and merge the result into previous_response
+
+        Returns previous_response itself when nothing changed.
+        """
+        print(f"   Changed assets:      {len(delta.changed)}")
+        print(f"   Removed assets:      {len(delta.removed)}")
+        print(f"   Resources to assess: {len(delta.resources)}")
+
+        if delta.is_empty:
+            print("✅ No resource changes, reusing previous assessment")
+            return previous_response
+
+        delta_response = None
+        if delta.resources:
+            delta_response = self.analyze_terraform_state(
+                delta.to_state_b64(),
+                name=name,
+                output_format=output_format,
+                include_diagram=include_diagram
+            )
+        merged = merge_delta_assessment(previous_response, delta_response, delta)
+        # The merge keeps the previous artifacts; the delta run's are not needed
+        discard_spooled(delta_response, keep=merged)
+        return merged
@@ -0,0 +1,254 @@
+"""Columnar (Parquet / Arrow IPC) export of report tables
+
+pyarrow is an optional dependency, imported only when a columnar file is
+written. Columns are typed: counts are integers, findings and evidence are
+``list<string>``, tags are ``map<string, string>``, asset flags are booleans
+and the 'N/A' placeholder becomes null. Low-cardinality columns (framework,
+status, resource_type, ...) are dictionary-encoded.
+
+Rows are written in record batches, so an asset inventory streamed from
+``iter_asset_inventory`` never has to be held in memory as a whole.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+# Output format -> file suffix
+COLUMNAR_FORMATS = {
+    'parquet': '.parquet',
+    'arrow': '.arrow',
+}
+
+# Rows per record batch (and per Parquet row group)
+BATCH_ROWS = 65536
+
+# (column, kind) layouts of the report tables. Kinds:
+#   string, dictionary, int32, int64, float64, list, map
+#   bool  booleans, 'true'/'false' strings; anything else is null
+#   flag  whether a value is set at all (e.g. an encryption configuration);
+#         null when the column does not apply
+Columns = Sequence[Tuple[str, str]]
+
+CONTROLS_COLUMNS: Columns = (
+    ('framework', 'dictionary'),
+    ('version', 'dictionary'),
+    ('control_id', 'string'),
+    ('title', 'string'),
+    ('status', 'dictionary'),
+    ('findings_count', 'int32'),
+    ('evidence_count', 'int32'),
+    ('findings', 'list'),
+    ('evidence', 'list'),
+)
+
+FINDINGS_COLUMNS: Columns = (
+    ('framework', 'dictionary'),
+    ('version', 'dictionary'),
+    ('control_id', 'string'),
+    ('control_title', 'string'),
+    ('status', 'dictionary'),
+    ('finding', 'string'),
+    ('severity', 'dictionary'),
+)
+
+SUMMARY_COLUMNS: Columns = (
+    ('assessment_id', 'string'),
+    ('framework', 'dictionary'),
+    ('version', 'dictionary'),
+    ('timestamp', 'string'),
+    ('total_controls', 'int32'),
+    ('satisfied', 'int32'),
+    ('not_satisfied', 'int32'),
+    ('not_applicable', 'int32'),
+    ('compliance_percentage', 'float64'),
+    ('total_assets', 'int64'),
+)
+
+# Asset columns that are not plain strings
+ASSET_COLUMN_KINDS = {
+    'resource_type': 'dictionary',
+    'provider': 'dictionary',
+    'cloud_provider': 'dictionary',
+    'asset_type': 'dictionary',
+    'display_name': 'dictionary',
+    'region': 'dictionary',
+    'location': 'dictionary',
+    'zone': 'dictionary',
+    'project': 'dictionary',
+    'resource_group': 'dictionary',
+    'instance_type': 'dictionary',
+    'instance_class': 'dictionary',
+    'engine': 'dictionary',
+    'engine_version': 'dictionary',
+    'sku': 'dictionary',
+    'runtime': 'dictionary',
+    'tags': 'map',
+    'labels': 'map',
+    'versioning': 'bool',
+    'storage_encrypted': 'bool',
+    'publicly_accessible': 'bool',
+    'encryption': 'flag',
+}
+
+
+def asset_columns(fieldnames: Iterable[str]) -> List[Tuple[str, str]]:
+    """Column layout for the asset table with the given fields"""
+    return [(field, ASSET_COLUMN_KINDS.get(field, 'string')) for field in fieldnames]
+
+
+def require_pyarrow():
+    """Import pyarrow on first use, with an actionable error if missing"""
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as e:
+        raise RuntimeError(
+            "Columnar export requires pyarrow; install it with: pip install pyarrow"
+        ) from e
+    return pyarrow
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and value in ('N/A', ''))
+
+
+def _text(value: Any) -> Any:
+    if _is_missing(value):
+        return None
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return str(value)
+
+
+def _bool(value: Any) -> Any:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.lower() in ('true', 'false'):
+        return value.lower() == 'true'
+    return None
+
+
+def _flag(value: Any) -> Any:
+    if value is None:
+        return None
+    return not _is_missing(value) and bool(value)
+
+
+def _number(cast):
+    def convert(value: Any) -> Any:
+        return None if _is_missing(value) else cast(value)
+    return convert
+
+
+def _string_list(value: Any) -> Any:
+    if value is None:
+        return None
+    if not isinstance(value, (list, tuple)):
+        value = [value]
+    return [item if isinstance(item, str) else json.dumps(item) for item in value]
+
+
+def _string_map(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return None
+    return [(str(key), item if isinstance(item, str) else json.dumps(item)) for key, item in value.items()]
+
+
+_CONVERTERS = {
+    'string': _text,
+    'bool': _bool,
+    'flag': _flag,
+    'int32': _number(int),
+    'int64': _number(int),
+    'float64': _number(float),
+    'list': _string_list,
+    'map': _string_map,
+}
+
+
+def _arrow_type(pa, kind: str):
+    return {
+        'string': pa.string(),
+        'dictionary': pa.dictionary(pa.int32(), pa.string()),
+        'bool': pa.bool_(),
+        'flag': pa.bool_(),
+        'int32': pa.int32(),
+        'int64': pa.int64(),
+        'float64': pa.float64(),
+        'list': pa.list_(pa.string()),
+        'map': pa.map_(pa.string(), pa.string()),
+    }[kind]
+
+
+def write_columnar(
+    path: Path,
+    columns: Columns,
+    rows: Iterable[Dict[str, Any]],
+    output_format: str = 'parquet'
+) -> int:
+    """Write rows to a Parquet or Arrow IPC file; returns the row count
+
+    ``rows`` are mappings keyed by column name (missing keys are null).
+    Dictionary columns keep one append-only vocabulary for the whole file,
+    so every batch extends the previous dictionary; Arrow IPC files store
+    that as dictionary deltas and readers see a single dictionary.
+    """
+    if output_format not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unknown columnar format {output_format!r}; expected one of {sorted(COLUMNAR_FORMATS)}")
+    pa = require_pyarrow()
+
+    names = [name for name, _ in columns]
+    kinds = [kind for _, kind in columns]
+    schema = pa.schema([(name, _arrow_type(pa, kind)) for name, kind in columns])
+    converters = [_CONVERTERS.get(kind) for kind in kinds]
+    vocabularies: List[Dict[str, int]] = [{} for _ in columns]
+    buffers: List[List[Any]] = [[] for _ in columns]
+
+    if output_format == 'parquet':
+        writer = pa.parquet.ParquetWriter(str(path), schema, compression='zstd')
+    else:
+        writer = pa.ipc.new_file(
+            str(path), schema,
+            options=pa.ipc.IpcWriteOptions(compression='zstd', emit_dictionary_deltas=True)
+        )
+
+    def flush():
+        arrays = []
+        for kind, vocabulary, values in zip(kinds, vocabularies, buffers):
+            if kind == 'dictionary':
+                arrays.append(pa.DictionaryArray.from_arrays(
+                    pa.array(values, pa.int32()),
+                    pa.array(list(vocabulary), pa.string())
+                ))
+            else:
+                arrays.append(pa.array(values, _arrow_type(pa, kind)))
+            values.clear()
+        writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+
+    count = 0
+    pending = 0
+    try:
+        for row in rows:
+            for name, kind, convert, vocabulary, values in zip(names, kinds, converters, vocabularies, buffers):
+                value = row.get(name)
+                if kind == 'dictionary':
+                    value = _text(value)
+                    if value is not None:
+                        value = vocabulary.setdefault(value, len(vocabulary))
+                else:
+                    value = convert(value)
+                values.append(value)
+            count += 1
+            pending += 1
+            if pending == BATCH_ROWS:
+                flush()
+                pending = 0
+        if pending:
+            flush()
+    finally:
+        writer.close()
+    return count
@@ -0,0 +1,261 @@
+"""Delta assessments: diff two Terraform states and merge partial results"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Mapping, Optional, Union
+
+from .profiling import traced
+from .state import iter_resource_instances, iter_state_resources
+
+
+def _resource_address(resource: Dict[str, Any]) -> str:
+    """Address in the asset_id scheme (``type.name``, module path ignored)"""
+    return f"{resource.get('type', 'unknown')}.{resource.get('name', 'unknown')}"
+
+
+def _dependency_address(dependency: str) -> str:
+    """Normalize a state dependency such as ``module.net.aws_vpc.main`` to ``aws_vpc.main``"""
+    return '.'.join(dependency.split('[', 1)[0].split('.')[-2:])
+
+
+def _instance_digest(instance: Dict[str, Any]) -> str:
+    encoded = json.dumps(instance, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.blake2b(encoded.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class AmbiguousAddresses(Exception):
+    """Two resources share a ``type.name`` address (e.g. in different modules)
+
+    asset_ids ignore the module path, so such a state cannot be diffed or
+    merged by address; assess it in full instead.
+    """
+
+
+def _ambiguous(address: str) -> AmbiguousAddresses:
+    return AmbiguousAddresses(f"{address} occurs more than once in the state")
+
+
+def state_fingerprints(source: Union[str, os.PathLike]) -> Dict[str, str]:
+    """Map every asset_id (``type.name.idx``) in a state to a digest of its instance
+
+    Raises AmbiguousAddresses when an asset_id occurs more than once.
+    """
+    fingerprints = {}
+    for resource, idx, instance in iter_resource_instances(source):
+        asset_id = f"{_resource_address(resource)}.{idx}"
+        if asset_id in fingerprints:
+            raise _ambiguous(asset_id.rsplit('.', 1)[0])
+        fingerprints[asset_id] = _instance_digest(instance)
+    return fingerprints
+
+
+class StateDelta:
+    """Resources that differ between two Terraform states"""
+
+    def __init__(self):
+        self.header: Dict[str, Any] = {}
+        # asset_ids added or modified, and asset_ids no longer present
+        self.changed: List[str] = []
+        self.removed: List[str] = []
+        # Whole resources to re-assess: changed ones plus their dependents
+        self.resources: List[Dict[str, Any]] = []
+        # type.name addresses whose previous findings are stale
+        self.touched: set = set()
+        # type.name address of every resource in the current state, in order
+        self.order: List[str] = []
+        # state_fingerprints of the current state, when asked for
+        self.fingerprints: Optional[Dict[str, str]] = None
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.changed and not self.removed
+
+    def to_state_b64(self) -> str:
+        """Encode the resources to re-assess as a standalone base64 state"""
+        state = dict(self.header)
+        state['resources'] = self.resources
+        return base64.b64encode(json.dumps(state).encode('utf-8')).decode('ascii')
+
+
+@traced()
+def diff_states(
+    previous: Union[str, os.PathLike, Mapping[str, str]],
+    current: Union[str, os.PathLike],
+    keep_fingerprints: bool = False
+) -> StateDelta:
+    """Diff two states (paths or base64 content) by asset_id, streaming both
+
+    ``previous`` may also be the ``state_fingerprints`` of the previous
+    state, so a long-running caller need not keep the old file around;
+    ``keep_fingerprints`` stores the current state's on the delta for the
+    next diff. Only instance digests and dependency addresses are kept for
+    unchanged resources, so memory scales with churn rather than state size.
+    Raises AmbiguousAddresses when a ``type.name`` address occurs more than
+    once in either state.
+    """
+    if isinstance(previous, Mapping):
+        previous_digests = dict(previous)
+    else:
+        previous_digests = state_fingerprints(previous)
+    delta = StateDelta()
+    fingerprints = {} if keep_fingerprints else None
+
+    order = delta.order
+    seen = set()
+    selected: Dict[str, Dict[str, Any]] = {}
+    dependencies: Dict[str, set] = {}
+    for resource in iter_state_resources(current, delta.header):
+        address = _resource_address(resource)
+        if address in seen:
+            raise _ambiguous(address)
+        seen.add(address)
+        order.append(address)
+        resource_deps = set()
+        for idx, instance in enumerate(resource.get('instances', [])):
+            asset_id = f"{address}.{idx}"
+            digest = _instance_digest(instance)
+            if fingerprints is not None:
+                fingerprints[asset_id] = digest
+            if previous_digests.pop(asset_id, None) != digest:
+                delta.changed.append(asset_id)
+                selected[address] = resource
+            resource_deps.update(_dependency_address(dep) for dep in instance.get('dependencies', []))
+        if resource_deps:
+            dependencies[address] = resource_deps
+
+    delta.removed = sorted(previous_digests)
+    delta.fingerprints = fingerprints
+    delta.touched = set(selected) | {asset_id.rsplit('.', 1)[0] for asset_id in delta.removed}
+
+    # Unchanged resources that depend on a changed or removed one are re-assessed too
+    affected = {
+        address for address, deps in dependencies.items()
+        if address not in selected and deps & delta.touched
+    }
+    if affected:
+        for resource in iter_state_resources(current):
+            address = _resource_address(resource)
+            if address in affected:
+                selected[address] = resource
+        delta.touched |= affected
+
+    delta.resources = [selected[address] for address in order if address in selected]
+    return delta
+
+
+# Precedence used when combining control statuses from two assessments
+STATUS_RANK = {'not-satisfied': 2, 'satisfied': 1, 'not-applicable': 0}
+
+
+def _summarize_controls(controls: List[Dict]) -> Dict[str, int]:
+    statuses = [control.get('status') for control in controls]
+    return {
+        'total_controls': len(controls),
+        'satisfied': statuses.count('satisfied'),
+        'not_satisfied': statuses.count('not-satisfied'),
+        'not_applicable': statuses.count('not-applicable'),
+    }
+
+
+def _merge_control(previous: Dict, fresh: Optional[Dict], touches: Callable[[str], bool]) -> Dict:
+    findings = [f for f in previous.get('findings', []) if not touches(f)]
+    evidence = [e for e in previous.get('evidence', []) if not touches(e)]
+    status = previous.get('status', 'unknown')
+    if status == 'not-satisfied' and previous.get('findings') and not findings:
+        # Every finding concerned a resource that was re-assessed or removed
+        status = 'satisfied'
+    if fresh is not None:
+        # The delta run only saw touched resources; anything else it reports
+        # (such as a resource being absent) is an artifact of the partial state
+        fresh_findings = [f for f in fresh.get('findings', []) if touches(f)]
+        fresh_evidence = [e for e in fresh.get('evidence', []) if touches(e)]
+        findings.extend(f for f in fresh_findings if f not in findings)
+        evidence.extend(e for e in fresh_evidence if e not in evidence)
+        fresh_status = fresh.get('status', 'unknown')
+        if fresh_status == 'not-satisfied':
+            relevant = bool(fresh_findings)
+        else:
+            relevant = bool(fresh_findings or fresh_evidence)
+        if relevant and STATUS_RANK.get(fresh_status, -1) > STATUS_RANK.get(status, -1):
+            status = fresh_status
+    merged = dict(previous)
+    merged.update(status=status, findings=findings, evidence=evidence)
+    return merged
+
+
+def _merge_framework(previous: Dict, fresh: Dict, touches: Callable[[str], bool]) -> Dict:
+    fresh_controls = {control.get('control_id'): control for control in fresh.get('controls', [])}
+    controls = [
+        _merge_control(control, fresh_controls.pop(control.get('control_id'), None), touches)
+        for control in previous.get('controls', [])
+    ]
+    # Controls the previous run did not report count only for touched resources
+    for control in fresh_controls.values():
+        empty = dict(control, status='not-applicable', findings=[], evidence=[])
+        controls.append(_merge_control(empty, control, touches))
+
+    merged = dict(previous)
+    merged.update({key: value for key, value in fresh.items() if key not in ('controls', 'summary')})
+    merged['controls'] = controls
+    merged['summary'] = _summarize_controls(controls)
+    return merged
+
+
+@traced()
+def merge_delta_assessment(
+    previous: Dict,
+    delta_response: Optional[Dict],
+    delta: StateDelta
+) -> Dict:
+    """Fold a delta assessment into the previous full assessment
+
+    Findings and evidence from the previous run that mention a touched
+    resource address are dropped and replaced by the delta run's results.
+    Only delta results that mention a touched address are taken, since the
+    delta run did not see the rest of the state: a control keeps its
+    previous status unless such a result says otherwise, and is
+    not-satisfied if either side still reports a finding. Summaries are
+    recomputed from the merged controls. Artifacts are carried over from the
+    previous assessment since the delta run only saw a subset of the state.
+    """
+    pattern = None
+    if delta.touched:
+        addresses = sorted(delta.touched, key=len, reverse=True)
+        pattern = re.compile(r'(?<![\w-])(?:' + '|'.join(map(re.escape, addresses)) + r')(?![\w-])')
+
+    def touches(text: Any) -> bool:
+        return pattern is not None and isinstance(text, str) and pattern.search(text) is not None
+
+    previous_assessment = previous.get('assessment', {})
+    fresh_assessment = (delta_response or {}).get('assessment', {})
+
+    if 'controls' in previous_assessment:
+        # Single-framework response
+        assessment = _merge_framework(previous_assessment, fresh_assessment, touches)
+    else:
+        assessment = {}
+        for fw_key in list(previous_assessment) + [k for k in fresh_assessment if k not in previous_assessment]:
+            previous_fw = previous_assessment.get(fw_key)
+            fresh_fw = fresh_assessment.get(fw_key)
+            if isinstance(previous_fw, dict) and 'controls' in previous_fw:
+                assessment[fw_key] = _merge_framework(previous_fw, fresh_fw or {}, touches)
+            else:
+                assessment[fw_key] = previous_fw if fresh_fw is None else fresh_fw
+
+    merged = dict(previous)
+    if delta_response:
+        merged.update({key: value for key, value in delta_response.items() if key not in ('assessment', 'artifacts')})
+    else:
+        merged['created_at'] = datetime.now().isoformat()
+    merged['assessment'] = assessment
+    merged['delta'] = {
+        'base_assessment_id': previous.get('id', 'N/A'),
+        'changed_assets': len(delta.changed),
+        'removed_assets': len(delta.removed),
+        'submitted_resources': len(delta.resources),
+    }
+    return merged
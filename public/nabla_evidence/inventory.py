@@ -0,0 +1,400 @@
+"""Asset inventory extraction from Terraform state
+
+Assets keep structured attribute values (tags and labels as dicts, the raw
+encryption configuration); tabular writers flatten them as they need.
+
+Columns come from the field-projection specs in ``resource_types``. Each
+resource type is compiled once into a tuple of steps, so extracting an
+instance costs one dict lookup however many types are registered.
+
+``iter_asset_inventory`` streams plain dicts. ``extract_asset_inventory``
+keeps the whole inventory in an ``AssetInventory``: read-only records that
+share one field tuple per asset shape, interned repeated strings and one
+``SharedTags`` per distinct tag set. Serialize it with ``json_default``.
+Records and tag sets pickle compactly, so ``parallel`` can build shards of
+an inventory in worker processes and ``AssetInventory.extend`` join them.
+"""
+
+import json
+import os
+import sys
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
+
+from .profiling import span
+from .resource_types import ASSET_TYPES, PROVIDERS, RESOURCE_TYPES
+from .state import iter_resource_instances
+
+
+ASSET_BASE_FIELDS = ('asset_id', 'resource_type', 'resource_name', 'provider')
+
+# Every column a resource type spec may project into. Specs share this
+# vocabulary (an EBS volume's ``encrypted`` lands in ``storage_encrypted``, a
+# GCE machine type in ``instance_type``) so the tabular header stays the same
+# size however many types are registered.
+ASSET_COLUMNS = frozenset((
+    'cloud_provider', 'asset_type', 'display_name', 'id', 'tags', 'labels',
+    'region', 'location', 'resource_group', 'zone', 'project',
+    'name', 'instance_type', 'instance_class', 'ami', 'sku', 'version', 'runtime',
+    'engine', 'engine_version', 'endpoint', 'public_ip', 'private_ip', 'publicly_accessible',
+    'network', 'vpc_id', 'subnet_id', 'cidr_block',
+    'bucket_name', 'versioning', 'encryption', 'storage_encrypted', 'kms_key',
+))
+
+# Value of a column whose attribute is absent; anything not listed is 'N/A'
+COLUMN_DEFAULTS: Dict[str, Any] = {
+    'tags': {},
+    'labels': {},
+    'versioning': False,
+    'storage_encrypted': False,
+}
+
+# Columns whose values repeat across instances (provider addresses, regions,
+# sizes); AssetInventory interns them so the inventory holds one copy each
+INTERNED_COLUMNS = frozenset((
+    'resource_type', 'resource_name', 'provider',
+    'region', 'location', 'resource_group', 'zone', 'project',
+    'instance_type', 'instance_class', 'ami', 'sku', 'version', 'runtime',
+    'engine', 'engine_version', 'network', 'vpc_id', 'subnet_id',
+))
+
+# Columns holding tag dicts, pooled by AssetInventory as SharedTags
+SHARED_TAG_COLUMNS = frozenset(('tags', 'labels'))
+
+# (column, key, default) steps applied to each asset as
+# ``asset[column] = attrs.get(key, default)``, keyed by exact resource type.
+# Constants use a key no state contains; nested paths use a _Projection as
+# both key and default, and alternatives one as the default, resolved when
+# the lookup returns it.
+# Filled on first use of a type so import stays cheap; types without a spec
+# get their provider's columns, memoized under their own key.
+_Step = Tuple[str, Any, Any]
+_EXTRACTORS: Dict[str, Tuple[_Step, ...]] = {}
+
+_CONSTANT = object()
+_MISSING = object()
+
+
+class _Projection:
+    """Attribute lookup that a plain ``attrs.get`` cannot express"""
+
+    __slots__ = ('paths', 'default')
+
+    def __init__(self, paths: List[Tuple[str, ...]], default: Any):
+        self.paths = paths
+        self.default = default
+
+    def resolve(self, attrs: Dict) -> Any:
+        for path in self.paths:
+            value = _resolve(attrs, path)
+            if value is not _MISSING:
+                return value
+        # A fresh dict per asset, as callers may mutate tags
+        return dict(self.default) if isinstance(self.default, dict) else self.default
+
+
+def _parse_fields(fields: str) -> List[Tuple[str, str]]:
+    """Split a ``column=path`` spec into (column, path) pairs"""
+    pairs = []
+    for token in fields.split():
+        column, _, path = token.partition('=')
+        if column not in ASSET_COLUMNS:
+            raise ValueError(f"Unknown asset column {column!r} in resource type spec")
+        pairs.append((column, path or column))
+    return pairs
+
+
+def _resolve(attrs: Dict, path: Tuple[str, ...]) -> Any:
+    """Follow a dotted path through nested blocks, or return _MISSING"""
+    value: Any = attrs
+    for segment in path:
+        if segment.isdigit():
+            if isinstance(value, list):
+                index = int(segment)
+                if index >= len(value):
+                    return _MISSING
+                value = value[index]
+            continue
+        if isinstance(value, list):
+            if not value:
+                return _MISSING
+            value = value[0]
+        if not isinstance(value, dict) or segment not in value:
+            return _MISSING
+        value = value[segment]
+    return value
+
+
+def _compile_step(column: str, path: str) -> _Step:
+    """Turn one projection into a (column, key, default) step
+
+    A leading top-level key stays a plain lookup; only the remaining
+    alternatives, or a dict default that must not be shared, fall back to a
+    _Projection, so present attributes never pay for a call.
+    """
+    default = COLUMN_DEFAULTS.get(column, 'N/A')
+    paths = [tuple(alternative.split('.')) for alternative in path.split('|')]
+    if len(paths[0]) > 1:
+        projection = _Projection(paths, default)
+        return (column, projection, projection)
+    if len(paths) > 1 or isinstance(default, dict):
+        return (column, paths[0][0], _Projection(paths[1:], default))
+    return (column, paths[0][0], default)
+
+
+def _compile_extractor(resource_type: str) -> Tuple[_Step, ...]:
+    """Steps for a resource type from its spec, or its provider's fallback"""
+    provider = next((spec for prefix, spec in PROVIDERS.items() if resource_type.startswith(prefix)), None)
+    if provider is None:
+        return ()
+    cloud_provider, provider_fields = provider
+    display_name, type_fields = RESOURCE_TYPES.get(resource_type, (resource_type, ''))
+    constants = {
+        'asset_type': ASSET_TYPES.get(resource_type, resource_type),
+        'display_name': display_name,
+    }
+
+    steps = [('cloud_provider', _CONSTANT, cloud_provider)]
+    for column, path in _parse_fields(provider_fields) + _parse_fields(type_fields):
+        if column in constants:
+            steps.append((column, _CONSTANT, constants[column]))
+        else:
+            steps.append(_compile_step(column, path))
+    return tuple(steps)
+
+
+def asset_fieldnames() -> List[str]:
+    """Sorted union of every column the registered specs can produce"""
+    fields = set(ASSET_BASE_FIELDS)
+    fields.add('cloud_provider')
+    for _, provider_fields in PROVIDERS.values():
+        fields.update(column for column, _ in _parse_fields(provider_fields))
+    for _, type_fields in RESOURCE_TYPES.values():
+        fields.update(column for column, _ in _parse_fields(type_fields))
+    return sorted(fields)
+
+
+class SharedTags(dict):
+    """Tags or labels shared by every asset that carries the same set
+
+    One instance backs many assets, so treat it as read-only. The JSON form
+    is computed on first use and reused for every asset.
+    """
+
+    __slots__ = ('_json',)
+
+    def __reduce__(self):
+        return (SharedTags, (dict(self),))
+
+    def to_json(self) -> str:
+        try:
+            return self._json
+        except AttributeError:
+            self._json = json.dumps(self)
+            return self._json
+
+
+class _AssetSchema:
+    """Field layout shared by every record with the same columns in order"""
+
+    __slots__ = ('fields', 'index', 'interned', 'shared')
+
+    def __init__(self, fields: Tuple[str, ...]):
+        self.fields = fields
+        self.index = {field: i for i, field in enumerate(fields)}
+        self.interned = tuple(i for i, field in enumerate(fields) if field in INTERNED_COLUMNS)
+        self.shared = tuple(i for i, field in enumerate(fields) if field in SHARED_TAG_COLUMNS)
+
+    def __reduce__(self):
+        return (_AssetSchema, (self.fields,))
+
+
+class AssetRecord(Mapping):
+    """Read-only asset: a values tuple over a shared field layout
+
+    Behaves like the dict ``iter_asset_inventory`` yields (``get``, item
+    access, ``dict(record)``) at a fraction of its size.
+    """
+
+    __slots__ = ('_schema', '_values')
+
+    def __init__(self, schema: _AssetSchema, values: Tuple[Any, ...]):
+        self._schema = schema
+        self._values = values
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._schema.index[key]]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        i = self._schema.index.get(key)
+        return default if i is None else self._values[i]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._schema.fields)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(zip(self._schema.fields, self._values))
+
+    def __reduce__(self):
+        # Pickle keeps one copy of each shared schema, string and tag set
+        return (AssetRecord, (self._schema, self._values))
+
+    def __repr__(self) -> str:
+        return f"AssetRecord({self.as_dict()!r})"
+
+
+class AssetInventory(Sequence):
+    """Compact, append-only list of AssetRecord
+
+    Same-shaped assets share one field layout, repeated strings are
+    interned and identical tag sets are stored once as SharedTags, so a
+    large inventory costs little more than its values tuples.
+    """
+
+    def __init__(self, assets: Iterable[Dict[str, Any]] = ()):
+        self._records: List[AssetRecord] = []
+        self._schemas: Dict[Tuple[str, ...], _AssetSchema] = {}
+        self._tags: Dict[Tuple, SharedTags] = {}
+        for asset in assets:
+            self.append(asset)
+
+    def append(self, asset: Dict[str, Any]):
+        """Compact an asset dict into a record and add it"""
+        fields = tuple(asset)
+        schema = self._schemas.get(fields)
+        if schema is None:
+            schema = self._schemas[fields] = _AssetSchema(fields)
+
+        values = list(asset.values())
+        for i in schema.interned:
+            value = values[i]
+            if type(value) is str:
+                values[i] = sys.intern(value)
+        for i in schema.shared:
+            values[i] = self._share_tags(values[i])
+        self._records.append(AssetRecord(schema, tuple(values)))
+
+    def _share_tags(self, tags: Any) -> Any:
+        if not isinstance(tags, dict):
+            return tags
+        key = tuple(tags.items())
+        try:
+            shared = self._tags.get(key)
+        except TypeError:
+            # Unhashable tag values cannot be pooled
+            return SharedTags(tags)
+        if shared is None:
+            shared = self._tags[key] = SharedTags(tags)
+        return shared
+
+    def extend(self, other: 'AssetInventory'):
+        """Append another inventory's records as they are, e.g. one built in a worker process"""
+        self._records.extend(other._records)
+        for fields, schema in other._schemas.items():
+            self._schemas.setdefault(fields, schema)
+        for key, tags in other._tags.items():
+            self._tags.setdefault(key, tags)
+
+    def __getitem__(self, index):
+        return self._records[index]
+
+    def __iter__(self) -> Iterator[AssetRecord]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+def json_default(value: Any) -> Any:
+    """``json.dump`` hook that serializes AssetInventory and AssetRecord
+
+    Anything else falls back to ``str``, like ``default=str``.
+    """
+    if isinstance(value, AssetRecord):
+        return value.as_dict()
+    if isinstance(value, AssetInventory):
+        return list(value)
+    return str(value)
+
+
+def extract_asset_inventory(tfstate: Union[str, os.PathLike], workers: int = 1) -> AssetInventory:
+    """Extract asset inventory from Terraform state into a compact AssetInventory
+
+    ``tfstate`` is taken as by ``iter_asset_inventory``. With ``workers`` > 1
+    the state is parsed and extracted in shards on a process pool (see
+    ``parallel``); the result is the same.
+    """
+    with span('extract_asset_inventory', workers=workers) as stage:
+        if workers > 1:
+            from .parallel import extract_sharded
+
+            inventory = extract_sharded(tfstate, workers)
+            stage.set(assets=len(inventory))
+        else:
+            inventory = AssetInventory(stage.count_items(iter_asset_inventory(tfstate), 'assets'))
+    return inventory
+
+
+def iter_asset_inventory(tfstate: Union[str, os.PathLike], workers: int = 1) -> Iterator[Dict[str, Any]]:
+    """Yield assets one instance at a time without loading the whole state
+
+    ``tfstate`` is a path (``str`` or path-like, any STATE_ENCODINGS), a
+    ``StateFile`` or in-memory base64 content. It is read and decoded in
+    chunks so memory stays bounded by the largest single resource rather
+    than the state size.
+
+    With ``workers`` > 1 shards are extracted on a process pool and their
+    assets yielded in state order as AssetRecord mappings, each shard as
+    soon as it and those before it are done.
+    """
+    if workers > 1:
+        from .parallel import iter_sharded
+
+        yield from iter_sharded(tfstate, workers)
+        return
+    yield from iter_instance_assets(iter_resource_instances(tfstate))
+
+
+def iter_instance_assets(
+    instances: Iterator[Tuple[Dict[str, Any], int, Dict[str, Any]]]
+) -> Iterator[Dict[str, Any]]:
+    """Turn (resource, index, instance) tuples into asset dicts
+
+    A parse error raised by ``instances`` ends the stream with a warning.
+    """
+    while True:
+        try:
+            resource, idx, instance = next(instances)
+        except StopIteration:
+            return
+        except Exception as e:
+            print(f"⚠️  Warning: Could not parse Terraform state for inventory: {e}")
+            return
+
+        resource_type = resource.get('type', 'unknown')
+        resource_name = resource.get('name', 'unknown')
+        attrs = instance.get('attributes', {})
+
+        # Extract common attributes
+        asset = {
+            'asset_id': f"{resource_type}.{resource_name}.{idx}",
+            'resource_type': resource_type,
+            'resource_name': resource_name,
+            'provider': resource.get('provider', 'unknown'),
+        }
+
+        # Add provider and type-specific attributes
+        steps = _EXTRACTORS.get(resource_type)
+        if steps is None:
+            steps = _EXTRACTORS[resource_type] = _compile_extractor(resource_type)
+        get = attrs.get
+        for column, key, default in steps:
+            value = get(key, default)
+            if value.__class__ is _Projection:
+                value = value.resolve(attrs)
+            asset[column] = value
+
+        yield asset
@@ -0,0 +1,74 @@
+"""Streaming JSON writer for large report documents
+
+``json.dumps`` builds a document as one string, and with ``indent`` that
+string is several times the size of the data. ``write_json`` walks the top
+of the document instead: mappings are written member by member, sequences
+(lists, tuples, AssetInventory, generators) element by element, and each
+element is encoded on its own. Memory is bounded by the largest single
+element, e.g. one asset or one control, not by the output size.
+
+The output is byte-identical to ``json.dumps(value, indent=indent,
+default=default)``; ``indent=None`` writes compact JSON, as with
+``separators=(',', ':')``.
+"""
+
+import json
+from collections.abc import Iterator, Mapping, Sequence
+from typing import IO, Any, Callable, Optional, Union
+
+
+def _key(key: Any) -> str:
+    """Object key as json converts it"""
+    if isinstance(key, str):
+        return key
+    if key is None or isinstance(key, (int, float)):
+        return json.dumps(key)
+    raise TypeError(f'keys must be str, int, float, bool or None, not {key.__class__.__name__}')
+
+
+def write_json(
+    value: Any,
+    fp: IO[str],
+    indent: Optional[Union[int, str]] = 2,
+    default: Optional[Callable[[Any], Any]] = None
+):
+    """Write value to a text file handle as JSON without materializing it"""
+    if isinstance(indent, int):
+        indent = ' ' * indent
+    key_separator = ': ' if indent is not None else ':'
+    encode = json.JSONEncoder(indent=indent, separators=(',', key_separator), default=default).encode
+    write = fp.write
+
+    def newline(level: int) -> str:
+        return '' if indent is None else '\n' + indent * level
+
+    def element(item: Any, level: int):
+        # Encoded strings never contain a raw newline, so every newline is
+        # a line break of the indented layout
+        text = encode(item)
+        if indent is not None and level:
+            text = text.replace('\n', newline(level))
+        write(text)
+
+    def container(opening: str, closing: str, members, level: int, write_member):
+        inner = newline(level + 1)
+        first = True
+        for prefix, item in members:
+            write((opening if first else ',') + inner + prefix)
+            first = False
+            write_member(item, level + 1)
+        write(opening + closing if first else newline(level) + closing)
+
+    def node(item: Any, level: int):
+        if isinstance(item, Mapping):
+            container(
+                '{', '}',
+                ((encode(_key(key)) + key_separator, member) for key, member in item.items()),
+                level, node
+            )
+        elif isinstance(item, (Sequence, Iterator)) and not isinstance(item, (str, bytes, bytearray)):
+            container('[', ']', (('', member) for member in item), level, element)
+        else:
+            element(item, level)
+
+    node(value, 0)
@@ -0,0 +1,366 @@
+"""Prometheus textfile metrics and a live progress line
+
+``enable(path)`` listens to the pipeline's profiling spans (see
+``profiling``) and, when the run exits, writes what they measured in the
+Prometheus text exposition format for node_exporter's textfile collector:
+assets extracted per second, report rows written per second per table, an
+API request latency histogram, upload and download bytes per second,
+artifacts written, time per stage and peak RSS. The file is replaced
+atomically, so the collector never scrapes a half-written file.
+
+Counters are totals for the run; the ``*_per_second`` gauges divide them
+by the time spent on the work itself. Upload time runs from the first to
+the last chunk of a streamed request body, and download time from the
+first to the last chunk of the response as the parser consumes it, so
+both are the throughput the pipeline achieved rather than the network's.
+
+A long-running process calls ``flush()`` after each run so the file stays
+current; counters then keep growing across runs, as Prometheus expects.
+
+``ProgressLine`` redraws one status line on stderr as state bytes, assets
+and API bytes flow, at most every ``PROGRESS_INTERVAL`` seconds on a
+terminal and every ``LOG_PROGRESS_INTERVAL`` seconds when stderr is a log.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional, Tuple, Union
+
+from . import profiling
+from .profiling import format_bytes
+
+PREFIX = 'nabla_evidence_'
+
+# Metrics installed by enable(), and the file they are written to
+_enabled: Optional[Tuple['Metrics', Optional[Path]]] = None
+
+# Upper bounds, in seconds, of the API latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+# Stages that produce assets from a Terraform state
+EXTRACTION_STAGES = frozenset(('extract_asset_inventory', 'generate_asset_inventory_csv'))
+
+# Seconds between progress redraws on a terminal and in a log
+PROGRESS_INTERVAL = 0.5
+LOG_PROGRESS_INTERVAL = 10.0
+
+# Exported metrics in output order: name -> (type, help)
+METRICS: Dict[str, Tuple[str, str]] = {
+    'run_duration_seconds': ('gauge', 'Wall-clock duration of the run'),
+    'run_completed_timestamp_seconds': ('gauge', 'Unix time the run finished'),
+    'max_rss_bytes': ('gauge', 'Peak resident set size of the process'),
+    'stage_runs_total': ('counter', 'Pipeline stages run'),
+    'stage_errors_total': ('counter', 'Pipeline stages that raised'),
+    'stage_duration_seconds_total': ('counter', 'Time spent in each pipeline stage'),
+    'state_read_bytes_total': ('counter', 'Terraform state bytes read from disk'),
+    'state_decoded_bytes_total': ('counter', 'Terraform state JSON bytes decoded'),
+    'assets_total': ('counter', 'Assets extracted from Terraform state'),
+    'asset_extraction_seconds_total': ('counter', 'Time spent extracting assets'),
+    'assets_per_second': ('gauge', 'Assets extracted per second'),
+    'report_rows_total': ('counter', 'Report rows written'),
+    'report_write_seconds_total': ('counter', 'Time spent writing report tables'),
+    'report_bytes_written_total': ('counter', 'Report file bytes written'),
+    'report_rows_per_second': ('gauge', 'Report rows written per second'),
+    'api_request_duration_seconds': ('histogram', 'Evidence API request latency'),
+    'api_sent_bytes_total': ('counter', 'Request body bytes sent to the evidence API'),
+    'api_received_bytes_total': ('counter', 'Response bytes received from the evidence API'),
+    'api_upload_seconds_total': ('counter', 'Time spent streaming request bodies'),
+    'api_download_seconds_total': ('counter', 'Time spent streaming responses'),
+    'api_upload_bytes_per_second': ('gauge', 'Streamed request body bytes sent per second'),
+    'api_download_bytes_per_second': ('gauge', 'Response bytes received per second while streaming'),
+    'artifacts_written_total': ('counter', 'Report artifacts written'),
+    'artifact_bytes_written_total': ('counter', 'Report artifact bytes written'),
+}
+
+# Gauges derived at write time: gauge -> (amount counter, seconds counter)
+RATES = {
+    'assets_per_second': ('assets_total', 'asset_extraction_seconds_total'),
+    'report_rows_per_second': ('report_rows_total', 'report_write_seconds_total'),
+    'api_upload_bytes_per_second': ('_upload_bytes', 'api_upload_seconds_total'),
+    'api_download_bytes_per_second': ('_download_bytes', 'api_download_seconds_total'),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels) + '}'
+
+
+def _format_value(value: float) -> str:
+    if value == int(value) and abs(value) < 1 << 53:
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metrics:
+    """Profiling listener that aggregates spans into Prometheus metrics
+
+    ``labels`` are added to every sample, so several runs can share a
+    textfile collector directory without their series colliding.
+    """
+
+    def __init__(self, labels: Optional[Dict[str, str]] = None):
+        self.labels: Labels = tuple(sorted((labels or {}).items()))
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+        self._values: Dict[str, Dict[Labels, float]] = {}
+        # Histogram name -> labels -> [bucket counts..., sum, count]
+        self._histograms: Dict[str, Dict[Labels, List[float]]] = {}
+
+    def _add(self, name: str, amount: float, **labels):
+        series = self._values.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        series[key] = series.get(key, 0) + amount
+
+    def _max(self, name: str, value: float):
+        series = self._values.setdefault(name, {})
+        series[()] = max(series.get((), 0), value)
+
+    def _observe(self, name: str, value: float, **labels):
+        series = self._histograms.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        counts = series.get(key)
+        if counts is None:
+            counts = series[key] = [0] * (len(LATENCY_BUCKETS) + 2)
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if value <= bound:
+                counts[i] += 1
+        counts[-2] += value
+        counts[-1] += 1
+
+    def progress(self, span: profiling.Span, key: str, amount: int):
+        pass
+
+    def span_closed(self, span: profiling.Span, seconds: float):
+        name, args = span.name, span.args
+        with self._lock:
+            if span.category == 'stage':
+                self._add('stage_runs_total', 1, stage=name)
+                self._add('stage_duration_seconds_total', seconds, stage=name)
+                if 'error' in args:
+                    self._add('stage_errors_total', 1, stage=name)
+                if 'max_rss_bytes' in args:
+                    self._max('max_rss_bytes', args['max_rss_bytes'])
+
+            if name == 'state.read':
+                self._add('state_read_bytes_total', args.get('bytes', 0))
+            elif name in ('base64.decode', 'gzip.decode'):
+                self._add('state_decoded_bytes_total', args.get('decoded_bytes', 0))
+            elif name == 'write_artifact':
+                self._add('artifacts_written_total', 1)
+                self._add('artifact_bytes_written_total', args.get('bytes_written', 0))
+            elif name == 'api.request':
+                self._api_request(args, seconds)
+
+            if name in EXTRACTION_STAGES and 'assets' in args:
+                self._add('assets_total', args['assets'], stage=name)
+                self._add('asset_extraction_seconds_total', seconds, stage=name)
+            if 'rows' in args:
+                labels = {'table': args.get('table', name), 'format': args.get('format', 'csv')}
+                self._add('report_rows_total', args['rows'], **labels)
+                self._add('report_write_seconds_total', seconds, **labels)
+                self._add('report_bytes_written_total', args.get('bytes_written', 0), **labels)
+
+    def _api_request(self, args: Dict[str, Any], seconds: float):
+        code = args.get('status', 'error')
+        self._observe('api_request_duration_seconds', seconds, method=args.get('method', ''), code=code)
+        self._add('api_sent_bytes_total', args.get('request_bytes', 0))
+        self._add('api_received_bytes_total', args.get('response_bytes', 0))
+        if 'upload_seconds' in args:
+            self._add('_upload_bytes', args.get('request_bytes', 0))
+            self._add('api_upload_seconds_total', args['upload_seconds'])
+        if 'download_seconds' in args:
+            self._add('_download_bytes', args.get('response_bytes', 0))
+            self._add('api_download_seconds_total', args['download_seconds'])
+
+    def render(self) -> str:
+        """The metrics in the Prometheus text exposition format"""
+        with self._lock:
+            values = {name: dict(series) for name, series in self._values.items()}
+            histograms = {name: dict(series) for name, series in self._histograms.items()}
+        values['run_duration_seconds'] = {(): time.monotonic() - self.started}
+        values['run_completed_timestamp_seconds'] = {(): time.time()}
+        for gauge, (amount, seconds) in RATES.items():
+            totals = values.get(seconds, {})
+            values[gauge] = {
+                labels: values.get(amount, {}).get(labels, 0) / elapsed
+                for labels, elapsed in totals.items() if elapsed > 0
+            }
+
+        lines = []
+        for name, (kind, help_text) in METRICS.items():
+            series = histograms.get(name) if kind == 'histogram' else values.get(name)
+            if not series:
+                continue
+            metric = PREFIX + name
+            lines.append(f'# HELP {metric} {help_text}')
+            lines.append(f'# TYPE {metric} {kind}')
+            for labels in sorted(series):
+                full = self.labels + labels
+                if kind != 'histogram':
+                    lines.append(f'{metric}{_format_labels(full)} {_format_value(series[labels])}')
+                    continue
+                counts = series[labels]
+                for bound, count in zip(LATENCY_BUCKETS + ('+Inf',), counts[:-2] + [counts[-1]]):
+                    le = bound if bound == '+Inf' else _format_value(bound)
+                    lines.append(f'{metric}_bucket{_format_labels(full + (("le", le),))} {count}')
+                lines.append(f'{metric}_sum{_format_labels(full)} {_format_value(counts[-2])}')
+                lines.append(f'{metric}_count{_format_labels(full)} {counts[-1]}')
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path: Union[str, Path]):
+        """Atomically replace path with the current metrics"""
+        from .artifacts import atomic_write
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        text = self.render()
+        with atomic_write(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+
+# Counts shown on the progress line: (span argument, label, shown as bytes)
+_PROGRESS_COUNTS = (
+    ('bytes', 'read', True),
+    ('assets', 'assets', False),
+    ('rows', 'rows', False),
+    ('request_bytes', 'sent', True),
+    ('response_bytes', 'received', True),
+    ('artifacts', 'artifacts', False),
+)
+
+
+class ProgressLine:
+    """Profiling listener redrawing a rate-limited status line
+
+    On a terminal the line is redrawn in place; otherwise a new line is
+    written each time, so keep the interval long enough for a log.
+    """
+
+    def __init__(self, stream: Optional[IO[str]] = None, interval: Optional[float] = None):
+        self.stream = stream or sys.stderr
+        self.tty = self.stream.isatty()
+        self.interval = interval if interval is not None else (
+            PROGRESS_INTERVAL if self.tty else LOG_PROGRESS_INTERVAL
+        )
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+        self._drawn = self.started
+        self._stage = ''
+        # Counts of closed spans, and of open spans by (span id, key)
+        self._totals: Dict[str, int] = {}
+        self._open: Dict[Tuple[int, str], int] = {}
+        self._first: Dict[str, float] = {}
+
+    def progress(self, span: profiling.Span, key: str, amount: int):
+        with self._lock:
+            self._first.setdefault(key, time.monotonic())
+            self._open[(id(span), key)] = self._open.get((id(span), key), 0) + amount
+            self._draw(span.profiler.current())
+
+    def span_closed(self, span: profiling.Span, seconds: float):
+        args = span.args
+        with self._lock:
+            for key, _, _ in _PROGRESS_COUNTS:
+                self._open.pop((id(span), key), None)
+                if isinstance(args.get(key), int):
+                    self._first.setdefault(key, time.monotonic() - seconds)
+                    self._totals[key] = self._totals.get(key, 0) + args[key]
+            if span.name == 'write_artifact':
+                self._totals['artifacts'] = self._totals.get('artifacts', 0) + 1
+            self._draw(span.profiler.current())
+
+    def _draw(self, current: Optional[profiling.Span], force: bool = False):
+        now = time.monotonic()
+        if not force and now - self._drawn < self.interval:
+            return
+        self._drawn = now
+        if current is not None:
+            self._stage = current.name
+        counts = dict(self._totals)
+        for (_, key), amount in self._open.items():
+            counts[key] = counts.get(key, 0) + amount
+
+        parts = [f'⏳ {now - self.started:6.1f}s', self._stage]
+        for key, label, as_bytes in _PROGRESS_COUNTS:
+            count = counts.get(key)
+            if not count:
+                continue
+            elapsed = now - self._first.get(key, now)
+            if as_bytes:
+                part = f'{label} {format_bytes(count)}'
+                if elapsed >= 1:
+                    part += f' ({format_bytes(count / elapsed)}/s)'
+            else:
+                part = f'{label} {count:,}'
+                if elapsed >= 1 and key != 'artifacts':
+                    part += f' ({count / elapsed:,.0f}/s)'
+            parts.append(part)
+        line = '  '.join(part for part in parts if part)
+        try:
+            if self.tty:
+                self.stream.write(f'\r{line}\x1b[K')
+            else:
+                self.stream.write(line + '\n')
+            self.stream.flush()
+        except (OSError, ValueError):
+            pass
+
+    def finish(self):
+        """Draw the final counts and end the line"""
+        with self._lock:
+            self._stage = 'done'
+            self._draw(None, force=True)
+            if self.tty:
+                try:
+                    self.stream.write('\n')
+                except (OSError, ValueError):
+                    pass
+
+
+def enable(
+    path: Optional[Union[str, Path]] = None,
+    progress: bool = False,
+    labels: Optional[Dict[str, str]] = None
+) -> Metrics:
+    """Collect metrics for the rest of the run
+
+    At exit they are written to path, if given; ``progress`` also shows the
+    progress line on stderr. A ``script`` label naming the running script
+    is added to ``labels``.
+    """
+    import atexit
+
+    global _enabled
+    metrics = Metrics({'script': Path(sys.argv[0]).name or 'python', **(labels or {})})
+    profiling.listen(metrics)
+    _enabled = (metrics, Path(path) if path is not None else None)
+    line = None
+    if progress:
+        line = ProgressLine()
+        profiling.listen(line)
+
+    def finish():
+        if line is not None:
+            line.finish()
+        if path is not None:
+            metrics.write(path)
+            print(f"\n📈 Metrics: {path}")
+
+    atexit.register(finish)
+    return metrics
+
+
+def flush():
+    """Write the enabled metrics file now, e.g. after each run of a long-lived process"""
+    if _enabled is not None and _enabled[1] is not None:
+        _enabled[0].write(_enabled[1])
@@ -0,0 +1,464 @@
+"""Local stand-in for the evidence API, for offline load testing
+
+Usage:
+    python -m nabla_evidence.mockserver [--port 8765] [--latency DIST]
+                                        [--error-rate P] [--throttle-rate P] [--max-inflight N]
+                                        [--body-rate KB/S] [--chunked] [--reject-gzip]
+                                        [--controls N] [--findings N] [--artifacts N] [--artifact-kb KB]
+
+Then point the report CLIs at it:
+    NABLA_API_URL=http://127.0.0.1:8765 NABLA_CUSTOMER_KEY=test python generate-compliance-csv.py ...
+
+``POST /v1/evidence/terraform`` takes the client's request (plain or gzip,
+with a Content-Length or chunked) and replies with a schema-correct
+assessment covering all FRAMEWORKS plus inline artifacts. The submitted
+state is decoded and parsed as it streams in, and the findings name its
+resources.
+
+Latency distributions are ``fixed:S``, ``uniform:LOW,HIGH``,
+``normal:MEAN,STDDEV``, ``lognormal:MEDIAN,SIGMA`` or ``exponential:MEAN``,
+in seconds. Every request can fail with a 5xx
+(``--error-rate``) or a 429 with Retry-After (``--throttle-rate``, or over
+``--max-inflight`` concurrent requests). ``--body-rate`` trickles replies
+out to test slow bodies.
+"""
+
+import argparse
+import binascii
+import codecs
+import collections
+import json
+import math
+import random
+import signal
+import sys
+import threading
+import time
+import zlib
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .assessment import FRAMEWORKS
+from .response import _read_object
+from .state import _b64decode_chunks, _JSONStream, iter_tfstate_resources
+from .synthetic import synthetic_response
+
+EVIDENCE_PATH = '/v1/evidence/terraform'
+
+# Bytes read from a request body, or written to a reply, at a time
+BODY_CHUNK_SIZE = 64 * 1024
+
+# Statuses drawn for injected server errors
+ERROR_STATUSES = (500, 502, 503, 504)
+
+# Resource addresses kept from a submitted state for findings
+MAX_ADDRESSES = 5000
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """Parse a latency distribution such as ``lognormal:0.3,0.5`` into a sampler"""
+    kind, _, params = spec.partition(':')
+    try:
+        values = [float(value) for value in params.split(',') if value.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid latency parameters: {spec}")
+    shapes = {
+        'fixed': (1, lambda rng, s: s),
+        'uniform': (2, lambda rng, low, high: rng.uniform(low, high)),
+        'normal': (2, lambda rng, mean, stddev: rng.gauss(mean, stddev)),
+        'lognormal': (2, lambda rng, median, sigma: rng.lognormvariate(math.log(median), sigma)),
+        'exponential': (1, lambda rng, mean: rng.expovariate(1 / mean)),
+    }
+    if kind not in shapes:
+        raise argparse.ArgumentTypeError(f"unknown latency distribution {kind!r} (choose from {', '.join(shapes)})")
+    arity, sample = shapes[kind]
+    if len(values) != arity:
+        raise argparse.ArgumentTypeError(f"{kind} takes {arity} parameter(s): {spec}")
+    if kind in ('lognormal', 'exponential') and values[0] <= 0:
+        raise argparse.ArgumentTypeError(f"{kind} needs a positive first parameter: {spec}")
+    return lambda rng: max(0.0, sample(rng, *values))
+
+
+class BadRequest(Exception):
+    """The request body could not be read as an evidence request"""
+
+
+def _iter_body(rfile, headers) -> Iterator[bytes]:
+    """Read a request body sent with Content-Length or chunked"""
+    if headers.get('Transfer-Encoding', '').lower() == 'chunked':
+        while True:
+            line = rfile.readline()
+            try:
+                size = int(line.split(b';', 1)[0].strip(), 16)
+            except ValueError:
+                raise BadRequest(f"invalid chunk size line: {line[:40]!r}")
+            if size == 0:
+                # Skip trailers up to the blank line ending the body
+                while rfile.readline() not in (b'\r\n', b'\n', b''):
+                    pass
+                return
+            chunk = rfile.read(size)
+            rfile.readline()
+            if len(chunk) < size:
+                raise BadRequest("body ended inside a chunk")
+            yield chunk
+    else:
+        remaining = int(headers.get('Content-Length') or 0)
+        while remaining > 0:
+            chunk = rfile.read(min(remaining, BODY_CHUNK_SIZE))
+            if not chunk:
+                raise BadRequest("body shorter than Content-Length")
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _gunzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    decompressor = zlib.decompressobj(31)
+    for chunk in chunks:
+        data = decompressor.decompress(chunk)
+        if data:
+            yield data
+    data = decompressor.flush()
+    if data:
+        yield data
+
+
+class StateSummary:
+    """Resource and instance counts of a submitted state, parsed as it streams"""
+
+    def __init__(self):
+        self.received = False
+        self.resources = 0
+        self.instances = 0
+        self.addresses: List[str] = []
+
+    def read(self, pieces: Iterator[str]):
+        self.received = True
+        try:
+            text = codecs.iterdecode(_b64decode_chunks(pieces), 'utf-8')
+            for resource in iter_tfstate_resources(text):
+                self.resources += 1
+                self.instances += len(resource.get('instances') or [])
+                if len(self.addresses) < MAX_ADDRESSES and resource.get('type'):
+                    self.addresses.append(f"{resource['type']}.{resource.get('name')}")
+        except (binascii.Error, ValueError) as e:
+            raise BadRequest(f"content_base64 is not a base64 Terraform state: {e}")
+        finally:
+            # Nothing after the resources array is needed, but the string must be consumed
+            for _ in pieces:
+                pass
+
+
+def read_evidence_request(chunks: Iterable[bytes]) -> Tuple[Dict[str, Any], StateSummary]:
+    """Parse an evidence request, inspecting its state without buffering it"""
+    state = StateSummary()
+
+    def read_member(stream: _JSONStream, key: str, fields: Dict):
+        if key == 'content_base64' and stream.peek() == '"':
+            state.read(stream.iter_string())
+        else:
+            fields[key] = stream.read_value()
+
+    try:
+        stream = _JSONStream(codecs.iterdecode(chunks, 'utf-8'))
+        fields = _read_object(stream, read_member)
+    except (ValueError, zlib.error) as e:
+        raise BadRequest(f"invalid JSON body: {e}")
+    if not state.received:
+        raise BadRequest("content_base64 is required")
+    return fields, state
+
+
+class MockOptions:
+    """Behaviour of a MockEvidenceServer"""
+
+    def __init__(
+        self,
+        latency: Optional[Callable[[random.Random], float]] = None,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 1.0,
+        max_inflight: Optional[int] = None,
+        body_rate: Optional[float] = None,
+        chunked: bool = False,
+        reject_gzip: bool = False,
+        customer_key: Optional[str] = None,
+        controls: int = 300,
+        findings: int = 3,
+        frameworks: int = len(FRAMEWORKS),
+        artifacts: int = 1,
+        artifact_bytes: int = 64 * 1024,
+        seed: Optional[int] = None,
+        log: bool = False
+    ):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.max_inflight = max_inflight
+        self.body_rate = body_rate
+        self.chunked = chunked
+        self.reject_gzip = reject_gzip
+        self.customer_key = customer_key
+        self.controls = controls
+        self.findings = findings
+        self.frameworks = frameworks
+        self.artifacts = artifacts
+        self.artifact_bytes = artifact_bytes
+        self.seed = seed
+        self.log = log
+
+
+class MockEvidenceServer(ThreadingHTTPServer):
+    """Threaded HTTP server answering evidence requests per MockOptions"""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, address: Tuple[str, int], options: Optional[MockOptions] = None):
+        super().__init__(address, _Handler)
+        self.options = options or MockOptions()
+        self.rng = random.Random(self.options.seed)
+        self.lock = threading.Lock()
+        self.inflight = 0
+        self.requests = 0
+        self.statuses: Dict[int, int] = collections.Counter()
+        # Artifacts are the same for every reply; encode them once
+        self.artifacts = synthetic_response(
+            controls=0,
+            frameworks=0,
+            artifacts=self.options.artifacts,
+            artifact_bytes=self.options.artifact_bytes,
+            seed=self.options.seed or 0
+        )['artifacts']
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def sample(self, distribution: Optional[Callable[[random.Random], float]]) -> float:
+        if distribution is None:
+            return 0.0
+        with self.lock:
+            return distribution(self.rng)
+
+    def roll(self) -> float:
+        with self.lock:
+            return self.rng.random()
+
+    def build_response(self, fields: Dict[str, Any], state: StateSummary, assessment_id: str) -> Dict[str, Any]:
+        options = self.options
+        with self.lock:
+            seed = self.rng.getrandbits(32)
+        response = synthetic_response(
+            controls=options.controls,
+            findings=options.findings,
+            frameworks=options.frameworks,
+            seed=seed,
+            name=str(fields.get('name') or 'assessment'),
+            addresses=state.addresses
+        )
+        created_at = datetime.now(timezone.utc).isoformat()
+        response.update(id=assessment_id, created_at=created_at, status='completed', format=fields.get('format', 'json'))
+        for framework in response['assessment'].values():
+            framework['timestamp'] = created_at
+        response['resource_count'] = state.resources
+        response['instance_count'] = state.instances
+        include_diagram = bool(fields.get('include_diagram'))
+        response['artifacts'] = [
+            artifact if include_diagram else {**artifact, 'diagram': None}
+            for artifact in self.artifacts
+        ]
+        return response
+
+    def next_id(self) -> str:
+        with self.lock:
+            self.requests += 1
+            return f'mock-{self.requests:06d}-{self.rng.getrandbits(24):06x}'
+
+    def summary(self) -> str:
+        with self.lock:
+            statuses = ', '.join(f'{status}: {count}' for status, count in sorted(self.statuses.items()))
+        return f"{sum(self.statuses.values())} replies ({statuses or 'none'})"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server: MockEvidenceServer
+
+    def log_message(self, format: str, *args):
+        if self.server.options.log:
+            super().log_message(format, *args)
+
+    def send_json(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None):
+        options = self.server.options
+        data = json.dumps(body).encode('utf-8')
+        with self.server.lock:
+            self.server.statuses[status] += 1
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if options.chunked:
+            self.send_header('Transfer-Encoding', 'chunked')
+        else:
+            self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+
+        view = memoryview(data)
+        for start in range(0, len(data), BODY_CHUNK_SIZE):
+            chunk = view[start:start + BODY_CHUNK_SIZE]
+            if options.chunked:
+                self.wfile.write(f'{len(chunk):x}\r\n'.encode('ascii') + chunk + b'\r\n')
+            else:
+                self.wfile.write(chunk)
+            if options.body_rate:
+                self.wfile.flush()
+                time.sleep(len(chunk) / options.body_rate)
+        if options.chunked:
+            self.wfile.write(b'0\r\n\r\n')
+
+    def send_error_json(self, status: int, message: str, close: bool = False):
+        headers = {'Connection': 'close'} if close else {}
+        if status == 429:
+            headers['Retry-After'] = f'{self.server.options.retry_after:g}'
+        self.close_connection = close
+        self.send_json(status, {'error': message, 'status': status}, headers)
+
+    def fault(self) -> Optional[Tuple[int, str]]:
+        """Injected failure for this request, if any"""
+        options = self.server.options
+        if options.max_inflight is not None and self.server.inflight > options.max_inflight:
+            return 429, f"more than {options.max_inflight} concurrent requests"
+        roll = self.server.roll()
+        if roll < options.throttle_rate:
+            return 429, "rate limit exceeded"
+        if roll < options.throttle_rate + options.error_rate:
+            with self.server.lock:
+                status = self.server.rng.choice(ERROR_STATUSES)
+            return status, "injected server error"
+        return None
+
+    def authorized(self) -> bool:
+        key = self.headers.get('X-Customer-Key')
+        if not key:
+            self.send_error_json(401, "missing X-Customer-Key header", close=True)
+            return False
+        expected = self.server.options.customer_key
+        if expected is not None and key != expected:
+            self.send_error_json(403, "invalid customer key", close=True)
+            return False
+        return True
+
+    def handle_one_request(self):
+        with self.server.lock:
+            self.server.inflight += 1
+        try:
+            super().handle_one_request()
+        finally:
+            with self.server.lock:
+                self.server.inflight -= 1
+
+    def do_POST(self):
+        if self.path.split('?', 1)[0].rstrip('/') != EVIDENCE_PATH:
+            self.send_error_json(404, f"no such endpoint: {self.path}", close=True)
+            return
+        if not self.authorized():
+            return
+        started = time.monotonic()
+        gzipped = self.headers.get('Content-Encoding', '').lower() == 'gzip'
+        try:
+            if gzipped and self.server.options.reject_gzip:
+                # Drain the upload so the connection stays usable for the retry
+                for _ in _iter_body(self.rfile, self.headers):
+                    pass
+                self.send_error_json(415, "Content-Encoding gzip is not supported")
+                return
+            chunks = _iter_body(self.rfile, self.headers)
+            fields, state = read_evidence_request(_gunzip(chunks) if gzipped else chunks)
+            for _ in chunks:
+                pass
+        except BadRequest as e:
+            self.send_error_json(400, str(e), close=True)
+            return
+
+        fault = self.fault()
+        delay = self.server.sample(self.server.options.latency) - (time.monotonic() - started)
+        if delay > 0:
+            time.sleep(delay)
+        if fault:
+            self.send_error_json(*fault)
+            return
+
+        response = self.server.build_response(fields, state, self.server.next_id())
+        self.send_json(200, response)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Serve a local stand-in for the Nabla evidence API',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='Latency distributions (seconds): fixed:S, uniform:LOW,HIGH, normal:MEAN,STDDEV, '
+               'lognormal:MEDIAN,SIGMA, exponential:MEAN'
+    )
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on (default: 8765, 0 picks one)')
+    parser.add_argument('--latency', type=parse_latency, help='Server time per request (default: none)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests failing with a 5xx')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Fraction of requests answered with 429')
+    parser.add_argument('--retry-after', type=float, default=1.0, help='Retry-After seconds sent with 429 replies')
+    parser.add_argument('--max-inflight', type=int, help='Answer 429 above this many concurrent requests')
+    parser.add_argument('--body-rate', type=float, help='Throttle reply bodies to this many KiB/s')
+    parser.add_argument('--chunked', action='store_true', help='Send replies with chunked transfer encoding')
+    parser.add_argument('--reject-gzip', action='store_true', help='Answer gzip uploads with 415')
+    parser.add_argument('--customer-key', help='Only accept this X-Customer-Key (default: any non-empty key)')
+    parser.add_argument('--controls', type=int, default=300, help='Controls per framework')
+    parser.add_argument('--findings', type=int, default=3, help='Findings per not-satisfied control')
+    parser.add_argument('--frameworks', type=int, default=len(FRAMEWORKS), help='Frameworks per assessment')
+    parser.add_argument('--artifacts', type=int, default=1, help='Inline artifacts per assessment')
+    parser.add_argument('--artifact-kb', type=int, default=64, help='Size of each artifact in KiB')
+    parser.add_argument('--seed', type=int, help='Random seed for payloads, latencies and faults')
+    parser.add_argument('--log', action='store_true', help='Log every request to stderr')
+    args = parser.parse_args(argv)
+
+    options = MockOptions(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        max_inflight=args.max_inflight,
+        body_rate=args.body_rate * 1024 if args.body_rate else None,
+        chunked=args.chunked,
+        reject_gzip=args.reject_gzip,
+        customer_key=args.customer_key,
+        controls=args.controls,
+        findings=args.findings,
+        frameworks=args.frameworks,
+        artifacts=args.artifacts,
+        artifact_bytes=args.artifact_kb * 1024,
+        seed=args.seed,
+        log=args.log
+    )
+    server = MockEvidenceServer((args.host, args.port), options)
+    print(f"🧪 Mock evidence API listening on {server.url}")
+    print(f"   NABLA_API_URL={server.url}", flush=True)
+
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+
+    # Background jobs ignore SIGINT; let `kill` stop the server cleanly too
+    signal.signal(signal.SIGTERM, stop)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n✅ {server.summary()}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,312 @@
+"""Sharded asset inventory extraction on a process pool
+
+Parsing dominates extraction, so shards are handed to workers as raw JSON:
+the state's decoded JSON file (the state itself when it is raw JSON, see
+``StateFile``; a temporary file for base64 content) is mapped, the top-level
+``resources`` array is split into byte ranges that each start at a
+resource object, and every worker maps the file, parses its own range and
+extracts it into an ``AssetInventory``. Only the file path and two offsets
+travel to a worker; the compact inventory (one copy of each shared schema,
+string and tag set) travels back. Shards are concatenated in state order,
+so ``asset_id`` values and row order match a serial run.
+
+A range boundary is only trusted once the shard before it parsed exactly up
+to it; anything unexpected falls back to the serial extractor.
+"""
+
+import codecs
+import contextlib
+import itertools
+import json
+import mmap
+import os
+import re
+import tempfile
+from typing import Any, Dict, Iterator, List, Tuple, Union
+
+from .inventory import AssetInventory, iter_instance_assets
+from .profiling import span
+from .state import StateFile, _iter_b64_decoded, _state_source, iter_resource_instances
+
+# Shards per worker, so a slow shard does not leave the other workers idle
+SHARDS_PER_WORKER = 4
+
+# Smallest shard worth a round trip to a worker
+MIN_SHARD_BYTES = 4 << 20
+
+# Bytes of the state decoded at a time while looking for the resources array
+_HEADER_PROBE = 64 << 10
+
+# An object following another in an array: where a resource may start
+_NEXT_OBJECT = re.compile(rb'\}\s*,\s*(\{)')
+
+_WHITESPACE = re.compile(r'\s*')
+
+# Keys every resource object has
+_RESOURCE_KEYS = frozenset(('type', 'name', 'instances'))
+
+
+class Unshardable(Exception):
+    """The state cannot be split; extract it serially"""
+
+
+@contextlib.contextmanager
+def _decoded_file(tfstate: Union[str, StateFile]) -> Iterator[str]:
+    """Path of a file holding the state's JSON for the duration of the block
+
+    ``tfstate`` is a StateFile or in-memory base64 content (see ``_shared_state``).
+    """
+    if isinstance(tfstate, StateFile):
+        with span('parallel.decode', 'io'):
+            path = tfstate.decoded_path()
+        yield path
+        return
+
+    fd, path = tempfile.mkstemp(prefix='nabla-state-', suffix='.json')
+    try:
+        with span('parallel.decode', 'io') as decode, os.fdopen(fd, 'wb') as f:
+            size = 0
+            for data in _iter_b64_decoded(tfstate):
+                f.write(data)
+                size += len(data)
+            decode.set(bytes=size)
+        yield path
+    finally:
+        os.unlink(path)
+
+
+def _resources_offset(mm: mmap.mmap) -> int:
+    """Byte offset just past the ``[`` of the top-level resources array, or -1"""
+    decoder = json.JSONDecoder()
+    probe = _HEADER_PROBE
+    while True:
+        # The incremental decoder holds back a character cut at the probe end
+        text = codecs.getincrementaldecoder('utf-8')().decode(mm[:probe])
+        try:
+            pos = _WHITESPACE.match(text).end()
+            if text[pos:pos + 1] != '{':
+                return -1
+            pos += 1
+            while True:
+                key, pos = decoder.raw_decode(text, _WHITESPACE.match(text, pos).end())
+                pos = _WHITESPACE.match(text, pos).end()
+                if text[pos:pos + 1] != ':':
+                    return -1
+                pos = _WHITESPACE.match(text, pos + 1).end()
+                if key == 'resources' and text[pos:pos + 1] == '[':
+                    return len(text[:pos + 1].encode('utf-8'))
+                _, pos = decoder.raw_decode(text, pos)
+                pos = _WHITESPACE.match(text, pos).end()
+                if text[pos:pos + 1] != ',':
+                    return -1
+                pos += 1
+        except (json.JSONDecodeError, IndexError):
+            if probe >= len(mm):
+                return -1
+            probe *= 2
+
+
+def _decode_object(mm: mmap.mmap, pos: int) -> Tuple[Any, int]:
+    """Decode the JSON value at byte pos; returns it and the byte offset after it"""
+    decoder = json.JSONDecoder()
+    window = _HEADER_PROBE
+    while True:
+        text = codecs.getincrementaldecoder('utf-8')().decode(mm[pos:pos + window])
+        try:
+            value, end = decoder.raw_decode(text)
+        except json.JSONDecodeError:
+            if pos + window >= len(mm):
+                raise
+            window *= 2
+            continue
+        return value, pos + len(text[:end].encode('utf-8'))
+
+
+def _next_resource(mm: mmap.mmap, pos: int) -> int:
+    """Byte offset of the first resource-shaped object after pos, or -1
+
+    Any object that follows another in an array is a candidate; instances
+    and nested attribute objects are told apart by their keys and skipped
+    whole. A false match is caught when the shard before it is parsed.
+    """
+    while True:
+        match = _NEXT_OBJECT.search(mm, pos)
+        if match is None:
+            return -1
+        start = match.start(1)
+        try:
+            value, end = _decode_object(mm, start)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            pos = start + 1
+            continue
+        if isinstance(value, dict) and _RESOURCE_KEYS <= value.keys() and isinstance(value['instances'], list):
+            return start
+        pos = end
+
+
+def _shard_ranges(mm: mmap.mmap, start: int, shards: int) -> List[Tuple[int, int]]:
+    """Split mm[start:] into up to ``shards`` ranges that begin at a resource"""
+    size = len(mm)
+    step = (size - start) // shards
+    boundaries = [start]
+    for i in range(1, shards):
+        boundary = _next_resource(mm, max(start + i * step, boundaries[-1] + 1))
+        if boundary < 0:
+            break
+        if boundary > boundaries[-1]:
+            boundaries.append(boundary)
+    boundaries.append(size)
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def _iter_shard_instances(
+    text: str,
+    last: bool
+) -> Iterator[Tuple[Dict[str, Any], int, Dict[str, Any]]]:
+    """(resource, index, instance) tuples of the resources in one range
+
+    Every range but the last must end exactly where the next resource
+    begins; the last one ends at the array's closing bracket.
+    """
+    decoder = json.JSONDecoder()
+    pos = _WHITESPACE.match(text).end()
+    while pos < len(text):
+        if text[pos] == ']':
+            if not last:
+                raise ValueError("resources array ended inside a shard")
+            return
+        resource, pos = decoder.raw_decode(text, pos)
+        if not isinstance(resource, dict):
+            raise ValueError("resource is not an object")
+        for idx, instance in enumerate(resource.get('instances', [])):
+            yield resource, idx, instance
+        pos = _WHITESPACE.match(text, pos).end()
+        if text[pos:pos + 1] == ',':
+            pos = _WHITESPACE.match(text, pos + 1).end()
+        elif text[pos:pos + 1] != ']':
+            raise ValueError(f"unexpected data after resource at {pos}")
+    if last:
+        raise ValueError("resources array is not closed")
+
+
+def _extract_shard(path: str, start: int, end: int, last: bool) -> AssetInventory:
+    """Worker: extract the assets of the resources in bytes [start, end) of path"""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = mm[start:end].decode('utf-8')
+
+    failure: List[Exception] = []
+
+    def instances():
+        try:
+            yield from _iter_shard_instances(text, last)
+        except Exception as e:
+            failure.append(e)
+
+    inventory = AssetInventory(iter_instance_assets(instances()))
+    if failure:
+        raise failure[0]
+    return inventory
+
+
+def _pool(workers: int):
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # forkserver children do not inherit the parent's threads or heap
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context)
+
+
+def _shared_state(tfstate: Union[str, os.PathLike]) -> Union[str, StateFile]:
+    """A path as a StateFile keeping its decoded copy, so a serial fallback reuses it
+
+    A ``str`` naming a file is a path too; any other ``str`` is base64 content.
+    """
+    tfstate = _state_source(tfstate)
+    if isinstance(tfstate, os.PathLike) and not isinstance(tfstate, StateFile):
+        return StateFile(tfstate)
+    return tfstate
+
+
+def _release_state(shared: Union[str, StateFile], tfstate: Union[str, os.PathLike]):
+    """Close the StateFile ``_shared_state`` opened, leaving a caller's own one open"""
+    if shared is not tfstate and isinstance(shared, StateFile):
+        shared.close()
+
+
+def iter_shards(tfstate: Union[str, StateFile], workers: int) -> Iterator[AssetInventory]:
+    """Extract a state in shards on ``workers`` processes, yielding them in order
+
+    ``tfstate`` is a StateFile or in-memory base64 content, as returned by
+    ``_shared_state``. Raises Unshardable when the state cannot be split
+    (too small, or no resources array where expected); an error in any
+    shard propagates.
+    """
+    if isinstance(tfstate, str) and len(tfstate) * 3 // 4 < 2 * MIN_SHARD_BYTES:
+        raise Unshardable("state too small to shard")
+    with _decoded_file(tfstate) as path:
+        with span('parallel.split') as split:
+            with open(path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < 2 * MIN_SHARD_BYTES:
+                    raise Unshardable("state too small to shard")
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    start = _resources_offset(mm)
+                    if start < 0:
+                        raise Unshardable("no top-level resources array found")
+                    shards = min(workers * SHARDS_PER_WORKER, (size - start) // MIN_SHARD_BYTES)
+                    ranges = _shard_ranges(mm, start, max(shards, 1))
+            split.set(shards=len(ranges), workers=workers)
+        if len(ranges) < 2:
+            raise Unshardable("no resource boundaries to shard at")
+
+        with _pool(min(workers, len(ranges))) as executor:
+            futures = [
+                executor.submit(_extract_shard, path, start, end, i == len(ranges) - 1)
+                for i, (start, end) in enumerate(ranges)
+            ]
+            try:
+                for future in futures:
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+
+def extract_sharded(tfstate: Union[str, os.PathLike], workers: int) -> AssetInventory:
+    """Whole AssetInventory from sharded extraction, or serial if sharding fails"""
+    shared = _shared_state(tfstate)
+    try:
+        inventory = AssetInventory()
+        try:
+            for shard in iter_shards(shared, workers):
+                inventory.extend(shard)
+        except Exception as e:
+            _fall_back(e)
+            return AssetInventory(iter_instance_assets(iter_resource_instances(shared)))
+        return inventory
+    finally:
+        _release_state(shared, tfstate)
+
+
+def iter_sharded(tfstate: Union[str, os.PathLike], workers: int) -> Iterator[Any]:
+    """Assets from sharded extraction in state order, finishing serially on failure"""
+    shared = _shared_state(tfstate)
+    yielded = 0
+    try:
+        try:
+            for shard in iter_shards(shared, workers):
+                yield from shard
+                yielded += len(shard)
+        except Exception as e:
+            _fall_back(e)
+            serial = iter_instance_assets(iter_resource_instances(shared))
+            yield from itertools.islice(serial, yielded, None)
+    finally:
+        _release_state(shared, tfstate)
+
+
+def _fall_back(error: Exception):
+    if not isinstance(error, Unshardable):
+        print(f"⚠️  Warning: Parallel inventory extraction failed, extracting serially: {error}")
@@ -0,0 +1,438 @@
+"""Per-stage timing spans and Chrome trace export
+
+Pipeline stages are wrapped in ``span(name)`` blocks (or decorated with
+``traced``). While no profiler is running, ``span`` returns a shared no-op
+object, so instrumented code costs a global lookup and two method calls
+per span. ``start()`` installs a Profiler; it records every span with its
+thread, duration and arguments (bytes read, decoded, written, sent and
+received, HTTP status), the process's peak RSS at the end of each stage,
+and tracemalloc peak memory when ``memory`` is set. ``Profiler.write``
+exports the Chrome trace event format, which chrome://tracing, Perfetto
+and speedscope open, and OpenTelemetry tooling can import.
+
+Listeners (see ``listen``) are told about every span as it closes and
+about counts as they accumulate inside open spans (``count_chunks``,
+``count_items``); ``metrics`` builds its throughput counters and progress
+line on them. A profiler started only for listeners keeps no events.
+
+Memory is process-wide: a span's ``alloc_peak_bytes`` is the highest
+traced allocation total above its start reached while it was open,
+including what concurrent threads allocated. tracemalloc slows Python
+code down several times over, so it is off by default and timings should
+only be compared between runs profiled the same way.
+"""
+
+import functools
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+_active: Optional['Profiler'] = None
+
+# Items counted between listener notifications in Span.count_items
+PROGRESS_ITEMS = 1024
+
+
+class _NullSpan:
+    """Span used while profiling is off; every method is a no-op"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullSpan':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return None
+
+    def set(self, **args):
+        pass
+
+    def add(self, key: str, amount: int):
+        pass
+
+    def count_chunks(self, chunks: Iterable[bytes], key: str, seconds_key: Optional[str] = None) -> Iterable[bytes]:
+        return chunks
+
+    def count_body(self, body: Any, key: str, seconds_key: Optional[str] = None) -> Any:
+        return body
+
+    def count_items(self, items: Iterable, key: str) -> Iterable:
+        return items
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """One timed block; arguments set on it end up in the trace"""
+
+    __slots__ = ('profiler', 'name', 'category', 'args', 'start', 'traced', 'peak')
+
+    def __init__(self, profiler: 'Profiler', name: str, category: str, args: Dict[str, Any]):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0
+        self.traced = 0
+        self.peak = 0
+
+    def __enter__(self) -> 'Span':
+        self.profiler._open(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.profiler._close(self, end)
+        return None
+
+    def set(self, **args):
+        self.args.update(args)
+
+    def add(self, key: str, amount: int):
+        self.args[key] = self.args.get(key, 0) + amount
+
+    def count_chunks(self, chunks: Iterable[bytes], key: str, seconds_key: Optional[str] = None) -> Iterator[bytes]:
+        """Pass chunks through, adding their size to argument key
+
+        With seconds_key, the time from asking for the first chunk to the
+        last one being consumed is kept as that argument.
+        """
+        self.args[key] = 0
+        listeners = self.profiler.listeners
+        started = time.perf_counter_ns()
+        for chunk in chunks:
+            self.args[key] += len(chunk)
+            for listener in listeners:
+                listener.progress(self, key, len(chunk))
+            yield chunk
+        if seconds_key is not None:
+            self.args[seconds_key] = (time.perf_counter_ns() - started) / 1e9
+
+    def count_body(self, body: Any, key: str, seconds_key: Optional[str] = None) -> Any:
+        """Count a request body given as bytes or a callable returning chunks
+
+        Only a chunked body can be timed; bytes go out in one write.
+        """
+        if callable(body):
+            return lambda: self.count_chunks(body(), key, seconds_key)
+        self.args[key] = len(body) if body is not None else 0
+        return body
+
+    def count_items(self, items: Iterable, key: str) -> Iterator:
+        """Pass items through, counting them in argument key
+
+        Listeners hear about every ``PROGRESS_ITEMS`` items rather than each.
+        """
+        listeners = self.profiler.listeners
+        count = 0
+        for item in items:
+            count += 1
+            if not count % PROGRESS_ITEMS:
+                for listener in listeners:
+                    listener.progress(self, key, PROGRESS_ITEMS)
+            yield item
+        self.args[key] = count
+
+
+def format_bytes(size: float) -> str:
+    """Human-readable byte count, e.g. 1.5 MB"""
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f'{size:.0f} {unit}' if unit == 'B' else f'{size:.1f} {unit}'
+        size /= 1024
+    return ''
+
+
+# Byte counts shown by Profiler.summary_lines, with their labels
+_SUMMARY_BYTES = (
+    ('bytes', 'read'),
+    ('decoded_bytes', 'decoded'),
+    ('request_bytes', 'sent'),
+    ('response_bytes', 'received'),
+    ('bytes_written', 'written'),
+    ('alloc_peak_bytes', 'peak'),
+    ('max_rss_bytes', 'max RSS'),
+)
+
+
+def _max_rss_bytes() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+class Profiler:
+    """Collects spans from all threads until written out
+
+    With ``record`` unset, spans are only passed on to the listeners.
+    """
+
+    def __init__(self, memory: bool = False, record: bool = True):
+        self.memory = memory
+        self.record = record
+        self.listeners: List[Any] = []
+        self.events: List[Dict[str, Any]] = []
+        self.origin = time.perf_counter_ns()
+        self.pid = os.getpid()
+        self._lock = threading.Lock()
+        self._open_spans: List[Span] = []
+        self._threads: Dict[int, str] = {}
+        self._local = threading.local()
+        if memory:
+            import tracemalloc
+
+            self._tracemalloc = tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+
+    def span(self, name: str, category: str = 'stage', **args) -> Span:
+        return Span(self, name, category, args)
+
+    def _fold_peak(self):
+        # tracemalloc keeps one process-wide peak; hand it to every open span
+        # before resetting it, so nested and concurrent spans all see it
+        current, peak = self._tracemalloc.get_traced_memory()
+        for span in self._open_spans:
+            if peak > span.peak:
+                span.peak = peak
+        self._tracemalloc.reset_peak()
+        return current
+
+    def current(self) -> Optional[Span]:
+        """Innermost open span of the calling thread"""
+        stack = getattr(self._local, 'stack', None)
+        return stack[-1] if stack else None
+
+    def _open(self, span: Span):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(span)
+        if not self.memory:
+            return
+        with self._lock:
+            current = self._fold_peak()
+            span.traced = span.peak = current
+            self._open_spans.append(span)
+
+    def _close(self, span: Span, end: int):
+        thread = threading.current_thread()
+        self._local.stack.remove(span)
+        args = span.args
+        if self.memory:
+            with self._lock:
+                self._fold_peak()
+                self._open_spans.remove(span)
+            args['alloc_peak_bytes'] = span.peak - span.traced
+        if span.category == 'stage':
+            rss = _max_rss_bytes()
+            if rss is not None:
+                args['max_rss_bytes'] = rss
+        for listener in self.listeners:
+            listener.span_closed(span, (end - span.start) / 1e9)
+        if not self.record:
+            return
+        event = {
+            'name': span.name,
+            'cat': span.category,
+            'ph': 'X',
+            'ts': (span.start - self.origin) / 1000,
+            'dur': (end - span.start) / 1000,
+            'pid': self.pid,
+            'tid': thread.ident,
+            'args': args,
+        }
+        with self._lock:
+            self._threads.setdefault(thread.ident, thread.name)
+            self.events.append(event)
+
+    def totals(self) -> Dict[str, Dict[str, Any]]:
+        """Per span name: count, total milliseconds, summed byte counts and peak allocation"""
+        totals: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            events = list(self.events)
+        for event in events:
+            entry = totals.setdefault(event['name'], {'count': 0, 'ms': 0.0})
+            entry['count'] += 1
+            entry['ms'] += event['dur'] / 1000
+            for key, value in event['args'].items():
+                if 'bytes' not in key or not isinstance(value, int) or isinstance(value, bool):
+                    continue
+                if key in ('alloc_peak_bytes', 'max_rss_bytes'):
+                    entry[key] = max(entry.get(key, 0), value)
+                else:
+                    entry[key] = entry.get(key, 0) + value
+        return totals
+
+    def write(self, path: Union[str, Path]) -> int:
+        """Write the Chrome trace JSON; returns the number of spans"""
+        from .artifacts import atomic_write
+        from .jsonstream import write_json
+
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self._threads)
+        metadata = [{
+            'name': 'process_name', 'ph': 'M', 'pid': self.pid, 'tid': 0,
+            'args': {'name': Path(sys.argv[0]).name or 'python'},
+        }] + [{
+            'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': ident, 'args': {'name': name},
+        } for ident, name in threads.items()]
+        trace = {
+            'traceEvents': metadata + sorted(events, key=lambda event: event['ts']),
+            'displayTimeUnit': 'ms',
+            'otherData': {
+                'command': ' '.join(sys.argv),
+                'python': sys.version.split()[0],
+                'tracemalloc': self.memory,
+                'totals': self.totals(),
+            },
+        }
+        with atomic_write(Path(path), 'w', encoding='utf-8') as f:
+            write_json(trace, f, indent=None)
+        return len(events)
+
+    def summary_lines(self, limit: int = 12) -> List[str]:
+        """Span names by total time, one formatted line each"""
+        lines = []
+        ranked = sorted(self.totals().items(), key=lambda item: -item[1]['ms'])
+        for name, entry in ranked[:limit]:
+            details = [f"{entry['count']}x"]
+            for key, label in _SUMMARY_BYTES:
+                if entry.get(key):
+                    details.append(f"{label} {format_bytes(entry[key])}")
+            lines.append(f"   {name:<32} {entry['ms']:9.1f} ms  {', '.join(details)}")
+        return lines
+
+
+def start(memory: bool = False) -> Profiler:
+    """Install a process-wide profiler; spans are recorded from now on
+
+    Listeners of the profiler it replaces carry over.
+    """
+    global _active
+    profiler = Profiler(memory)
+    if _active is not None:
+        profiler.listeners = _active.listeners
+    _active = profiler
+    return profiler
+
+
+def stop() -> Optional[Profiler]:
+    """Uninstall the profiler and return it; its listeners keep listening"""
+    global _active
+    profiler, _active = _active, None
+    if profiler is not None:
+        if profiler.memory:
+            profiler._tracemalloc.stop()
+        if profiler.listeners:
+            _active = Profiler(record=False)
+            _active.listeners = profiler.listeners
+    return profiler
+
+
+def enable(path: Union[str, Path], memory: bool = False) -> Profiler:
+    """Profile the rest of the run and write the trace to path at exit
+
+    Everything is recorded inside one root span named after the script, so
+    the trace is written however the CLI exits.
+    """
+    import atexit
+
+    profiler = start(memory)
+    root = profiler.span(Path(sys.argv[0]).name or 'python')
+    root.__enter__()
+
+    def finish():
+        root.__exit__(None, None, None)
+        stop()
+        count = profiler.write(path)
+        print(f"\n⏱️  Profile: {path} ({count} spans)")
+        for line in profiler.summary_lines():
+            print(line)
+
+    atexit.register(finish)
+    return profiler
+
+
+def listen(listener: Any) -> Profiler:
+    """Pass spans to listener from now on
+
+    A listener has ``span_closed(span, seconds)``, called as each span ends,
+    and ``progress(span, key, amount)``, called as a count grows inside an
+    open span; both may run on any thread. Without a running profiler, one
+    that records nothing is started.
+    """
+    global _active
+    if _active is None:
+        _active = Profiler(record=False)
+    _active.listeners.append(listener)
+    return _active
+
+
+def enabled() -> bool:
+    return _active is not None
+
+
+def span(name: str, category: str = 'stage', **args) -> Union[Span, _NullSpan]:
+    """Time a block: ``with span('read') as s: ...; s.set(bytes=n)``"""
+    profiler = _active
+    if profiler is None:
+        return _NULL_SPAN
+    return profiler.span(name, category, **args)
+
+
+def annotate(**args):
+    """Set arguments on the calling thread's innermost span"""
+    profiler = _active
+    current = profiler.current() if profiler is not None else None
+    if current is not None:
+        current.args.update(args)
+
+
+def wrote(path: Union[str, Path]):
+    """Add the size of a file just written to the innermost span's ``bytes_written``"""
+    profiler = _active
+    current = profiler.current() if profiler is not None else None
+    if current is None:
+        return
+    try:
+        current.add('bytes_written', os.path.getsize(path))
+    except OSError:
+        pass
+
+
+def count_items(items: Iterable, key: str) -> Iterable:
+    """Count items passing through into the innermost span's argument key"""
+    profiler = _active
+    current = profiler.current() if profiler is not None else None
+    if current is None:
+        return items
+    return current.count_items(items, key)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Decorator running a function inside a span named after it"""
+    def decorate(func: Callable) -> Callable:
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = _active
+            if profiler is None:
+                return func(*args, **kwargs)
+            with profiler.span(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
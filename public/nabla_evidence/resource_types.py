@@ -0,0 +1,652 @@
+"""Field-projection specs for common Terraform resource types
+
+``PROVIDERS`` maps a resource type prefix to the cloud provider name and
+the columns every resource of that provider gets. ``RESOURCE_TYPES`` maps
+an exact resource type to ``(display_name, fields)`` for the extra columns.
+
+``fields`` is a space-separated list of ``column=path`` projections, or
+just ``column`` when the attribute has the same name. A path is dotted;
+nested blocks stored as lists are entered through their first element, a
+numeric segment indexes a list, and ``a|b`` takes the first path present.
+In a provider's column list, ``asset_type`` and ``display_name`` mark where
+those go. Columns must come from ``ASSET_COLUMNS`` in ``inventory``.
+
+``asset_type`` is the resource type itself, except for the types in
+``ASSET_TYPES`` that have always been reported under a label; the readable
+name from ``RESOURCE_TYPES`` goes in ``display_name``.
+"""
+
+PROVIDERS = {
+    'aws_': ('AWS', 'id=id|arn region=region|availability_zone tags asset_type display_name'),
+    'azurerm_': ('Azure', 'asset_type display_name id location resource_group=resource_group_name tags'),
+    'google_': ('GCP', 'asset_type display_name id zone project labels'),
+}
+
+ASSET_TYPES = {
+    'aws_instance': 'EC2 Instance',
+    'aws_s3_bucket': 'S3 Bucket',
+    'aws_db_instance': 'RDS Database',
+}
+
+RESOURCE_TYPES = {
+    # AWS compute
+    'aws_instance': ('EC2 Instance', 'instance_type ami public_ip private_ip subnet_id'),
+    'aws_spot_instance_request': ('EC2 Spot Instance', 'instance_type ami public_ip private_ip subnet_id'),
+    'aws_launch_template': ('Launch Template', 'name instance_type ami=image_id'),
+    'aws_launch_configuration': ('Launch Configuration', 'name instance_type ami=image_id'),
+    'aws_autoscaling_group': ('Auto Scaling Group', 'name'),
+    'aws_autoscaling_policy': ('Auto Scaling Policy', 'name'),
+    'aws_ami': ('AMI', 'name'),
+    'aws_key_pair': ('Key Pair', 'name=key_name'),
+    'aws_placement_group': ('Placement Group', 'name'),
+    'aws_eip': ('Elastic IP', 'public_ip private_ip'),
+    'aws_eip_association': ('Elastic IP Association', 'public_ip private_ip=private_ip_address'),
+    'aws_ebs_volume': ('EBS Volume', 'storage_encrypted=encrypted kms_key=kms_key_id'),
+    'aws_ebs_snapshot': ('EBS Snapshot', 'storage_encrypted=encrypted kms_key=kms_key_id'),
+    'aws_volume_attachment': ('EBS Volume Attachment', ''),
+    'aws_network_interface': ('Network Interface', 'subnet_id private_ip'),
+    'aws_lambda_function': ('Lambda Function', 'name=function_name runtime version kms_key=kms_key_arn'),
+    'aws_lambda_alias': ('Lambda Alias', 'name version=function_version'),
+    'aws_lambda_permission': ('Lambda Permission', 'name=function_name'),
+    'aws_lambda_event_source_mapping': ('Lambda Event Source Mapping', 'name=function_name'),
+    'aws_lambda_layer_version': ('Lambda Layer', 'name=layer_name version'),
+    'aws_lambda_function_url': ('Lambda Function URL', 'name=function_name endpoint=function_url'),
+    'aws_ecs_cluster': ('ECS Cluster', 'name'),
+    'aws_ecs_service': ('ECS Service', 'name'),
+    'aws_ecs_task_definition': ('ECS Task Definition', 'name=family version=revision'),
+    'aws_ecs_capacity_provider': ('ECS Capacity Provider', 'name'),
+    'aws_ecr_repository': ('ECR Repository', 'name endpoint=repository_url encryption=encryption_configuration.0'),
+    'aws_ecr_lifecycle_policy': ('ECR Lifecycle Policy', 'name=repository'),
+    'aws_ecr_repository_policy': ('ECR Repository Policy', 'name=repository'),
+    'aws_eks_cluster': ('EKS Cluster', 'name version endpoint vpc_id=vpc_config.vpc_id'),
+    'aws_eks_node_group': ('EKS Node Group', 'name=node_group_name version instance_type=instance_types'),
+    'aws_eks_addon': ('EKS Add-on', 'name=addon_name version=addon_version'),
+    'aws_eks_fargate_profile': ('EKS Fargate Profile', 'name=fargate_profile_name'),
+    'aws_apprunner_service': ('App Runner Service', 'name=service_name endpoint=service_url'),
+    'aws_batch_compute_environment': ('Batch Compute Environment', 'name=compute_environment_name'),
+    'aws_batch_job_queue': ('Batch Job Queue', 'name'),
+    'aws_batch_job_definition': ('Batch Job Definition', 'name'),
+    'aws_elastic_beanstalk_application': ('Elastic Beanstalk Application', 'name'),
+    'aws_elastic_beanstalk_environment': ('Elastic Beanstalk Environment', 'name endpoint=endpoint_url'),
+    'aws_emr_cluster': ('EMR Cluster', 'name version=release_label'),
+    'aws_imagebuilder_image_pipeline': ('Image Builder Pipeline', 'name'),
+    'aws_workspaces_workspace': ('WorkSpaces Workspace', 'name=user_name'),
+
+    # AWS networking
+    'aws_vpc': ('VPC', 'cidr_block'),
+    'aws_default_vpc': ('Default VPC', 'cidr_block'),
+    'aws_subnet': ('Subnet', 'vpc_id cidr_block'),
+    'aws_default_subnet': ('Default Subnet', 'vpc_id cidr_block'),
+    'aws_vpc_ipv4_cidr_block_association': ('VPC CIDR Association', 'vpc_id cidr_block'),
+    'aws_internet_gateway': ('Internet Gateway', 'vpc_id'),
+    'aws_egress_only_internet_gateway': ('Egress-Only Internet Gateway', 'vpc_id'),
+    'aws_nat_gateway': ('NAT Gateway', 'subnet_id public_ip private_ip'),
+    'aws_route_table': ('Route Table', 'vpc_id'),
+    'aws_default_route_table': ('Default Route Table', 'vpc_id'),
+    'aws_route': ('Route', 'cidr_block=destination_cidr_block'),
+    'aws_route_table_association': ('Route Table Association', 'subnet_id'),
+    'aws_main_route_table_association': ('Main Route Table Association', 'vpc_id'),
+    'aws_security_group': ('Security Group', 'name vpc_id'),
+    'aws_default_security_group': ('Default Security Group', 'vpc_id'),
+    'aws_security_group_rule': ('Security Group Rule', 'cidr_block=cidr_blocks'),
+    'aws_vpc_security_group_ingress_rule': ('Security Group Ingress Rule', 'cidr_block=cidr_ipv4'),
+    'aws_vpc_security_group_egress_rule': ('Security Group Egress Rule', 'cidr_block=cidr_ipv4'),
+    'aws_network_acl': ('Network ACL', 'vpc_id'),
+    'aws_default_network_acl': ('Default Network ACL', 'vpc_id'),
+    'aws_network_acl_rule': ('Network ACL Rule', 'cidr_block'),
+    'aws_vpc_endpoint': ('VPC Endpoint', 'name=service_name vpc_id'),
+    'aws_vpc_endpoint_service': ('VPC Endpoint Service', 'name=service_name'),
+    'aws_vpc_peering_connection': ('VPC Peering Connection', 'vpc_id'),
+    'aws_vpc_dhcp_options': ('VPC DHCP Options', 'name=domain_name'),
+    'aws_flow_log': ('VPC Flow Log', 'vpc_id'),
+    'aws_customer_gateway': ('Customer Gateway', 'public_ip=ip_address'),
+    'aws_vpn_gateway': ('VPN Gateway', 'vpc_id'),
+    'aws_vpn_connection': ('VPN Connection', ''),
+    'aws_ec2_transit_gateway': ('Transit Gateway', ''),
+    'aws_ec2_transit_gateway_vpc_attachment': ('Transit Gateway VPC Attachment', 'vpc_id subnet_id=subnet_ids'),
+    'aws_ec2_transit_gateway_route_table': ('Transit Gateway Route Table', ''),
+    'aws_dx_connection': ('Direct Connect Connection', 'name'),
+    'aws_lb': ('Load Balancer', 'name endpoint=dns_name vpc_id'),
+    'aws_alb': ('Load Balancer', 'name endpoint=dns_name vpc_id'),
+    'aws_lb_listener': ('Load Balancer Listener', ''),
+    'aws_alb_listener': ('Load Balancer Listener', ''),
+    'aws_lb_listener_rule': ('Load Balancer Listener Rule', ''),
+    'aws_lb_target_group': ('Target Group', 'name vpc_id'),
+    'aws_alb_target_group': ('Target Group', 'name vpc_id'),
+    'aws_lb_target_group_attachment': ('Target Group Attachment', ''),
+    'aws_elb': ('Classic Load Balancer', 'name endpoint=dns_name'),
+    'aws_cloudfront_distribution': ('CloudFront Distribution', 'endpoint=domain_name'),
+    'aws_cloudfront_origin_access_identity': ('CloudFront Origin Access Identity', ''),
+    'aws_cloudfront_origin_access_control': ('CloudFront Origin Access Control', 'name'),
+    'aws_cloudfront_function': ('CloudFront Function', 'name runtime'),
+    'aws_cloudfront_cache_policy': ('CloudFront Cache Policy', 'name'),
+    'aws_route53_zone': ('Route 53 Hosted Zone', 'name vpc_id=vpc.vpc_id'),
+    'aws_route53_record': ('Route 53 Record', 'name'),
+    'aws_route53_health_check': ('Route 53 Health Check', 'endpoint=fqdn'),
+    'aws_route53_resolver_endpoint': ('Route 53 Resolver Endpoint', 'name'),
+    'aws_globalaccelerator_accelerator': ('Global Accelerator', 'name'),
+    'aws_networkfirewall_firewall': ('Network Firewall', 'name vpc_id'),
+    'aws_networkfirewall_firewall_policy': ('Network Firewall Policy', 'name'),
+    'aws_service_discovery_private_dns_namespace': ('Cloud Map Namespace', 'name vpc_id=vpc'),
+    'aws_service_discovery_service': ('Cloud Map Service', 'name'),
+    'aws_api_gateway_rest_api': ('API Gateway REST API', 'name'),
+    'aws_api_gateway_stage': ('API Gateway Stage', 'name=stage_name endpoint=invoke_url'),
+    'aws_api_gateway_deployment': ('API Gateway Deployment', ''),
+    'aws_api_gateway_resource': ('API Gateway Resource', 'name=path'),
+    'aws_api_gateway_method': ('API Gateway Method', ''),
+    'aws_api_gateway_integration': ('API Gateway Integration', ''),
+    'aws_api_gateway_domain_name': ('API Gateway Domain Name', 'name=domain_name'),
+    'aws_api_gateway_usage_plan': ('API Gateway Usage Plan', 'name'),
+    'aws_api_gateway_api_key': ('API Gateway API Key', 'name'),
+    'aws_api_gateway_authorizer': ('API Gateway Authorizer', 'name'),
+    'aws_apigatewayv2_api': ('API Gateway HTTP API', 'name endpoint=api_endpoint'),
+    'aws_apigatewayv2_stage': ('API Gateway v2 Stage', 'name endpoint=invoke_url'),
+    'aws_apigatewayv2_route': ('API Gateway v2 Route', 'name=route_key'),
+    'aws_apigatewayv2_integration': ('API Gateway v2 Integration', ''),
+    'aws_apigatewayv2_domain_name': ('API Gateway v2 Domain Name', 'name=domain_name'),
+    'aws_acm_certificate': ('ACM Certificate', 'name=domain_name'),
+    'aws_acm_certificate_validation': ('ACM Certificate Validation', ''),
+    'aws_transfer_server': ('Transfer Family Server', 'endpoint'),
+
+    # AWS storage
+    'aws_s3_bucket': (
+        'S3 Bucket',
+        'bucket_name=bucket versioning=versioning.enabled encryption=server_side_encryption_configuration.0'
+    ),
+    'aws_s3_bucket_versioning': ('S3 Bucket Versioning', 'bucket_name=bucket versioning=versioning_configuration.status'),
+    'aws_s3_bucket_server_side_encryption_configuration': (
+        'S3 Bucket Encryption',
+        'bucket_name=bucket encryption=rule.0 kms_key=rule.apply_server_side_encryption_by_default.kms_master_key_id'
+    ),
+    'aws_s3_bucket_public_access_block': ('S3 Public Access Block', 'bucket_name=bucket'),
+    'aws_s3_bucket_policy': ('S3 Bucket Policy', 'bucket_name=bucket'),
+    'aws_s3_bucket_acl': ('S3 Bucket ACL', 'bucket_name=bucket'),
+    'aws_s3_bucket_logging': ('S3 Bucket Logging', 'bucket_name=bucket'),
+    'aws_s3_bucket_lifecycle_configuration': ('S3 Lifecycle Configuration', 'bucket_name=bucket'),
+    'aws_s3_bucket_ownership_controls': ('S3 Ownership Controls', 'bucket_name=bucket'),
+    'aws_s3_bucket_notification': ('S3 Bucket Notification', 'bucket_name=bucket'),
+    'aws_s3_bucket_replication_configuration': ('S3 Replication Configuration', 'bucket_name=bucket'),
+    'aws_s3_bucket_website_configuration': ('S3 Website Configuration', 'bucket_name=bucket endpoint=website_endpoint'),
+    'aws_s3_bucket_cors_configuration': ('S3 CORS Configuration', 'bucket_name=bucket'),
+    'aws_s3_object': ('S3 Object', 'name=key bucket_name=bucket kms_key=kms_key_id'),
+    'aws_s3_bucket_object': ('S3 Object', 'name=key bucket_name=bucket kms_key=kms_key_id'),
+    'aws_s3_access_point': ('S3 Access Point', 'name bucket_name=bucket vpc_id=vpc_configuration.vpc_id'),
+    'aws_efs_file_system': ('EFS File System', 'name=creation_token storage_encrypted=encrypted kms_key=kms_key_id'),
+    'aws_efs_mount_target': ('EFS Mount Target', 'subnet_id private_ip=ip_address'),
+    'aws_efs_access_point': ('EFS Access Point', ''),
+    'aws_fsx_lustre_file_system': ('FSx for Lustre File System', 'subnet_id=subnet_ids kms_key=kms_key_id'),
+    'aws_fsx_windows_file_system': ('FSx for Windows File System', 'subnet_id=subnet_ids kms_key=kms_key_id'),
+    'aws_backup_vault': ('Backup Vault', 'name kms_key=kms_key_arn'),
+    'aws_backup_plan': ('Backup Plan', 'name'),
+    'aws_backup_selection': ('Backup Selection', 'name'),
+    'aws_glacier_vault': ('Glacier Vault', 'name'),
+    'aws_datasync_task': ('DataSync Task', 'name'),
+
+    # AWS databases and analytics
+    'aws_db_instance': (
+        'RDS Database',
+        'engine engine_version instance_class storage_encrypted publicly_accessible endpoint kms_key=kms_key_id'
+    ),
+    'aws_rds_cluster': (
+        'RDS Cluster',
+        'name=cluster_identifier engine engine_version storage_encrypted endpoint kms_key=kms_key_id'
+    ),
+    'aws_rds_cluster_instance': ('RDS Cluster Instance', 'engine engine_version instance_class publicly_accessible endpoint'),
+    'aws_db_subnet_group': ('DB Subnet Group', 'name subnet_id=subnet_ids'),
+    'aws_db_parameter_group': ('DB Parameter Group', 'name'),
+    'aws_rds_cluster_parameter_group': ('RDS Cluster Parameter Group', 'name'),
+    'aws_db_option_group': ('DB Option Group', 'name engine=engine_name engine_version=major_engine_version'),
+    'aws_db_snapshot': ('DB Snapshot', 'engine engine_version storage_encrypted=encrypted kms_key=kms_key_id'),
+    'aws_db_proxy': ('RDS Proxy', 'name engine=engine_family endpoint'),
+    'aws_dynamodb_table': (
+        'DynamoDB Table',
+        'name encryption=server_side_encryption.0 kms_key=server_side_encryption.kms_key_arn'
+    ),
+    'aws_dynamodb_global_table': ('DynamoDB Global Table', 'name'),
+    'aws_elasticache_cluster': (
+        'ElastiCache Cluster',
+        'name=cluster_id engine engine_version instance_class=node_type'
+    ),
+    'aws_elasticache_replication_group': (
+        'ElastiCache Replication Group',
+        'name=replication_group_id engine engine_version instance_class=node_type '
+        'storage_encrypted=at_rest_encryption_enabled endpoint=primary_endpoint_address kms_key=kms_key_id'
+    ),
+    'aws_elasticache_subnet_group': ('ElastiCache Subnet Group', 'name subnet_id=subnet_ids'),
+    'aws_elasticache_parameter_group': ('ElastiCache Parameter Group', 'name'),
+    'aws_memorydb_cluster': ('MemoryDB Cluster', 'name engine_version instance_class=node_type kms_key=kms_key_arn'),
+    'aws_redshift_cluster': (
+        'Redshift Cluster',
+        'name=cluster_identifier instance_class=node_type storage_encrypted=encrypted '
+        'publicly_accessible endpoint kms_key=kms_key_id'
+    ),
+    'aws_redshift_subnet_group': ('Redshift Subnet Group', 'name subnet_id=subnet_ids'),
+    'aws_docdb_cluster': (
+        'DocumentDB Cluster',
+        'name=cluster_identifier engine engine_version storage_encrypted endpoint kms_key=kms_key_id'
+    ),
+    'aws_docdb_cluster_instance': ('DocumentDB Instance', 'engine instance_class endpoint'),
+    'aws_neptune_cluster': (
+        'Neptune Cluster',
+        'name=cluster_identifier engine engine_version storage_encrypted endpoint kms_key=kms_key_arn'
+    ),
+    'aws_neptune_cluster_instance': ('Neptune Instance', 'engine instance_class publicly_accessible endpoint'),
+    'aws_elasticsearch_domain': (
+        'Elasticsearch Domain',
+        'name=domain_name version=elasticsearch_version storage_encrypted=encrypt_at_rest.enabled '
+        'endpoint kms_key=encrypt_at_rest.kms_key_id'
+    ),
+    'aws_opensearch_domain': (
+        'OpenSearch Domain',
+        'name=domain_name engine_version storage_encrypted=encrypt_at_rest.enabled '
+        'endpoint kms_key=encrypt_at_rest.kms_key_id'
+    ),
+    'aws_kinesis_stream': ('Kinesis Stream', 'name encryption=encryption_type kms_key=kms_key_id'),
+    'aws_kinesis_firehose_delivery_stream': ('Kinesis Firehose Stream', 'name'),
+    'aws_msk_cluster': (
+        'MSK Cluster',
+        'name=cluster_name version=kafka_version instance_class=broker_node_group_info.instance_type '
+        'kms_key=encryption_info.encryption_at_rest_kms_key_arn'
+    ),
+    'aws_mq_broker': (
+        'MQ Broker',
+        'name=broker_name engine=engine_type engine_version instance_class=host_instance_type publicly_accessible'
+    ),
+    'aws_glue_catalog_database': ('Glue Database', 'name'),
+    'aws_glue_catalog_table': ('Glue Table', 'name'),
+    'aws_glue_job': ('Glue Job', 'name version=glue_version'),
+    'aws_glue_crawler': ('Glue Crawler', 'name'),
+    'aws_athena_workgroup': ('Athena Workgroup', 'name'),
+    'aws_athena_database': ('Athena Database', 'name bucket_name=bucket'),
+    'aws_dms_replication_instance': (
+        'DMS Replication Instance',
+        'name=replication_instance_id instance_class=replication_instance_class engine_version '
+        'publicly_accessible kms_key=kms_key_arn'
+    ),
+    'aws_dms_endpoint': ('DMS Endpoint', 'name=endpoint_id engine=engine_name'),
+    'aws_sagemaker_notebook_instance': ('SageMaker Notebook', 'name instance_type subnet_id kms_key=kms_key_id'),
+    'aws_sagemaker_endpoint': ('SageMaker Endpoint', 'name'),
+    'aws_sagemaker_model': ('SageMaker Model', 'name'),
+    'aws_sagemaker_domain': ('SageMaker Domain', 'name=domain_name vpc_id kms_key=kms_key_id'),
+
+    # AWS integration and messaging
+    'aws_sns_topic': ('SNS Topic', 'name kms_key=kms_master_key_id'),
+    'aws_sns_topic_subscription': ('SNS Subscription', 'endpoint'),
+    'aws_sns_topic_policy': ('SNS Topic Policy', ''),
+    'aws_sqs_queue': ('SQS Queue', 'name endpoint=url kms_key=kms_master_key_id'),
+    'aws_sqs_queue_policy': ('SQS Queue Policy', 'endpoint=queue_url'),
+    'aws_sfn_state_machine': ('Step Functions State Machine', 'name'),
+    'aws_cloudwatch_event_rule': ('EventBridge Rule', 'name'),
+    'aws_cloudwatch_event_target': ('EventBridge Target', 'name=rule'),
+    'aws_cloudwatch_event_bus': ('EventBridge Event Bus', 'name'),
+    'aws_scheduler_schedule': ('EventBridge Schedule', 'name'),
+    'aws_ses_domain_identity': ('SES Domain Identity', 'name=domain'),
+    'aws_ses_email_identity': ('SES Email Identity', 'name=email'),
+    'aws_sesv2_email_identity': ('SES Email Identity', 'name=email_identity'),
+    'aws_appautoscaling_target': ('Application Auto Scaling Target', ''),
+    'aws_appautoscaling_policy': ('Application Auto Scaling Policy', 'name'),
+    'aws_iot_thing': ('IoT Thing', 'name'),
+    'aws_iot_policy': ('IoT Policy', 'name'),
+    'aws_iot_topic_rule': ('IoT Topic Rule', 'name'),
+
+    # AWS identity and security
+    'aws_iam_role': ('IAM Role', 'name'),
+    'aws_iam_policy': ('IAM Policy', 'name'),
+    'aws_iam_user': ('IAM User', 'name'),
+    'aws_iam_group': ('IAM Group', 'name'),
+    'aws_iam_role_policy': ('IAM Role Inline Policy', 'name'),
+    'aws_iam_role_policy_attachment': ('IAM Role Policy Attachment', 'name=role'),
+    'aws_iam_user_policy': ('IAM User Inline Policy', 'name'),
+    'aws_iam_user_policy_attachment': ('IAM User Policy Attachment', 'name=user'),
+    'aws_iam_group_policy': ('IAM Group Inline Policy', 'name'),
+    'aws_iam_group_policy_attachment': ('IAM Group Policy Attachment', 'name=group'),
+    'aws_iam_group_membership': ('IAM Group Membership', 'name'),
+    'aws_iam_user_group_membership': ('IAM User Group Membership', 'name=user'),
+    'aws_iam_policy_attachment': ('IAM Policy Attachment', 'name'),
+    'aws_iam_instance_profile': ('IAM Instance Profile', 'name'),
+    'aws_iam_access_key': ('IAM Access Key', 'name=user'),
+    'aws_iam_user_login_profile': ('IAM User Login Profile', 'name=user'),
+    'aws_iam_account_password_policy': ('IAM Password Policy', ''),
+    'aws_iam_openid_connect_provider': ('IAM OIDC Provider', 'endpoint=url'),
+    'aws_iam_saml_provider': ('IAM SAML Provider', 'name'),
+    'aws_iam_service_linked_role': ('IAM Service-Linked Role', 'name=aws_service_name'),
+    'aws_ssoadmin_permission_set': ('IAM Identity Center Permission Set', 'name'),
+    'aws_ssoadmin_account_assignment': ('IAM Identity Center Assignment', ''),
+    'aws_kms_key': ('KMS Key', ''),
+    'aws_kms_alias': ('KMS Alias', 'name kms_key=target_key_id'),
+    'aws_kms_grant': ('KMS Grant', 'name kms_key=key_id'),
+    'aws_secretsmanager_secret': ('Secrets Manager Secret', 'name kms_key=kms_key_id'),
+    'aws_secretsmanager_secret_version': ('Secrets Manager Secret Version', 'version=version_id'),
+    'aws_secretsmanager_secret_rotation': ('Secrets Manager Rotation', ''),
+    'aws_ssm_parameter': ('SSM Parameter', 'name version kms_key=key_id'),
+    'aws_ssm_document': ('SSM Document', 'name version=document_version'),
+    'aws_ssm_association': ('SSM Association', 'name'),
+    'aws_ssm_maintenance_window': ('SSM Maintenance Window', 'name'),
+    'aws_ssm_patch_baseline': ('SSM Patch Baseline', 'name'),
+    'aws_cognito_user_pool': ('Cognito User Pool', 'name'),
+    'aws_cognito_user_pool_client': ('Cognito User Pool Client', 'name'),
+    'aws_cognito_identity_pool': ('Cognito Identity Pool', 'name=identity_pool_name'),
+    'aws_cognito_user_pool_domain': ('Cognito User Pool Domain', 'name=domain'),
+    'aws_directory_service_directory': ('Directory Service Directory', 'name'),
+    'aws_guardduty_detector': ('GuardDuty Detector', ''),
+    'aws_guardduty_member': ('GuardDuty Member', ''),
+    'aws_securityhub_account': ('Security Hub Account', ''),
+    'aws_securityhub_standards_subscription': ('Security Hub Standard', 'name=standards_arn'),
+    'aws_inspector2_enabler': ('Inspector Enabler', ''),
+    'aws_macie2_account': ('Macie Account', ''),
+    'aws_accessanalyzer_analyzer': ('IAM Access Analyzer', 'name=analyzer_name'),
+    'aws_wafv2_web_acl': ('WAF Web ACL', 'name'),
+    'aws_wafv2_web_acl_association': ('WAF Web ACL Association', ''),
+    'aws_wafv2_web_acl_logging_configuration': ('WAF Logging Configuration', ''),
+    'aws_wafv2_ip_set': ('WAF IP Set', 'name'),
+    'aws_wafv2_rule_group': ('WAF Rule Group', 'name'),
+    'aws_waf_web_acl': ('WAF Classic Web ACL', 'name'),
+    'aws_shield_protection': ('Shield Protection', 'name'),
+
+    # AWS management and governance
+    'aws_cloudtrail': ('CloudTrail Trail', 'name bucket_name=s3_bucket_name kms_key=kms_key_id'),
+    'aws_cloudwatch_log_group': ('CloudWatch Log Group', 'name kms_key=kms_key_id'),
+    'aws_cloudwatch_log_stream': ('CloudWatch Log Stream', 'name'),
+    'aws_cloudwatch_log_metric_filter': ('CloudWatch Metric Filter', 'name'),
+    'aws_cloudwatch_log_subscription_filter': ('CloudWatch Subscription Filter', 'name'),
+    'aws_cloudwatch_log_resource_policy': ('CloudWatch Logs Resource Policy', 'name=policy_name'),
+    'aws_cloudwatch_metric_alarm': ('CloudWatch Alarm', 'name=alarm_name'),
+    'aws_cloudwatch_composite_alarm': ('CloudWatch Composite Alarm', 'name=alarm_name'),
+    'aws_cloudwatch_dashboard': ('CloudWatch Dashboard', 'name=dashboard_name'),
+    'aws_config_configuration_recorder': ('Config Recorder', 'name'),
+    'aws_config_configuration_recorder_status': ('Config Recorder Status', 'name'),
+    'aws_config_delivery_channel': ('Config Delivery Channel', 'name bucket_name=s3_bucket_name'),
+    'aws_config_config_rule': ('Config Rule', 'name'),
+    'aws_config_conformance_pack': ('Config Conformance Pack', 'name'),
+    'aws_organizations_organization': ('AWS Organization', ''),
+    'aws_organizations_account': ('AWS Account', 'name'),
+    'aws_organizations_organizational_unit': ('Organizational Unit', 'name'),
+    'aws_organizations_policy': ('Organizations Policy', 'name'),
+    'aws_organizations_policy_attachment': ('Organizations Policy Attachment', ''),
+    'aws_ram_resource_share': ('RAM Resource Share', 'name'),
+    'aws_servicecatalog_portfolio': ('Service Catalog Portfolio', 'name'),
+    'aws_cloudformation_stack': ('CloudFormation Stack', 'name'),
+    'aws_xray_sampling_rule': ('X-Ray Sampling Rule', 'name=rule_name'),
+    'aws_grafana_workspace': ('Managed Grafana Workspace', 'name endpoint'),
+    'aws_prometheus_workspace': ('Managed Prometheus Workspace', 'name=alias endpoint=prometheus_endpoint'),
+    'aws_codebuild_project': ('CodeBuild Project', 'name kms_key=encryption_key'),
+    'aws_codepipeline': ('CodePipeline', 'name'),
+    'aws_codecommit_repository': ('CodeCommit Repository', 'name=repository_name'),
+    'aws_codedeploy_app': ('CodeDeploy Application', 'name'),
+    'aws_codedeploy_deployment_group': ('CodeDeploy Deployment Group', 'name=deployment_group_name'),
+    'aws_codestarconnections_connection': ('CodeStar Connection', 'name'),
+
+    # Azure compute and containers
+    'azurerm_linux_virtual_machine': (
+        'Linux Virtual Machine',
+        'name instance_type=size private_ip=private_ip_address public_ip=public_ip_address'
+    ),
+    'azurerm_windows_virtual_machine': (
+        'Windows Virtual Machine',
+        'name instance_type=size private_ip=private_ip_address public_ip=public_ip_address'
+    ),
+    'azurerm_virtual_machine': ('Virtual Machine', 'name instance_type=vm_size'),
+    'azurerm_linux_virtual_machine_scale_set': ('Linux VM Scale Set', 'name sku'),
+    'azurerm_windows_virtual_machine_scale_set': ('Windows VM Scale Set', 'name sku'),
+    'azurerm_virtual_machine_extension': ('VM Extension', 'name version=type_handler_version'),
+    'azurerm_availability_set': ('Availability Set', 'name'),
+    'azurerm_image': ('VM Image', 'name'),
+    'azurerm_managed_disk': ('Managed Disk', 'name sku=storage_account_type kms_key=disk_encryption_set_id'),
+    'azurerm_kubernetes_cluster': ('AKS Cluster', 'name version=kubernetes_version endpoint=fqdn'),
+    'azurerm_kubernetes_cluster_node_pool': ('AKS Node Pool', 'name instance_type=vm_size'),
+    'azurerm_container_registry': (
+        'Container Registry',
+        'name sku endpoint=login_server publicly_accessible=public_network_access_enabled'
+    ),
+    'azurerm_container_group': ('Container Instance Group', 'name public_ip=ip_address'),
+    'azurerm_container_app': ('Container App', 'name'),
+    'azurerm_container_app_environment': ('Container App Environment', 'name'),
+    'azurerm_service_plan': ('App Service Plan', 'name sku=sku_name'),
+    'azurerm_app_service_plan': ('App Service Plan', 'name'),
+    'azurerm_linux_web_app': (
+        'Linux Web App',
+        'name endpoint=default_hostname publicly_accessible=public_network_access_enabled'
+    ),
+    'azurerm_windows_web_app': (
+        'Windows Web App',
+        'name endpoint=default_hostname publicly_accessible=public_network_access_enabled'
+    ),
+    'azurerm_app_service': ('App Service', 'name endpoint=default_site_hostname'),
+    'azurerm_linux_function_app': ('Linux Function App', 'name endpoint=default_hostname'),
+    'azurerm_windows_function_app': ('Windows Function App', 'name endpoint=default_hostname'),
+    'azurerm_function_app': ('Function App', 'name version endpoint=default_hostname'),
+    'azurerm_logic_app_workflow': ('Logic App Workflow', 'name'),
+    'azurerm_automation_account': ('Automation Account', 'name sku=sku_name'),
+
+    # Azure networking
+    'azurerm_resource_group': ('Resource Group', 'name'),
+    'azurerm_virtual_network': ('Virtual Network', 'name cidr_block=address_space'),
+    'azurerm_subnet': ('Subnet', 'name cidr_block=address_prefixes'),
+    'azurerm_network_security_group': ('Network Security Group', 'name'),
+    'azurerm_network_security_rule': ('Network Security Rule', 'name'),
+    'azurerm_subnet_network_security_group_association': ('Subnet NSG Association', 'subnet_id'),
+    'azurerm_network_interface': ('Network Interface', 'name private_ip=private_ip_address'),
+    'azurerm_public_ip': ('Public IP', 'name public_ip=ip_address sku'),
+    'azurerm_nat_gateway': ('NAT Gateway', 'name sku=sku_name'),
+    'azurerm_route_table': ('Route Table', 'name'),
+    'azurerm_route': ('Route', 'name cidr_block=address_prefix'),
+    'azurerm_virtual_network_peering': ('Virtual Network Peering', 'name'),
+    'azurerm_virtual_network_gateway': ('Virtual Network Gateway', 'name sku'),
+    'azurerm_private_endpoint': ('Private Endpoint', 'name subnet_id'),
+    'azurerm_private_dns_zone': ('Private DNS Zone', 'name'),
+    'azurerm_private_dns_zone_virtual_network_link': ('Private DNS Zone Link', 'name'),
+    'azurerm_dns_zone': ('DNS Zone', 'name'),
+    'azurerm_dns_a_record': ('DNS A Record', 'name'),
+    'azurerm_dns_cname_record': ('DNS CNAME Record', 'name'),
+    'azurerm_lb': ('Load Balancer', 'name sku'),
+    'azurerm_lb_backend_address_pool': ('Load Balancer Backend Pool', 'name'),
+    'azurerm_lb_rule': ('Load Balancer Rule', 'name'),
+    'azurerm_lb_probe': ('Load Balancer Probe', 'name'),
+    'azurerm_application_gateway': ('Application Gateway', 'name sku=sku.name'),
+    'azurerm_firewall': ('Azure Firewall', 'name sku=sku_tier'),
+    'azurerm_firewall_policy': ('Firewall Policy', 'name sku'),
+    'azurerm_bastion_host': ('Bastion Host', 'name sku'),
+    'azurerm_frontdoor': ('Front Door', 'name'),
+    'azurerm_cdn_frontdoor_profile': ('Front Door Profile', 'name sku=sku_name'),
+    'azurerm_cdn_profile': ('CDN Profile', 'name sku'),
+    'azurerm_api_management': ('API Management', 'name sku=sku_name endpoint=gateway_url'),
+
+    # Azure storage and databases
+    'azurerm_storage_account': (
+        'Storage Account',
+        'name sku=account_tier endpoint=primary_blob_endpoint publicly_accessible=public_network_access_enabled'
+    ),
+    'azurerm_storage_container': ('Storage Container', 'name publicly_accessible=container_access_type'),
+    'azurerm_storage_blob': ('Storage Blob', 'name'),
+    'azurerm_storage_share': ('File Share', 'name'),
+    'azurerm_storage_queue': ('Storage Queue', 'name'),
+    'azurerm_storage_table': ('Storage Table', 'name'),
+    'azurerm_storage_account_network_rules': ('Storage Network Rules', ''),
+    'azurerm_mssql_server': (
+        'Azure SQL Server',
+        'name version endpoint=fully_qualified_domain_name publicly_accessible=public_network_access_enabled'
+    ),
+    'azurerm_mssql_database': ('Azure SQL Database', 'name sku=sku_name'),
+    'azurerm_mssql_firewall_rule': ('Azure SQL Firewall Rule', 'name'),
+    'azurerm_sql_server': ('Azure SQL Server', 'name version endpoint=fully_qualified_domain_name'),
+    'azurerm_sql_database': ('Azure SQL Database', 'name'),
+    'azurerm_postgresql_flexible_server': (
+        'PostgreSQL Flexible Server',
+        'name version sku=sku_name endpoint=fqdn publicly_accessible=public_network_access_enabled'
+    ),
+    'azurerm_postgresql_flexible_server_database': ('PostgreSQL Database', 'name'),
+    'azurerm_postgresql_server': (
+        'PostgreSQL Server',
+        'name version sku=sku_name endpoint=fqdn publicly_accessible=public_network_access_enabled'
+    ),
+    'azurerm_mysql_flexible_server': ('MySQL Flexible Server', 'name version sku=sku_name endpoint=fqdn'),
+    'azurerm_mysql_server': (
+        'MySQL Server',
+        'name version sku=sku_name endpoint=fqdn publicly_accessible=public_network_access_enabled'
+    ),
+    'azurerm_cosmosdb_account': ('Cosmos DB Account', 'name endpoint publicly_accessible=public_network_access_enabled'),
+    'azurerm_cosmosdb_sql_database': ('Cosmos DB SQL Database', 'name'),
+    'azurerm_redis_cache': (
+        'Redis Cache',
+        'name sku=sku_name version=redis_version endpoint=hostname publicly_accessible=public_network_access_enabled'
+    ),
+    'azurerm_data_factory': ('Data Factory', 'name'),
+    'azurerm_synapse_workspace': ('Synapse Workspace', 'name'),
+    'azurerm_databricks_workspace': ('Databricks Workspace', 'name sku endpoint=workspace_url'),
+    'azurerm_search_service': ('Search Service', 'name sku'),
+    'azurerm_cognitive_account': ('Cognitive Services Account', 'name sku=sku_name endpoint'),
+    'azurerm_recovery_services_vault': ('Recovery Services Vault', 'name sku'),
+    'azurerm_backup_policy_vm': ('VM Backup Policy', 'name'),
+
+    # Azure messaging and monitoring
+    'azurerm_servicebus_namespace': ('Service Bus Namespace', 'name sku'),
+    'azurerm_servicebus_queue': ('Service Bus Queue', 'name'),
+    'azurerm_servicebus_topic': ('Service Bus Topic', 'name'),
+    'azurerm_eventhub_namespace': ('Event Hubs Namespace', 'name sku'),
+    'azurerm_eventhub': ('Event Hub', 'name'),
+    'azurerm_eventgrid_topic': ('Event Grid Topic', 'name endpoint'),
+    'azurerm_log_analytics_workspace': ('Log Analytics Workspace', 'name sku'),
+    'azurerm_application_insights': ('Application Insights', 'name'),
+    'azurerm_monitor_diagnostic_setting': ('Diagnostic Setting', 'name'),
+    'azurerm_monitor_action_group': ('Monitor Action Group', 'name'),
+    'azurerm_monitor_metric_alert': ('Monitor Metric Alert', 'name'),
+    'azurerm_monitor_activity_log_alert': ('Activity Log Alert', 'name'),
+
+    # Azure identity and security
+    'azurerm_key_vault': (
+        'Key Vault',
+        'name sku=sku_name endpoint=vault_uri publicly_accessible=public_network_access_enabled'
+    ),
+    'azurerm_key_vault_key': ('Key Vault Key', 'name version'),
+    'azurerm_key_vault_secret': ('Key Vault Secret', 'name version'),
+    'azurerm_key_vault_certificate': ('Key Vault Certificate', 'name version'),
+    'azurerm_key_vault_access_policy': ('Key Vault Access Policy', ''),
+    'azurerm_disk_encryption_set': ('Disk Encryption Set', 'name kms_key=key_vault_key_id'),
+    'azurerm_role_assignment': ('Role Assignment', 'name=role_definition_name'),
+    'azurerm_role_definition': ('Role Definition', 'name'),
+    'azurerm_user_assigned_identity': ('Managed Identity', 'name'),
+    'azurerm_policy_definition': ('Policy Definition', 'name'),
+    'azurerm_policy_assignment': ('Policy Assignment', 'name'),
+    'azurerm_resource_group_policy_assignment': ('Resource Group Policy Assignment', 'name'),
+    'azurerm_subscription_policy_assignment': ('Subscription Policy Assignment', 'name'),
+    'azurerm_management_lock': ('Management Lock', 'name'),
+    'azurerm_security_center_subscription_pricing': ('Defender for Cloud Plan', 'sku=tier'),
+    'azurerm_security_center_contact': ('Security Center Contact', 'name'),
+
+    # GCP compute and containers
+    'google_compute_instance': (
+        'Compute Instance',
+        'name instance_type=machine_type network=network_interface.network '
+        'private_ip=network_interface.network_ip public_ip=network_interface.access_config.nat_ip'
+    ),
+    'google_compute_instance_template': ('Instance Template', 'name instance_type=machine_type'),
+    'google_compute_instance_group_manager': ('Managed Instance Group', 'name'),
+    'google_compute_region_instance_group_manager': ('Regional Managed Instance Group', 'name'),
+    'google_compute_instance_group': ('Instance Group', 'name network'),
+    'google_compute_disk': ('Persistent Disk', 'name kms_key=disk_encryption_key.kms_key_self_link'),
+    'google_compute_snapshot': ('Disk Snapshot', 'name'),
+    'google_compute_image': ('Compute Image', 'name'),
+    'google_compute_project_metadata': ('Project Metadata', ''),
+    'google_container_cluster': ('GKE Cluster', 'name version=master_version endpoint network'),
+    'google_container_node_pool': ('GKE Node Pool', 'name version instance_type=node_config.machine_type'),
+    'google_cloudfunctions_function': ('Cloud Function', 'name runtime'),
+    'google_cloudfunctions2_function': ('Cloud Function (2nd gen)', 'name runtime=build_config.runtime endpoint=url'),
+    'google_cloud_run_service': ('Cloud Run Service', 'name'),
+    'google_cloud_run_v2_service': ('Cloud Run Service', 'name endpoint=uri'),
+    'google_cloud_run_service_iam_member': ('Cloud Run IAM Member', 'name=service'),
+    'google_app_engine_application': ('App Engine Application', 'name'),
+    'google_dataproc_cluster': ('Dataproc Cluster', 'name'),
+    'google_dataflow_job': ('Dataflow Job', 'name'),
+    'google_composer_environment': ('Composer Environment', 'name'),
+    'google_cloud_scheduler_job': ('Cloud Scheduler Job', 'name'),
+    'google_cloudbuild_trigger': ('Cloud Build Trigger', 'name'),
+    'google_workflows_workflow': ('Workflow', 'name'),
+    'google_artifact_registry_repository': ('Artifact Registry Repository', 'name=repository_id kms_key=kms_key_name'),
+
+    # GCP networking
+    'google_compute_network': ('VPC Network', 'name'),
+    'google_compute_subnetwork': ('Subnetwork', 'name network cidr_block=ip_cidr_range'),
+    'google_compute_firewall': ('Firewall Rule', 'name network cidr_block=source_ranges'),
+    'google_compute_router': ('Cloud Router', 'name network'),
+    'google_compute_router_nat': ('Cloud NAT', 'name'),
+    'google_compute_address': ('Static IP Address', 'name public_ip=address'),
+    'google_compute_global_address': ('Global IP Address', 'name public_ip=address'),
+    'google_compute_route': ('Route', 'name network cidr_block=dest_range'),
+    'google_compute_vpn_gateway': ('VPN Gateway', 'name network'),
+    'google_compute_ha_vpn_gateway': ('HA VPN Gateway', 'name network'),
+    'google_compute_vpn_tunnel': ('VPN Tunnel', 'name'),
+    'google_compute_network_peering': ('Network Peering', 'name network'),
+    'google_compute_forwarding_rule': ('Forwarding Rule', 'name public_ip=ip_address network'),
+    'google_compute_global_forwarding_rule': ('Global Forwarding Rule', 'name public_ip=ip_address'),
+    'google_compute_backend_service': ('Backend Service', 'name'),
+    'google_compute_region_backend_service': ('Regional Backend Service', 'name'),
+    'google_compute_backend_bucket': ('Backend Bucket', 'name bucket_name'),
+    'google_compute_url_map': ('URL Map', 'name'),
+    'google_compute_target_https_proxy': ('HTTPS Proxy', 'name'),
+    'google_compute_target_http_proxy': ('HTTP Proxy', 'name'),
+    'google_compute_health_check': ('Health Check', 'name'),
+    'google_compute_ssl_certificate': ('SSL Certificate', 'name'),
+    'google_compute_managed_ssl_certificate': ('Managed SSL Certificate', 'name'),
+    'google_compute_security_policy': ('Cloud Armor Policy', 'name'),
+    'google_compute_shared_vpc_host_project': ('Shared VPC Host Project', ''),
+    'google_vpc_access_connector': ('Serverless VPC Connector', 'name network cidr_block=ip_cidr_range'),
+    'google_service_networking_connection': ('Private Service Connection', 'network'),
+    'google_dns_managed_zone': ('Cloud DNS Zone', 'name'),
+    'google_dns_record_set': ('DNS Record Set', 'name'),
+
+    # GCP storage and databases
+    'google_storage_bucket': (
+        'Cloud Storage Bucket',
+        'bucket_name=name versioning=versioning.enabled encryption=encryption.0 '
+        'kms_key=encryption.default_kms_key_name'
+    ),
+    'google_storage_bucket_object': ('Storage Object', 'name bucket_name=bucket kms_key=kms_key_name'),
+    'google_storage_bucket_iam_member': ('Bucket IAM Member', 'bucket_name=bucket'),
+    'google_storage_bucket_iam_binding': ('Bucket IAM Binding', 'bucket_name=bucket'),
+    'google_sql_database_instance': (
+        'Cloud SQL Instance',
+        'name engine=database_version instance_class=settings.tier public_ip=public_ip_address '
+        'private_ip=private_ip_address kms_key=encryption_key_name'
+    ),
+    'google_sql_database': ('Cloud SQL Database', 'name'),
+    'google_sql_user': ('Cloud SQL User', 'name'),
+    'google_bigquery_dataset': (
+        'BigQuery Dataset',
+        'name=dataset_id kms_key=default_encryption_configuration.kms_key_name'
+    ),
+    'google_bigquery_table': ('BigQuery Table', 'name=table_id kms_key=encryption_configuration.kms_key_name'),
+    'google_bigtable_instance': ('Bigtable Instance', 'name'),
+    'google_spanner_instance': ('Spanner Instance', 'name'),
+    'google_spanner_database': ('Spanner Database', 'name'),
+    'google_redis_instance': (
+        'Memorystore Redis',
+        'name version=redis_version instance_class=tier endpoint=host network=authorized_network'
+    ),
+    'google_filestore_instance': ('Filestore Instance', 'name instance_class=tier'),
+    'google_pubsub_topic': ('Pub/Sub Topic', 'name kms_key=kms_key_name'),
+    'google_pubsub_subscription': ('Pub/Sub Subscription', 'name'),
+
+    # GCP identity, security and operations
+    'google_project': ('Project', 'name'),
+    'google_folder': ('Folder', 'name=display_name'),
+    'google_project_service': ('Project API Service', 'name=service'),
+    'google_project_iam_member': ('Project IAM Member', ''),
+    'google_project_iam_binding': ('Project IAM Binding', ''),
+    'google_project_iam_custom_role': ('Custom IAM Role', 'name=role_id'),
+    'google_organization_iam_member': ('Organization IAM Member', ''),
+    'google_service_account': ('Service Account', 'name=account_id'),
+    'google_service_account_key': ('Service Account Key', 'name'),
+    'google_service_account_iam_member': ('Service Account IAM Member', ''),
+    'google_kms_key_ring': ('KMS Key Ring', 'name'),
+    'google_kms_crypto_key': ('KMS Crypto Key', 'name'),
+    'google_kms_crypto_key_iam_member': ('KMS Key IAM Member', 'kms_key=crypto_key_id'),
+    'google_secret_manager_secret': ('Secret Manager Secret', 'name=secret_id'),
+    'google_secret_manager_secret_version': ('Secret Version', ''),
+    'google_access_context_manager_service_perimeter': ('VPC Service Perimeter', 'name=title'),
+    'google_binary_authorization_policy': ('Binary Authorization Policy', ''),
+    'google_logging_project_sink': ('Log Sink', 'name'),
+    'google_logging_metric': ('Log-Based Metric', 'name'),
+    'google_monitoring_alert_policy': ('Alert Policy', 'name=display_name'),
+    'google_monitoring_notification_channel': ('Notification Channel', 'name=display_name'),
+    'google_monitoring_uptime_check_config': ('Uptime Check', 'name=display_name'),
+}
@@ -0,0 +1,211 @@
+"""Streaming decoding of evidence API responses
+
+Responses can carry large inline artifacts (``artifacts[].content_base64``).
+``read_response`` parses a response from a stream of byte chunks and
+decodes each artifact's base64 content straight into a spool file as it
+arrives, so only the assessment tree is held in memory. The artifact then
+has a ``content_file`` path instead of ``content_base64``;
+``write_response`` inlines the content again when a response is written
+back as JSON, e.g. into the response cache.
+"""
+
+import binascii
+import codecs
+import contextlib
+import json
+import os
+import threading
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, Optional
+
+from .state import _b64decode_chunks, _JSONStream
+
+# Bytes read per chunk from a response body or a cached response
+RESPONSE_CHUNK_SIZE = 1 << 20
+
+# Base64 text decoded per call while spooling; escaped solidi ('\/') split a
+# string into many small pieces that are joined back up to this size
+_SPOOL_TEXT_SIZE = 1 << 20
+
+_spool = None
+_spool_lock = threading.Lock()
+
+
+def spool_dir() -> str:
+    """Process-wide temporary directory for spooled artifact content
+
+    The directory and whatever is still in it are removed at exit.
+    """
+    global _spool
+    with _spool_lock:
+        if _spool is None:
+            import tempfile
+
+            _spool = tempfile.TemporaryDirectory(prefix='nabla-artifacts-')
+        return _spool.name
+
+
+def is_spooled(path: str) -> bool:
+    """Whether path is a spool file created by read_response"""
+    with _spool_lock:
+        return _spool is not None and os.path.dirname(path) == _spool.name
+
+
+def discard_spooled(response: Any, keep: Any = None):
+    """Delete a response's spooled artifact content once it is no longer needed
+
+    The spool only empties at exit, so a long-running process calls this
+    when it drops a response. Files still referenced by ``keep`` (such as a
+    delta merge that carried the artifacts over) are left alone.
+    """
+    def spooled(value: Any) -> set:
+        artifacts = value.get('artifacts') if isinstance(value, dict) else None
+        if not isinstance(artifacts, list):
+            return set()
+        return {
+            artifact['content_file'] for artifact in artifacts
+            if isinstance(artifact, dict) and is_spooled(artifact.get('content_file') or '')
+        }
+
+    for path in spooled(response) - spooled(keep):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def iter_chunks(fp: IO[bytes], chunk_size: int = RESPONSE_CHUNK_SIZE) -> Iterator[bytes]:
+    """Read a binary file or HTTP response in chunks until EOF"""
+    return iter(lambda: fp.read(chunk_size), b'')
+
+
+def _coalesce(pieces: Iterable[str], size: int) -> Iterator[str]:
+    parts = []
+    length = 0
+    for piece in pieces:
+        parts.append(piece)
+        length += len(piece)
+        if length >= size:
+            yield ''.join(parts)
+            parts = []
+            length = 0
+    if parts:
+        yield ''.join(parts)
+
+
+def _spool_content(stream: _JSONStream, artifact: Dict[str, Any]):
+    """Decode the base64 string at the read position into a spool file
+
+    Spool files are moved into the output directory as they are, so they
+    are created with ``open`` (umask permissions) rather than ``mkstemp``
+    (0600); the spool directory itself stays private.
+    """
+    pieces = stream.iter_string()
+    path = os.path.join(spool_dir(), f'{os.urandom(8).hex()}.artifact')
+    size = 0
+    try:
+        with open(path, 'xb') as f:
+            for data in _b64decode_chunks(_coalesce(pieces, _SPOOL_TEXT_SIZE)):
+                f.write(data)
+                size += len(data)
+    except binascii.Error as e:
+        # Keep parsing the response; the artifact alone is lost
+        for _ in pieces:
+            pass
+        os.unlink(path)
+        artifact['content_error'] = f"Invalid base64 content: {e}"
+        return
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(path)
+        raise
+    if size:
+        artifact['content_file'] = path
+    else:
+        os.unlink(path)
+        artifact['content_base64'] = ''
+
+
+def _read_object(stream: _JSONStream, read_member: Callable[[_JSONStream, str, Dict], None]) -> Dict:
+    obj: Dict[str, Any] = {}
+    stream.expect('{')
+    if stream.peek() == '}':
+        stream.expect('}')
+        return obj
+    while True:
+        key = stream.read_value()
+        stream.expect(':')
+        read_member(stream, key, obj)
+        if stream.expect(',}') == '}':
+            return obj
+
+
+def _read_artifact_member(stream: _JSONStream, key: str, artifact: Dict):
+    if key == 'content_base64' and stream.peek() == '"':
+        _spool_content(stream, artifact)
+    else:
+        artifact[key] = stream.read_value()
+
+
+def _read_response_member(stream: _JSONStream, key: str, response: Dict):
+    if key != 'artifacts' or stream.peek() != '[':
+        response[key] = stream.read_value()
+        return
+    artifacts = response[key] = []
+    stream.expect('[')
+    if stream.peek() == ']':
+        stream.expect(']')
+        return
+    while True:
+        if stream.peek() == '{':
+            artifacts.append(_read_object(stream, _read_artifact_member))
+        else:
+            artifacts.append(stream.read_value())
+        if stream.expect(',]') == ']':
+            return
+
+
+def read_response(chunks: Iterable[bytes]) -> Any:
+    """Parse a JSON response from byte chunks, spooling artifact content to disk
+
+    The chunks are consumed to the end, so an HTTP response is read
+    completely and its connection can go back to the pool.
+    """
+    stream = _JSONStream(codecs.iterdecode(chunks, 'utf-8'))
+    if stream.peek() == '{':
+        value = _read_object(stream, _read_response_member)
+    else:
+        value = stream.read_value()
+    if stream.peek():
+        raise json.JSONDecodeError("Extra data", stream._buf, stream._pos)
+    return value
+
+
+def write_response(response: Any, fp: IO[str], default: Optional[Callable[[Any], Any]] = str):
+    """Write a response as compact JSON, inlining spooled artifact content as base64"""
+    artifacts = response.get('artifacts') if isinstance(response, dict) else None
+    if not isinstance(artifacts, list) or not any(
+        isinstance(artifact, dict) and 'content_file' in artifact for artifact in artifacts
+    ):
+        json.dump(response, fp, default=default)
+        return
+
+    def open_object(fields: Dict) -> str:
+        # Encoded object without its closing brace, ready for one more member
+        return json.dumps(fields, default=default)[:-1] + (', ' if fields else '')
+
+    fp.write(open_object({key: value for key, value in response.items() if key != 'artifacts'}))
+    fp.write('"artifacts": [')
+    for idx, artifact in enumerate(artifacts):
+        if idx:
+            fp.write(', ')
+        if not isinstance(artifact, dict) or 'content_file' not in artifact:
+            fp.write(json.dumps(artifact, default=default))
+            continue
+        fp.write(open_object({key: value for key, value in artifact.items() if key != 'content_file'}))
+        fp.write('"content_base64": "')
+        with open(artifact['content_file'], 'rb') as f:
+            # Whole 3-byte groups encode without padding, so the pieces concatenate
+            for chunk in iter_chunks(f, 3 * (RESPONSE_CHUNK_SIZE // 4)):
+                fp.write(binascii.b2a_base64(chunk, newline=False).decode('ascii'))
+        fp.write('"}')
+    fp.write(']}')
@@ -0,0 +1,470 @@
+"""Streaming readers for Terraform state files
+
+A state is raw JSON (``.tfstate``), gzip-compressed JSON (``.tfstate.gz``)
+or base64 (``.tfstate.b64``); ``StateFile`` detects which from the content
+and reads it through a memory map. States are decoded and parsed
+incrementally, so memory stays bounded by the largest single resource
+rather than by the size of the state.
+
+Every stage of a run (cache key, inventory, fingerprints, upload) reads
+the state again. Passing the same ``StateFile`` to all of them decodes each
+byte at most once: the first full pass keeps the decoded JSON in a
+temporary file that later passes map instead, a raw JSON file is mapped as
+it is, and the base64 for the upload is copied from a base64 file without
+decoding it.
+
+Wherever a state is accepted it may be given as a ``StateFile``, any other
+path-like, a ``str`` path or in-memory base64 content (see ``_state_source``).
+"""
+
+import base64
+import binascii
+import codecs
+import errno
+import json
+import mmap
+import os
+import re
+import threading
+import weakref
+import zlib
+from pathlib import Path
+from typing import Any, AnyStr, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from .profiling import span
+
+
+# Bytes read per chunk when streaming a Terraform state
+STATE_CHUNK_SIZE = 1 << 20
+
+# State file encodings StateFile recognizes
+STATE_ENCODINGS = ('json', 'gzip', 'base64')
+
+_GZIP_MAGIC = b'\x1f\x8b'
+_B64_WHITESPACE = b' \t\n\r\x0b\x0c'
+
+# Longest str still checked for being a file name
+_MAX_PATH_LENGTH = 4096
+_BASE64_TEXT = re.compile(r'[A-Za-z0-9+/=\s]*')
+
+
+def _unlink(path: str):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _read_mapped(path: Union[str, os.PathLike], chunk_size: int = STATE_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield a file's bytes in chunks through a read-only memory map"""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for start in range(0, size, chunk_size):
+                with span('state.read', 'io') as read:
+                    chunk = mm[start:start + chunk_size]
+                    read.set(bytes=len(chunk))
+                yield chunk
+
+
+def _b64decode_chunks(chunks: Iterable[AnyStr]) -> Iterator[bytes]:
+    """Decode base64 text or ASCII bytes incrementally, carrying partial quads between chunks"""
+    pending = None
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = ''.join(chunk.split())
+        else:
+            chunk = chunk.translate(None, _B64_WHITESPACE)
+        if pending:
+            chunk = pending + chunk
+        usable = len(chunk) - len(chunk) % 4
+        pending = chunk[usable:]
+        if usable:
+            with span('base64.decode', 'io') as decode:
+                data = binascii.a2b_base64(chunk[:usable])
+                decode.set(decoded_bytes=len(data))
+            yield data
+    if pending:
+        yield base64.b64decode(pending)
+
+
+def _b64encode_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Encode bytes as base64 incrementally; whole 3-byte groups concatenate without padding"""
+    pending = b''
+    for chunk in chunks:
+        if pending:
+            chunk = pending + chunk
+        usable = len(chunk) - len(chunk) % 3
+        pending = chunk[usable:]
+        if usable:
+            yield binascii.b2a_base64(chunk[:usable], newline=False)
+    if pending:
+        yield binascii.b2a_base64(pending, newline=False)
+
+
+def _gunzip_chunks(chunks: Iterable[bytes], chunk_size: int = STATE_CHUNK_SIZE) -> Iterator[bytes]:
+    """Decompress a gzip stream incrementally (concatenated members included)
+
+    Output comes in pieces of at most chunk_size bytes however well the
+    state compresses.
+    """
+    decompressor = zlib.decompressobj(wbits=31)
+    in_member = False
+    for chunk in chunks:
+        while True:
+            in_member = in_member or bool(chunk)
+            with span('gzip.decode', 'io') as decode:
+                data = decompressor.decompress(chunk, chunk_size)
+                decode.set(decoded_bytes=len(data))
+            if data:
+                yield data
+            chunk = decompressor.unconsumed_tail
+            if decompressor.eof:
+                chunk = decompressor.unused_data
+                decompressor = zlib.decompressobj(wbits=31)
+                in_member = False
+            if not chunk and len(data) < chunk_size:
+                break
+    if in_member:
+        raise zlib.error("Truncated gzip stream")
+
+
+class StateFile(os.PathLike):
+    """A Terraform state file in any STATE_ENCODINGS, decoded at most once
+
+    A path-like, so it goes wherever a state path is accepted. With
+    ``keep_decoded`` the first complete pass over the decoded JSON is kept
+    in a temporary file (removed by ``close`` or when the object goes away)
+    and every later pass, ``decoded_path`` included, maps it instead of
+    decoding again.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], keep_decoded: bool = True):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            head = f.read(64)
+        if head.startswith(_GZIP_MAGIC):
+            self.encoding = 'gzip'
+        elif head.lstrip()[:1] == b'{':
+            self.encoding = 'json'
+        else:
+            self.encoding = 'base64'
+        self.keep_decoded = keep_decoded
+        # File holding the decoded JSON, once known
+        self._decoded: Optional[str] = str(self.path) if self.encoding == 'json' else None
+        self._finalizer = None
+        self._writing = False
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def __fspath__(self) -> str:
+        return os.fspath(self.path)
+
+    def __repr__(self) -> str:
+        return f"StateFile({str(self.path)!r}, encoding={self.encoding!r})"
+
+    def __enter__(self) -> 'StateFile':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Remove the decoded copy; later passes decode again without keeping it"""
+        with self._lock:
+            self._closed = True
+            if self._finalizer is not None:
+                self._finalizer()
+                self._finalizer = None
+                self._decoded = None
+
+    def _decode(self, chunk_size: int) -> Iterator[bytes]:
+        chunks = _read_mapped(self.path, chunk_size)
+        if self.encoding == 'gzip':
+            return _gunzip_chunks(chunks, chunk_size)
+        return _b64decode_chunks(chunks)
+
+    def iter_decoded(self, chunk_size: int = STATE_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yield the state's JSON bytes"""
+        decoded = self._decoded
+        if decoded is not None:
+            yield from _read_mapped(decoded, chunk_size)
+            return
+
+        with self._lock:
+            # One pass at a time keeps the decoded copy; a concurrent one just decodes
+            keep = self.keep_decoded and not self._writing and not self._closed
+            self._writing = self._writing or keep
+        if not keep:
+            yield from self._decode(chunk_size)
+            return
+
+        import tempfile
+
+        fd, path = tempfile.mkstemp(prefix='nabla-state-', suffix='.json')
+        complete = False
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                chunks = self._decode(chunk_size)
+                try:
+                    for data in chunks:
+                        f.write(data)
+                        yield data
+                except GeneratorExit:
+                    # A parser stops after the resources array; finish the
+                    # copy so the next pass need not decode anything again
+                    for data in chunks:
+                        f.write(data)
+                    complete = True
+                    raise
+            complete = True
+        finally:
+            with self._lock:
+                self._writing = False
+                if complete and not self._closed:
+                    self._decoded = path
+                    self._finalizer = weakref.finalize(self, _unlink, path)
+                else:
+                    _unlink(path)
+
+    def iter_base64(self, chunk_size: int = STATE_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yield the state as base64 ASCII without whitespace, e.g. for an upload body"""
+        if self.encoding == 'base64':
+            for chunk in _read_mapped(self.path, chunk_size):
+                yield chunk.translate(None, _B64_WHITESPACE)
+        else:
+            yield from _b64encode_chunks(self.iter_decoded(chunk_size))
+
+    def decoded_path(self) -> str:
+        """Path of a file holding the state's JSON, decoding into one if needed"""
+        while self._decoded is None:
+            if self._closed or not self.keep_decoded:
+                raise ValueError(f"{self.path} has no decoded copy to share")
+            for _ in self.iter_decoded():
+                pass
+        return self._decoded
+
+
+def _state_source(source: Union[str, os.PathLike]) -> Union[str, os.PathLike]:
+    """Normalize a state argument to a path-like or in-memory base64 content
+
+    A ``str`` naming an existing file is a path. Any other ``str`` is base64
+    content, unless it cannot be (it has characters outside the base64
+    alphabet, like a path), in which case the file is reported missing
+    rather than failing later with a base64 error.
+    """
+    if isinstance(source, os.PathLike):
+        return source
+    if len(source) <= _MAX_PATH_LENGTH:
+        if os.path.isfile(source):
+            return Path(source)
+        if not _BASE64_TEXT.fullmatch(source):
+            raise FileNotFoundError(errno.ENOENT, "Terraform state file not found", source)
+    return source
+
+
+def _state_file(source: os.PathLike) -> StateFile:
+    """The StateFile for a path, or a throwaway one that keeps no decoded copy"""
+    return source if isinstance(source, StateFile) else StateFile(source, keep_decoded=False)
+
+
+def _iter_state_base64(
+    source: Union[str, os.PathLike],
+    chunk_size: int = STATE_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Yield a state (path or base64 content) as base64 ASCII without whitespace"""
+    source = _state_source(source)
+    if isinstance(source, os.PathLike):
+        return _state_file(source).iter_base64(chunk_size)
+    return (
+        ''.join(source[start:start + chunk_size].split()).encode('ascii')
+        for start in range(0, len(source), chunk_size)
+    )
+
+
+def _state_base64_size(source: Union[str, os.PathLike]) -> int:
+    """Length of a state's base64 without whitespace, without building it"""
+    source = _state_source(source)
+    if not isinstance(source, os.PathLike):
+        return sum(len(chunk) for chunk in _iter_state_base64(source))
+    state = _state_file(source)
+    if state.encoding == 'base64':
+        return sum(len(chunk) for chunk in state.iter_base64())
+    if state.keep_decoded:
+        size = os.path.getsize(state.decoded_path())
+    else:
+        size = sum(len(chunk) for chunk in state.iter_decoded())
+    return 4 * ((size + 2) // 3)
+
+
+def _iter_b64_decoded(content: str, chunk_size: int = STATE_CHUNK_SIZE) -> Iterator[bytes]:
+    """Decode in-memory base64 content incrementally"""
+    return _b64decode_chunks(content[start:start + chunk_size] for start in range(0, len(content), chunk_size))
+
+
+def _iter_state_decoded(
+    source: Union[str, os.PathLike],
+    chunk_size: int = STATE_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Yield a state's JSON bytes from a state path or in-memory base64 content"""
+    source = _state_source(source)
+    if isinstance(source, os.PathLike):
+        return _state_file(source).iter_decoded(chunk_size)
+    return _iter_b64_decoded(source, chunk_size)
+
+
+class _JSONStream:
+    """Minimal pull reader over an iterator of JSON text chunks"""
+
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, min_available: int) -> bool:
+        """Buffer at least min_available unread characters; False at EOF"""
+        if self._pos:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        parts = [self._buf]
+        available = len(self._buf)
+        while available < min_available and not self._eof:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._eof = True
+                break
+            parts.append(chunk)
+            available += len(chunk)
+        self._buf = ''.join(parts)
+        return available >= min_available
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it"""
+        while True:
+            buf = self._buf
+            pos = self._pos
+            while pos < len(buf) and buf[pos] in ' \t\n\r':
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill(1):
+                return ''
+
+    def expect(self, chars: str) -> str:
+        """Consume one of the given structural characters"""
+        ch = self.peek()
+        if not ch or ch not in chars:
+            raise json.JSONDecodeError(f"Expected one of {chars!r}", self._buf, self._pos)
+        self._pos += 1
+        return ch
+
+    def iter_string(self) -> Iterator[str]:
+        """Yield the next JSON string value in decoded pieces, never buffering it whole"""
+        self.expect('"')
+        while True:
+            buf = self._buf
+            pos = self._pos
+            quote = buf.find('"', pos)
+            escape = buf.find('\\', pos, len(buf) if quote < 0 else quote)
+            end = escape if escape >= 0 else quote if quote >= 0 else len(buf)
+            if end > pos:
+                yield buf[pos:end]
+            self._pos = end
+            if escape >= 0:
+                yield self._read_escape()
+            elif quote >= 0:
+                self._pos = quote + 1
+                return
+            elif not self._fill(1):
+                raise json.JSONDecodeError("Unterminated string", self._buf, self._pos)
+
+    def _read_escape(self) -> str:
+        """Decode the escape sequence at the read position (surrogate pairs included)"""
+        if len(self._buf) - self._pos < 12:
+            self._fill(12)
+        buf = self._buf
+        pos = self._pos
+        length = 2
+        if buf[pos + 1:pos + 2] == 'u':
+            length = 6
+            # A high surrogate only decodes together with the low one after it
+            if buf[pos + 2:pos + 4].lower() in ('d8', 'd9', 'da', 'db') and buf[pos + 6:pos + 8] == '\\u':
+                length = 12
+        text = json.loads('"' + buf[pos:pos + length] + '"')
+        self._pos = pos + length
+        return text
+
+    def read_value(self) -> Any:
+        """Decode the next complete JSON value, buffering more text as needed"""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                # Grow geometrically so large values are re-scanned O(log n) times
+                self._fill(max(2 * (len(self._buf) - self._pos), 1))
+                continue
+            # A number ending exactly at the buffer edge may be truncated
+            if end == len(self._buf) and not self._eof:
+                self._fill(len(self._buf) - self._pos + 1)
+                continue
+            self._pos = end
+            return value
+
+
+def iter_tfstate_resources(
+    chunks: Iterable[str],
+    header: Optional[Dict[str, Any]] = None
+) -> Iterator[Dict[str, Any]]:
+    """Yield entries of the top-level ``resources`` array one at a time
+
+    When ``header`` is given, scalar top-level fields seen before the
+    resources array (version, terraform_version, lineage, ...) are stored in it.
+    """
+    stream = _JSONStream(chunks)
+    stream.expect('{')
+    if stream.peek() == '}':
+        return
+    while True:
+        key = stream.read_value()
+        stream.expect(':')
+        if key != 'resources':
+            value = stream.read_value()
+            if header is not None and not isinstance(value, (dict, list)):
+                header[key] = value
+        else:
+            stream.expect('[')
+            if stream.peek() == ']':
+                return
+            while True:
+                yield stream.read_value()
+                if stream.expect(',]') == ']':
+                    # Nothing after the resources array is needed
+                    return
+        if stream.expect(',}') == '}':
+            return
+
+
+def iter_state_resources(
+    source: Union[str, os.PathLike],
+    header: Optional[Dict[str, Any]] = None
+) -> Iterator[Dict[str, Any]]:
+    """Stream resources from a Terraform state (path, StateFile or base64 content)"""
+    text = codecs.iterdecode(_iter_state_decoded(source), 'utf-8')
+    return iter_tfstate_resources(text, header)
+
+
+def iter_resource_instances(
+    source: Union[str, os.PathLike]
+) -> Iterator[Tuple[Dict[str, Any], int, Dict[str, Any]]]:
+    """Stream (resource, index, instance) tuples from a Terraform state"""
+    for resource in iter_state_resources(source):
+        for idx, instance in enumerate(resource.get('instances', [])):
+            yield resource, idx, instance
@@ -0,0 +1,199 @@
+"""SQLite store of assessment runs across workspaces
+
+Each report run appends one row to ``assessments`` and its controls,
+findings, framework summaries and assets to the tables below, all in a
+single transaction. The database is in WAL mode, so reports and ad-hoc
+queries can read while a batch run is writing. Example: controls that
+regressed between the two latest runs of every workspace::
+
+    WITH ranked AS (
+        SELECT id, name, ROW_NUMBER() OVER (PARTITION BY name ORDER BY id DESC) AS n
+        FROM assessments
+    )
+    SELECT cur.name, c.framework, c.control_id
+    FROM ranked cur
+    JOIN ranked prev ON prev.name = cur.name AND prev.n = 2
+    JOIN controls c ON c.run_id = cur.id AND c.status = 'not-satisfied'
+    JOIN controls p ON p.run_id = prev.id AND p.framework = c.framework
+                   AND p.control_id = c.control_id AND p.status = 'satisfied'
+    WHERE cur.n = 1;
+"""
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Optional, Tuple, Union
+
+from .assessment import AssessmentIndex
+from .profiling import traced
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS assessments (
+    id INTEGER PRIMARY KEY,
+    assessment_id TEXT,
+    name TEXT NOT NULL,
+    state_path TEXT,
+    created_at TEXT,
+    recorded_at TEXT NOT NULL,
+    total_assets INTEGER
+);
+CREATE TABLE IF NOT EXISTS controls (
+    run_id INTEGER NOT NULL REFERENCES assessments(id) ON DELETE CASCADE,
+    framework TEXT NOT NULL,
+    version TEXT,
+    control_id TEXT NOT NULL,
+    title TEXT,
+    status TEXT NOT NULL,
+    findings_count INTEGER,
+    evidence_count INTEGER,
+    findings TEXT,
+    evidence TEXT
+);
+CREATE TABLE IF NOT EXISTS findings (
+    run_id INTEGER NOT NULL REFERENCES assessments(id) ON DELETE CASCADE,
+    framework TEXT NOT NULL,
+    version TEXT,
+    control_id TEXT NOT NULL,
+    control_title TEXT,
+    status TEXT,
+    finding TEXT,
+    severity TEXT
+);
+CREATE TABLE IF NOT EXISTS summaries (
+    run_id INTEGER NOT NULL REFERENCES assessments(id) ON DELETE CASCADE,
+    framework TEXT NOT NULL,
+    version TEXT,
+    timestamp TEXT,
+    total_controls INTEGER,
+    satisfied INTEGER,
+    not_satisfied INTEGER,
+    not_applicable INTEGER,
+    compliance_percentage REAL
+);
+CREATE TABLE IF NOT EXISTS assets (
+    run_id INTEGER NOT NULL REFERENCES assessments(id) ON DELETE CASCADE,
+    asset_id TEXT NOT NULL,
+    resource_type TEXT,
+    resource_name TEXT,
+    provider TEXT,
+    cloud_provider TEXT,
+    asset_type TEXT,
+    attributes TEXT
+);
+CREATE INDEX IF NOT EXISTS assessments_name ON assessments (name, recorded_at);
+CREATE INDEX IF NOT EXISTS controls_framework_control_status ON controls (framework, control_id, status);
+CREATE INDEX IF NOT EXISTS controls_run ON controls (run_id);
+CREATE INDEX IF NOT EXISTS findings_run_control ON findings (run_id, framework, control_id);
+CREATE INDEX IF NOT EXISTS summaries_run ON summaries (run_id);
+CREATE INDEX IF NOT EXISTS assets_asset_id ON assets (asset_id);
+CREATE INDEX IF NOT EXISTS assets_resource_type ON assets (resource_type);
+CREATE INDEX IF NOT EXISTS assets_run ON assets (run_id);
+"""
+
+
+def _text(value: Any) -> Any:
+    return value if value is None or isinstance(value, str) else json.dumps(value)
+
+
+class AssessmentStore:
+    """Append-only SQLite database of report runs
+
+    A connection is opened per call, so one store can be shared by the
+    batch worker threads; concurrent writers queue on SQLite's lock for up
+    to ``timeout`` seconds.
+    """
+
+    def __init__(self, path: Union[str, Path], timeout: float = 60.0):
+        self.path = Path(path)
+        self.timeout = timeout
+
+    def _connect(self):
+        # sqlite3 is only needed when a store is actually written
+        import sqlite3
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=self.timeout)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA foreign_keys=ON')
+        if conn.execute('PRAGMA user_version').fetchone()[0] < SCHEMA_VERSION:
+            with conn:
+                conn.executescript(SCHEMA)
+                conn.execute(f'PRAGMA user_version={SCHEMA_VERSION}')
+        return conn
+
+    @traced('store.record_run')
+    def record_run(
+        self,
+        assessment: Union[AssessmentIndex, dict],
+        assets: Iterable[Mapping[str, Any]],
+        name: str,
+        state_path: Optional[Union[str, Path]] = None
+    ) -> Tuple[int, int]:
+        """Store one run in a single transaction; returns (run id, asset count)
+
+        Every row, including the serialized assets, is built before the
+        transaction opens, so the write lock other batch workers queue on is
+        held for the inserts only. ``assets`` is consumed once; pass the
+        compact ``AssetInventory`` rather than a generator that parses the
+        state again.
+        """
+        index = AssessmentIndex.of(assessment)
+        controls = [(
+            row['framework'], row['version'], row['control_id'], row['title'],
+            row['status'], row['findings_count'], row['evidence_count'],
+            json.dumps(row['findings']), json.dumps(row['evidence']),
+        ) for row in index.control_rows()]
+        findings = [(
+            row['framework'], row['version'], row['control_id'],
+            row['control_title'], row['status'], _text(row['finding']), row['severity'],
+        ) for row in index.finding_rows()]
+        asset_rows = [(
+            asset.get('asset_id'), asset.get('resource_type'),
+            asset.get('resource_name'), asset.get('provider'),
+            asset.get('cloud_provider'), asset.get('asset_type'),
+            json.dumps(dict(asset), default=str),
+        ) for asset in assets]
+        asset_count = len(asset_rows)
+        summaries = [(
+            row['framework'], row['version'], row['timestamp'],
+            row['total_controls'], row['satisfied'], row['not_satisfied'],
+            row['not_applicable'], row['compliance_percentage'],
+        ) for row in index.summary_rows(asset_count)]
+
+        conn = self._connect()
+        try:
+            with conn:
+                run_id = conn.execute(
+                    'INSERT INTO assessments (assessment_id, name, state_path, created_at, recorded_at, total_assets) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    (
+                        index.assessment_id,
+                        name,
+                        str(state_path) if state_path is not None else None,
+                        index.created_at,
+                        datetime.now(timezone.utc).isoformat(),
+                        asset_count,
+                    )
+                ).lastrowid
+                conn.executemany(
+                    'INSERT INTO controls VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    ((run_id, *row) for row in controls)
+                )
+                conn.executemany(
+                    'INSERT INTO findings VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    ((run_id, *row) for row in findings)
+                )
+                conn.executemany(
+                    'INSERT INTO assets VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    ((run_id, *row) for row in asset_rows)
+                )
+                conn.executemany(
+                    'INSERT INTO summaries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    ((run_id, *row) for row in summaries)
+                )
+        finally:
+            conn.close()
+        return run_id, asset_count
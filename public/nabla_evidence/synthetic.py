@@ -0,0 +1,521 @@
+"""Synthetic Terraform states and assessment responses for benchmarks
+
+States mix AWS, Azure and GCP resources in roughly the proportions of a
+real estate (mostly compute, storage and networking), each resource with
+one or more instances. They are base64-encoded and written in chunks, so a
+1M-instance state is never held in memory. Responses follow the evidence
+API's shape, with configurable framework, control, finding and artifact
+counts. Output is deterministic for a given seed.
+
+Usage:
+    python -m nabla_evidence.synthetic state INSTANCES OUTPUT [--seed N]
+    python -m nabla_evidence.synthetic response OUTPUT [--controls N] [--findings N] ...
+"""
+
+import argparse
+import base64
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .assessment import FRAMEWORKS
+
+AWS_REGIONS = ('us-east-1', 'us-east-2', 'us-west-2', 'eu-west-1', 'eu-central-1', 'ap-southeast-2')
+AZURE_LOCATIONS = ('eastus', 'eastus2', 'westus2', 'westeurope', 'northeurope', 'uksouth')
+GCP_ZONES = ('us-central1-a', 'us-central1-b', 'us-east1-b', 'europe-west1-b', 'europe-west4-a', 'asia-east1-a')
+ENVIRONMENTS = ('prod', 'staging', 'dev')
+TEAMS = ('platform', 'payments', 'data', 'identity', 'web', 'ml')
+
+# Instance count parsing for the CLIs: 1k, 250k, 1m, 1000000
+_SUFFIXES = {'k': 1_000, 'm': 1_000_000}
+
+
+def parse_count(text: str) -> int:
+    """Parse an instance count such as 1000, 10k or 1m"""
+    text = text.strip().lower().replace('_', '').replace(',', '')
+    scale = _SUFFIXES.get(text[-1:], 1)
+    value = int(float(text[:-1] if scale > 1 else text) * scale)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"count must be positive: {text}")
+    return value
+
+
+def _hex(rng: random.Random, digits: int) -> str:
+    return f'{rng.getrandbits(4 * digits):0{digits}x}'
+
+
+def _ip(rng: random.Random, first: int = 10) -> str:
+    return f'{first}.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(1, 255)}'
+
+
+def _tags(rng: random.Random, name: Optional[str] = None) -> Dict[str, str]:
+    tags = {'Environment': rng.choice(ENVIRONMENTS), 'Team': rng.choice(TEAMS), 'ManagedBy': 'terraform'}
+    if name is not None:
+        tags['Name'] = name
+    return tags
+
+
+def _aws_instance(rng: random.Random, name: str) -> Dict[str, Any]:
+    region = rng.choice(AWS_REGIONS)
+    instance_id = f'i-{_hex(rng, 17)}'
+    return {
+        'id': instance_id,
+        'arn': f'arn:aws:ec2:{region}:123456789012:instance/{instance_id}',
+        'ami': f'ami-{_hex(rng, 17)}',
+        'instance_type': rng.choice(('t3.micro', 't3.large', 'm5.xlarge', 'c6i.2xlarge', 'r6g.large')),
+        'availability_zone': region + rng.choice('abc'),
+        'subnet_id': f'subnet-{_hex(rng, 17)}',
+        'private_ip': _ip(rng),
+        'public_ip': _ip(rng, 54) if rng.random() < 0.2 else '',
+        'vpc_security_group_ids': [f'sg-{_hex(rng, 17)}' for _ in range(rng.randint(1, 3))],
+        'monitoring': rng.random() < 0.5,
+        'ebs_optimized': True,
+        'metadata_options': [{'http_endpoint': 'enabled', 'http_tokens': rng.choice(('required', 'optional'))}],
+        'root_block_device': [{
+            'volume_size': rng.choice((20, 50, 100)),
+            'volume_type': 'gp3',
+            'encrypted': rng.random() < 0.8,
+            'delete_on_termination': True,
+        }],
+        'tags': _tags(rng, name),
+    }
+
+
+def _aws_s3_bucket(rng: random.Random, name: str) -> Dict[str, Any]:
+    bucket = f'{name.replace("_", "-")}-{_hex(rng, 8)}'
+    encrypted = rng.random() < 0.7
+    return {
+        'id': bucket,
+        'arn': f'arn:aws:s3:::{bucket}',
+        'bucket': bucket,
+        'region': rng.choice(AWS_REGIONS),
+        'force_destroy': False,
+        'versioning': [{'enabled': rng.random() < 0.6, 'mfa_delete': False}],
+        'server_side_encryption_configuration': [{
+            'rule': [{'apply_server_side_encryption_by_default': [{'sse_algorithm': 'aws:kms'}]}]
+        }] if encrypted else [],
+        'tags': _tags(rng),
+    }
+
+
+def _aws_db_instance(rng: random.Random, name: str) -> Dict[str, Any]:
+    region = rng.choice(AWS_REGIONS)
+    identifier = f'{name.replace("_", "-")}-{_hex(rng, 6)}'
+    engine = rng.choice(('postgres', 'mysql', 'aurora-postgresql'))
+    return {
+        'id': f'db-{_hex(rng, 26).upper()}',
+        'arn': f'arn:aws:rds:{region}:123456789012:db:{identifier}',
+        'identifier': identifier,
+        'engine': engine,
+        'engine_version': rng.choice(('14.10', '15.5', '8.0.35')),
+        'instance_class': rng.choice(('db.t3.medium', 'db.r6g.large', 'db.m5.xlarge')),
+        'allocated_storage': rng.choice((20, 100, 500)),
+        'storage_encrypted': rng.random() < 0.85,
+        'publicly_accessible': rng.random() < 0.05,
+        'multi_az': rng.random() < 0.5,
+        'availability_zone': region + rng.choice('abc'),
+        'endpoint': f'{identifier}.{_hex(rng, 12)}.{region}.rds.amazonaws.com:5432',
+        'kms_key_id': f'arn:aws:kms:{region}:123456789012:key/{_hex(rng, 32)}',
+        'backup_retention_period': rng.choice((0, 7, 35)),
+        'tags': _tags(rng),
+    }
+
+
+def _aws_subnet(rng: random.Random, name: str) -> Dict[str, Any]:
+    region = rng.choice(AWS_REGIONS)
+    subnet_id = f'subnet-{_hex(rng, 17)}'
+    return {
+        'id': subnet_id,
+        'arn': f'arn:aws:ec2:{region}:123456789012:subnet/{subnet_id}',
+        'vpc_id': f'vpc-{_hex(rng, 17)}',
+        'cidr_block': f'10.{rng.randrange(256)}.{rng.randrange(256)}.0/24',
+        'availability_zone': region + rng.choice('abc'),
+        'map_public_ip_on_launch': rng.random() < 0.3,
+        'tags': _tags(rng, name),
+    }
+
+
+def _aws_security_group(rng: random.Random, name: str) -> Dict[str, Any]:
+    region = rng.choice(AWS_REGIONS)
+    group_id = f'sg-{_hex(rng, 17)}'
+    return {
+        'id': group_id,
+        'arn': f'arn:aws:ec2:{region}:123456789012:security-group/{group_id}',
+        'name': f'{name}-{_hex(rng, 4)}',
+        'vpc_id': f'vpc-{_hex(rng, 17)}',
+        'ingress': [{
+            'from_port': port, 'to_port': port, 'protocol': 'tcp',
+            'cidr_blocks': ['0.0.0.0/0' if rng.random() < 0.1 else '10.0.0.0/8'],
+        } for port in rng.sample((22, 80, 443, 5432, 6379, 8080), rng.randint(1, 3))],
+        'egress': [{'from_port': 0, 'to_port': 0, 'protocol': '-1', 'cidr_blocks': ['0.0.0.0/0']}],
+        'tags': _tags(rng),
+    }
+
+
+def _aws_iam_role(rng: random.Random, name: str) -> Dict[str, Any]:
+    role = f'{name}-{_hex(rng, 6)}'
+    return {
+        'id': role,
+        'arn': f'arn:aws:iam::123456789012:role/{role}',
+        'name': role,
+        'assume_role_policy': json.dumps({
+            'Version': '2012-10-17',
+            'Statement': [{'Effect': 'Allow', 'Principal': {'Service': 'ec2.amazonaws.com'}, 'Action': 'sts:AssumeRole'}],
+        }),
+        'max_session_duration': 3600,
+        'tags': _tags(rng),
+    }
+
+
+def _aws_lambda_function(rng: random.Random, name: str) -> Dict[str, Any]:
+    region = rng.choice(AWS_REGIONS)
+    function = f'{name}-{_hex(rng, 6)}'
+    return {
+        'id': function,
+        'arn': f'arn:aws:lambda:{region}:123456789012:function:{function}',
+        'function_name': function,
+        'runtime': rng.choice(('python3.12', 'nodejs20.x', 'java21')),
+        'handler': 'main.handler',
+        'memory_size': rng.choice((128, 512, 1024)),
+        'timeout': rng.choice((3, 30, 900)),
+        'version': '$LATEST',
+        'environment': [{'variables': {'LOG_LEVEL': 'info', 'STAGE': rng.choice(ENVIRONMENTS)}}],
+        'tags': _tags(rng),
+    }
+
+
+def _azure_id(rng: random.Random, group: str, provider: str, name: str) -> str:
+    return (f'/subscriptions/{_hex(rng, 8)}-0000-4000-8000-{_hex(rng, 12)}/resourceGroups/{group}'
+            f'/providers/{provider}/{name}')
+
+
+def _azurerm_linux_virtual_machine(rng: random.Random, name: str) -> Dict[str, Any]:
+    group = f'rg-{rng.choice(TEAMS)}-{rng.choice(ENVIRONMENTS)}'
+    vm = f'{name}-{_hex(rng, 4)}'
+    return {
+        'id': _azure_id(rng, group, 'Microsoft.Compute/virtualMachines', vm),
+        'name': vm,
+        'resource_group_name': group,
+        'location': rng.choice(AZURE_LOCATIONS),
+        'size': rng.choice(('Standard_B2s', 'Standard_D4s_v5', 'Standard_E8s_v5')),
+        'admin_username': 'azureuser',
+        'disable_password_authentication': True,
+        'private_ip_address': _ip(rng),
+        'public_ip_address': _ip(rng, 20) if rng.random() < 0.15 else '',
+        'os_disk': [{'caching': 'ReadWrite', 'storage_account_type': 'Premium_LRS', 'disk_size_gb': 64}],
+        'tags': _tags(rng),
+    }
+
+
+def _azurerm_storage_account(rng: random.Random, name: str) -> Dict[str, Any]:
+    group = f'rg-{rng.choice(TEAMS)}-{rng.choice(ENVIRONMENTS)}'
+    account = f'st{_hex(rng, 14)}'
+    return {
+        'id': _azure_id(rng, group, 'Microsoft.Storage/storageAccounts', account),
+        'name': account,
+        'resource_group_name': group,
+        'location': rng.choice(AZURE_LOCATIONS),
+        'account_tier': rng.choice(('Standard', 'Premium')),
+        'account_replication_type': rng.choice(('LRS', 'GRS', 'ZRS')),
+        'min_tls_version': 'TLS1_2',
+        'public_network_access_enabled': rng.random() < 0.3,
+        'primary_blob_endpoint': f'https://{account}.blob.core.windows.net/',
+        'tags': _tags(rng),
+    }
+
+
+def _azurerm_mssql_database(rng: random.Random, name: str) -> Dict[str, Any]:
+    group = f'rg-{rng.choice(TEAMS)}-{rng.choice(ENVIRONMENTS)}'
+    database = f'{name}-{_hex(rng, 4)}'
+    return {
+        'id': _azure_id(rng, group, 'Microsoft.Sql/servers/sql-main/databases', database),
+        'name': database,
+        'sku_name': rng.choice(('S0', 'GP_Gen5_2', 'BC_Gen5_4')),
+        'max_size_gb': rng.choice((32, 250)),
+        'zone_redundant': rng.random() < 0.3,
+        'tags': _tags(rng),
+    }
+
+
+def _google_compute_instance(rng: random.Random, name: str) -> Dict[str, Any]:
+    zone = rng.choice(GCP_ZONES)
+    project = f'{rng.choice(TEAMS)}-{rng.choice(ENVIRONMENTS)}'
+    instance = f'{name.replace("_", "-")}-{_hex(rng, 4)}'
+    return {
+        'id': f'projects/{project}/zones/{zone}/instances/{instance}',
+        'name': instance,
+        'project': project,
+        'zone': zone,
+        'machine_type': rng.choice(('e2-medium', 'n2-standard-4', 'c3-standard-8')),
+        'network_interface': [{
+            'network': f'projects/{project}/global/networks/default',
+            'network_ip': _ip(rng),
+            'access_config': [{'nat_ip': _ip(rng, 34)}] if rng.random() < 0.2 else [],
+        }],
+        'shielded_instance_config': [{'enable_secure_boot': rng.random() < 0.7}],
+        'labels': {'environment': rng.choice(ENVIRONMENTS), 'team': rng.choice(TEAMS)},
+    }
+
+
+def _google_storage_bucket(rng: random.Random, name: str) -> Dict[str, Any]:
+    project = f'{rng.choice(TEAMS)}-{rng.choice(ENVIRONMENTS)}'
+    bucket = f'{project}-{name.replace("_", "-")}-{_hex(rng, 6)}'
+    return {
+        'id': bucket,
+        'name': bucket,
+        'project': project,
+        'location': rng.choice(('US', 'EU', 'ASIA')),
+        'storage_class': 'STANDARD',
+        'uniform_bucket_level_access': rng.random() < 0.8,
+        'versioning': [{'enabled': rng.random() < 0.5}],
+        'encryption': [{'default_kms_key_name': f'projects/{project}/locations/global/keyRings/kr/cryptoKeys/k'}]
+        if rng.random() < 0.4 else [],
+        'labels': {'environment': rng.choice(ENVIRONMENTS)},
+    }
+
+
+def _google_sql_database_instance(rng: random.Random, name: str) -> Dict[str, Any]:
+    project = f'{rng.choice(TEAMS)}-{rng.choice(ENVIRONMENTS)}'
+    instance = f'{name.replace("_", "-")}-{_hex(rng, 6)}'
+    return {
+        'id': instance,
+        'name': instance,
+        'project': project,
+        'region': rng.choice(GCP_ZONES)[:-2],
+        'database_version': rng.choice(('POSTGRES_15', 'MYSQL_8_0')),
+        'settings': [{
+            'tier': rng.choice(('db-f1-micro', 'db-custom-2-7680')),
+            'availability_type': rng.choice(('ZONAL', 'REGIONAL')),
+            'ip_configuration': [{'ipv4_enabled': rng.random() < 0.3, 'require_ssl': True}],
+        }],
+        'public_ip_address': _ip(rng, 35) if rng.random() < 0.3 else '',
+        'private_ip_address': _ip(rng),
+        'encryption_key_name': '',
+    }
+
+
+# (resource type, relative weight, maximum instances per resource, attribute factory)
+RESOURCE_MIX: Sequence[Tuple[str, int, int, Callable[[random.Random, str], Dict[str, Any]]]] = (
+    ('aws_instance', 24, 8, _aws_instance),
+    ('aws_s3_bucket', 10, 3, _aws_s3_bucket),
+    ('aws_db_instance', 6, 3, _aws_db_instance),
+    ('aws_subnet', 6, 6, _aws_subnet),
+    ('aws_security_group', 8, 4, _aws_security_group),
+    ('aws_iam_role', 6, 2, _aws_iam_role),
+    ('aws_lambda_function', 6, 4, _aws_lambda_function),
+    ('azurerm_linux_virtual_machine', 8, 6, _azurerm_linux_virtual_machine),
+    ('azurerm_storage_account', 4, 2, _azurerm_storage_account),
+    ('azurerm_mssql_database', 3, 2, _azurerm_mssql_database),
+    ('google_compute_instance', 10, 6, _google_compute_instance),
+    ('google_storage_bucket', 6, 2, _google_storage_bucket),
+    ('google_sql_database_instance', 3, 2, _google_sql_database_instance),
+)
+
+_PROVIDERS = {
+    'aws': 'provider["registry.terraform.io/hashicorp/aws"]',
+    'azurerm': 'provider["registry.terraform.io/hashicorp/azurerm"]',
+    'google': 'provider["registry.terraform.io/hashicorp/google"]',
+}
+
+_NAMES = ('web', 'api', 'worker', 'logs', 'data', 'cache', 'batch', 'edge', 'auth', 'billing', 'search', 'ml')
+
+
+def iter_synthetic_resources(instances: int, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """Yield state resources holding ``instances`` instances in total"""
+    rng = random.Random(seed)
+    types = list(RESOURCE_MIX)
+    weights = [weight for _, weight, _, _ in RESOURCE_MIX]
+    remaining = instances
+    serial = 0
+    while remaining > 0:
+        resource_type, _, max_instances, factory = rng.choices(types, weights)[0]
+        count = min(remaining, rng.randint(1, max_instances))
+        name = f'{rng.choice(_NAMES)}_{serial}'
+        serial += 1
+        keyed = count > 1 and rng.random() < 0.3
+        resource_instances = []
+        for idx in range(count):
+            instance = {
+                'schema_version': 1,
+                'attributes': factory(rng, name),
+                'sensitive_attributes': [],
+                'dependencies': [],
+            }
+            if keyed:
+                instance['index_key'] = f'{rng.choice(ENVIRONMENTS)}-{idx}'
+            elif count > 1:
+                instance['index_key'] = idx
+            resource_instances.append(instance)
+        yield {
+            'mode': 'managed',
+            'type': resource_type,
+            'name': name,
+            'provider': _PROVIDERS[resource_type.split('_', 1)[0]],
+            'instances': resource_instances,
+        }
+        remaining -= count
+
+
+def _iter_state_json(instances: int, seed: int) -> Iterator[str]:
+    yield json.dumps({
+        'version': 4,
+        'terraform_version': '1.7.5',
+        'serial': 1,
+        'lineage': f'{random.Random(seed).getrandbits(128):032x}',
+        'outputs': {},
+    })[:-1] + ', "resources": ['
+    for idx, resource in enumerate(iter_synthetic_resources(instances, seed)):
+        yield (', ' if idx else '') + json.dumps(resource)
+    yield '], "check_results": null}'
+
+
+def write_synthetic_state(path: Path, instances: int, seed: int = 0, chunk_size: int = 1 << 20) -> int:
+    """Write a base64 Terraform state with ``instances`` instances; returns its size in bytes"""
+    size = 0
+    with open(path, 'w') as f:
+        pending = bytearray()
+        for text in _iter_state_json(instances, seed):
+            pending += text.encode('utf-8')
+            if len(pending) >= chunk_size:
+                # Encode whole 3-byte groups so the pieces concatenate without padding
+                usable = len(pending) - len(pending) % 3
+                size += f.write(base64.b64encode(pending[:usable]).decode('ascii'))
+                del pending[:usable]
+        size += f.write(base64.b64encode(pending).decode('ascii'))
+    return size
+
+
+CONTROL_FAMILIES = ('AC', 'AU', 'CA', 'CM', 'CP', 'IA', 'IR', 'MA', 'MP', 'PE', 'PL', 'RA', 'SA', 'SC', 'SI', 'SR')
+
+_FINDINGS = (
+    'server-side encryption is not enabled',
+    'is publicly accessible',
+    'does not enforce TLS 1.2 or later',
+    'has no access logging configured',
+    'allows ingress from 0.0.0.0/0',
+    'is missing required tags',
+    'has backups disabled',
+)
+
+
+def synthetic_response(
+    controls: int = 300,
+    findings: int = 3,
+    evidence: int = 2,
+    frameworks: int = 1,
+    not_satisfied: float = 0.25,
+    not_applicable: float = 0.1,
+    artifacts: int = 0,
+    artifact_bytes: int = 1 << 20,
+    seed: int = 0,
+    name: str = 'synthetic-assessment',
+    addresses: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """Build an evidence API response with the given shape
+
+    ``frameworks`` is how many of FRAMEWORKS are assessed, each with
+    ``controls`` controls; not-satisfied controls carry ``findings``
+    findings, every control ``evidence`` evidence items. Artifacts hold
+    ``artifact_bytes`` random bytes each, base64-encoded inline. Findings
+    and evidence name resources from ``addresses`` (``type.name``) when
+    given, e.g. those of a submitted state, and made-up ones otherwise.
+    """
+    rng = random.Random(seed)
+    if not addresses:
+        types = [resource_type for resource_type, _, _, _ in RESOURCE_MIX]
+        addresses = [f'{rng.choice(types)}.{rng.choice(_NAMES)}_{idx}' for idx in range(1000)]
+    assessment = {}
+    for fw_key in FRAMEWORKS[:max(1, min(frameworks, len(FRAMEWORKS)))]:
+        control_list: List[Dict[str, Any]] = []
+        counts = {'satisfied': 0, 'not-satisfied': 0, 'not-applicable': 0}
+        for idx in range(controls):
+            family = CONTROL_FAMILIES[idx % len(CONTROL_FAMILIES)]
+            roll = rng.random()
+            status = (
+                'not-satisfied' if roll < not_satisfied
+                else 'not-applicable' if roll < not_satisfied + not_applicable
+                else 'satisfied'
+            )
+            counts[status] += 1
+            control_list.append({
+                'control_id': f'{family}-{idx // len(CONTROL_FAMILIES) + 1}',
+                'title': f'{family} control {idx + 1}',
+                'status': status,
+                'findings': [
+                    f'{rng.choice(addresses)} {rng.choice(_FINDINGS)}'
+                    for _ in range(findings)
+                ] if status == 'not-satisfied' else [],
+                'evidence': [
+                    f'{rng.choice(addresses)} reviewed'
+                    for _ in range(evidence)
+                ],
+            })
+        assessment[fw_key] = {
+            'id': f'{fw_key}-{seed}',
+            'framework': fw_key.upper().replace('_', ' '),
+            'version': 'Rev. 5',
+            'timestamp': '2025-01-01T00:00:00Z',
+            'controls': control_list,
+            'summary': {
+                'total_controls': controls,
+                'satisfied': counts['satisfied'],
+                'not_satisfied': counts['not-satisfied'],
+                'not_applicable': counts['not-applicable'],
+            },
+        }
+    return {
+        'id': f'{name}-{seed}',
+        'name': name,
+        'status': 'completed',
+        'created_at': '2025-01-01T00:00:00Z',
+        'assessment': assessment,
+        'artifacts': [{
+            'filename': f'artifact-{idx}.bin',
+            'content_type': 'application/octet-stream',
+            'size_bytes': artifact_bytes,
+            'content_base64': base64.b64encode(rng.randbytes(artifact_bytes)).decode('ascii'),
+            'diagram': 'graph TD; state-->assessment' if idx == 0 else None,
+        } for idx in range(artifacts)],
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Write synthetic Terraform states and assessment responses')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    state = commands.add_parser('state', help='Base64 Terraform state')
+    state.add_argument('instances', type=parse_count, help='Resource instances, e.g. 1000, 100k or 1m')
+    state.add_argument('output', type=Path, help='Output .tfstate.b64 path')
+    state.add_argument('--seed', type=int, default=0, help='Random seed')
+
+    response = commands.add_parser('response', help='Evidence API response JSON')
+    response.add_argument('output', type=Path, help='Output .json path')
+    response.add_argument('--controls', type=int, default=300, help='Controls per framework')
+    response.add_argument('--findings', type=int, default=3, help='Findings per not-satisfied control')
+    response.add_argument('--frameworks', type=int, default=1, help='Frameworks assessed')
+    response.add_argument('--artifacts', type=int, default=0, help='Inline artifacts')
+    response.add_argument('--artifact-kb', type=int, default=1024, help='Size of each artifact in KiB')
+    response.add_argument('--seed', type=int, default=0, help='Random seed')
+    args = parser.parse_args(argv)
+
+    if args.command == 'state':
+        size = write_synthetic_state(args.output, args.instances, args.seed)
+        print(f"✅ {args.output}: {args.instances} instances, {size} bytes")
+    else:
+        with open(args.output, 'w') as f:
+            json.dump(synthetic_response(
+                controls=args.controls,
+                findings=args.findings,
+                frameworks=args.frameworks,
+                artifacts=args.artifacts,
+                artifact_bytes=args.artifact_kb * 1024,
+                seed=args.seed
+            ), f)
+        print(f"✅ {args.output}: {args.output.stat().st_size} bytes")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,347 @@
+"""Watch mode: keep a generator warm and re-run it when a state file changes
+
+``StateWatcher`` waits for watched Terraform state files to change. On
+Linux it listens to inotify events on their directories (through ctypes,
+no dependency), elsewhere or with ``polling`` it compares each file's
+size, mtime and inode every ``poll_interval`` seconds. Writes are
+debounced: a change is reported once the file has been quiet for
+``debounce`` seconds, and only if its signature differs from the last one
+processed, so a touch or a half-written file never triggers a run.
+
+``WarmWorkspace`` keeps what a run needs in memory between changes: the
+state's per-instance fingerprints, the compact asset inventory and the last
+assessment. A change is diffed against the fingerprints, only changed and
+dependent resources are re-assessed and re-extracted, and the caller is
+told which report tables are affected.
+"""
+
+import os
+import select
+import signal
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .cli import DEBOUNCE_SECONDS, POLL_INTERVAL
+from .delta import AmbiguousAddresses, StateDelta, _resource_address, diff_states, state_fingerprints
+from .inventory import AssetInventory, extract_asset_inventory, iter_asset_inventory
+from .profiling import traced
+from .response import discard_spooled
+from .state import StateFile
+
+# Report tables, all of which a full run writes
+REPORT_TABLES = frozenset(('assets', 'controls', 'findings', 'summary'))
+
+# inotify(7) event bits
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_WATCH_MASK = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_EVENT = struct.Struct('iIII')
+
+Signature = Optional[Tuple[int, int, int]]
+
+
+def _signature(path: Path) -> Signature:
+    """(size, mtime, inode) of a file, or None while it does not exist"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+class _Inotify:
+    """Minimal inotify binding; raises OSError where it is unavailable"""
+
+    def __init__(self):
+        if not sys.platform.startswith('linux'):
+            raise OSError('inotify is only available on Linux')
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.fd = fd
+        self._ctypes = ctypes
+
+    def add_watch(self, directory: Path) -> int:
+        wd = self._add_watch(self.fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            errno = self._ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), str(directory))
+        return wd
+
+    def read(self, timeout: float) -> List[Tuple[int, int, str]]:
+        """(watch descriptor, mask, file name) events, waiting up to timeout"""
+        ready, _, _ = select.select([self.fd], [], [], max(0.0, timeout))
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+            events.append((wd, mask, name))
+        return events
+
+    def close(self):
+        os.close(self.fd)
+
+
+class StateWatcher:
+    """Report watched state files once they changed and writes settled"""
+
+    def __init__(
+        self,
+        paths: Iterable[Union[str, os.PathLike]],
+        debounce: float = DEBOUNCE_SECONDS,
+        poll_interval: float = POLL_INTERVAL,
+        polling: bool = False
+    ):
+        self.paths = [Path(os.path.abspath(path)) for path in paths]
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        # Signature last handed out, and last seen while polling
+        self._processed: Dict[Path, Signature] = {path: _signature(path) for path in self.paths}
+        self._seen = dict(self._processed)
+        self._inotify: Optional[_Inotify] = None
+        self._watches: Dict[int, Dict[str, Path]] = {}
+        if not polling:
+            self._start_inotify()
+        self.backend = 'inotify' if self._inotify is not None else 'polling'
+
+    def _start_inotify(self):
+        try:
+            inotify = _Inotify()
+        except (OSError, AttributeError):
+            return
+        try:
+            by_directory: Dict[Path, Dict[str, Path]] = {}
+            for path in self.paths:
+                by_directory.setdefault(path.parent, {})[path.name] = path
+            for directory, names in by_directory.items():
+                self._watches[inotify.add_watch(directory)] = names
+        except OSError:
+            # e.g. fs.inotify.max_user_watches reached
+            inotify.close()
+            self._watches.clear()
+            return
+        self._inotify = inotify
+
+    def _activity(self, timeout: float) -> Set[Path]:
+        """Paths written to within timeout seconds"""
+        if self._inotify is not None:
+            active = set()
+            for wd, mask, name in self._inotify.read(timeout):
+                if mask & _IN_Q_OVERFLOW:
+                    active.update(self.paths)
+                elif name in self._watches.get(wd, {}):
+                    active.add(self._watches[wd][name])
+            return active
+
+        time.sleep(max(0.0, timeout))
+        active = set()
+        for path in self.paths:
+            signature = _signature(path)
+            if signature != self._seen[path]:
+                self._seen[path] = signature
+                active.add(path)
+        return active
+
+    def _settled(self, pending: Set[Path]) -> List[Path]:
+        """Pending paths whose content differs from what was last processed"""
+        changed = []
+        for path in sorted(pending):
+            signature = _signature(path)
+            if signature is not None and signature != self._processed[path]:
+                self._processed[path] = signature
+                changed.append(path)
+        return changed
+
+    def wait(self, timeout: Optional[float] = None) -> List[Path]:
+        """Block until watched files changed and settled; [] after timeout seconds"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pending: Set[Path] = set()
+        last_activity = 0.0
+        while True:
+            now = time.monotonic()
+            if pending and now - last_activity >= self.debounce:
+                changed = self._settled(pending)
+                pending.clear()
+                if changed:
+                    return changed
+            if deadline is not None and now >= deadline and not pending:
+                return []
+
+            wait_for = self.poll_interval
+            if pending:
+                wait_for = min(wait_for, last_activity + self.debounce - now)
+            if deadline is not None:
+                wait_for = min(wait_for, max(0.0, deadline - now))
+            active = self._activity(wait_for)
+            if active:
+                pending |= active
+                last_activity = time.monotonic()
+
+    def close(self):
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+
+def splice_inventory(previous: AssetInventory, delta: StateDelta) -> AssetInventory:
+    """Previous inventory with the delta's resources re-extracted, in state order
+
+    Only the resources the delta submits are parsed again; every other
+    asset is carried over from the previous inventory.
+    """
+    fresh: Dict[str, List] = {address: [] for address in map(_resource_address, delta.resources)}
+    if delta.resources:
+        for asset in iter_asset_inventory(delta.to_state_b64()):
+            fresh[asset['asset_id'].rsplit('.', 1)[0]].append(asset)
+
+    removed = set(delta.removed)
+    kept: Dict[str, List] = {}
+    for record in previous:
+        asset_id = record['asset_id']
+        if asset_id not in removed:
+            kept.setdefault(asset_id.rsplit('.', 1)[0], []).append(record)
+
+    def assets():
+        for address in delta.order:
+            yield from fresh[address] if address in fresh else kept.get(address, ())
+    return AssetInventory(assets())
+
+
+class WarmWorkspace:
+    """In-memory state of one watched Terraform state between runs"""
+
+    def __init__(self, tfstate_path: Path, extract_workers: int = 1):
+        self.tfstate_path = tfstate_path
+        # Processes for full extractions; a splice only re-extracts the delta
+        self.extract_workers = extract_workers
+        self.fingerprints: Optional[Dict[str, str]] = None
+        self.inventory: Optional[AssetInventory] = None
+        self.response: Optional[Dict] = None
+
+    @traced('watch.refresh')
+    def refresh(
+        self,
+        client,
+        name: str,
+        output_format: str = 'json',
+        include_diagram: bool = False
+    ) -> Set[str]:
+        """Bring the workspace up to date with its state file
+
+        The first call runs a full assessment; later ones assess the delta
+        since the previous call. A state whose ``type.name`` addresses repeat
+        (e.g. across modules) is assessed in full every time. Returns the
+        affected REPORT_TABLES, empty when the state's resources did not
+        change. Nothing is updated if the assessment fails, so the next
+        change is diffed against the last good run. The state file is
+        decoded once per call.
+        """
+        with StateFile(self.tfstate_path) as state:
+            delta = None
+            if self.response is not None and self.fingerprints is not None:
+                print(f"\n🔀 Diffing against the last run (assessment {self.response.get('id', 'N/A')})")
+                try:
+                    delta = diff_states(self.fingerprints, state, keep_fingerprints=True)
+                except AmbiguousAddresses as e:
+                    print(f"⚠️  {e}, running a full assessment")
+
+            if delta is None:
+                try:
+                    fingerprints = state_fingerprints(state)
+                except AmbiguousAddresses:
+                    fingerprints = None
+                inventory = extract_asset_inventory(state, self.extract_workers)
+                response = client.analyze_terraform_state(
+                    state,
+                    name=name,
+                    output_format=output_format,
+                    include_diagram=include_diagram
+                )
+                tables = set(REPORT_TABLES)
+            else:
+                fingerprints = delta.fingerprints
+                response = client.assess_delta(
+                    delta,
+                    self.response,
+                    name=name,
+                    output_format=output_format,
+                    include_diagram=include_diagram
+                )
+                if delta.is_empty:
+                    self.fingerprints = fingerprints
+                    return set()
+                inventory = splice_inventory(self.inventory, delta)
+                tables = {'assets', 'summary'}
+                if response.get('assessment') != self.response.get('assessment'):
+                    tables |= {'controls', 'findings'}
+
+        if self.response is not None:
+            discard_spooled(self.response, keep=response)
+        self.fingerprints, self.inventory, self.response = fingerprints, inventory, response
+        return tables
+
+
+def watch(
+    tfstate_paths: List[Path],
+    run: Callable[[Path], None],
+    debounce: float = DEBOUNCE_SECONDS,
+    poll_interval: float = POLL_INTERVAL,
+    polling: bool = False
+) -> int:
+    """Call ``run(path)`` for every state now and again whenever one changes
+
+    A failed run is reported and the state watched on, so the next write
+    retries it. Stops on Ctrl+C or SIGTERM; returns 0.
+    """
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+
+    if hasattr(signal, 'SIGTERM'):
+        signal.signal(signal.SIGTERM, stop)
+
+    watcher = StateWatcher(tfstate_paths, debounce, poll_interval, polling)
+    given = dict(zip(watcher.paths, tfstate_paths))
+    try:
+        pending = list(watcher.paths)
+        while True:
+            for path in pending:
+                started = time.perf_counter()
+                try:
+                    run(given[path])
+                except Exception as e:
+                    print(f"\n❌ Run failed for {path}: {e}")
+                    continue
+                print(f"\n⏱️  {path.name} done in {time.perf_counter() - started:.2f}s")
+            print(f"\n👀 Watching {len(watcher.paths)} state file(s) with {watcher.backend} "
+                  f"(debounce {watcher.debounce:g}s); Ctrl+C to stop", flush=True)
+            pending = watcher.wait()
+            print(f"\n🔔 Changed: {', '.join(path.name for path in pending)}")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    finally:
+        watcher.close()
+    return 0
@@ -0,0 +1,75 @@
+import base64
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+# The scripts and the nabla_evidence package are served from public/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, 'public'))
+
+
+def make_state(resources, **header):
+    """A Terraform state document holding the given resources"""
+    state = {'version': 4, 'terraform_version': '1.6.0', 'serial': 1, 'lineage': 'test'}
+    state.update(header)
+    state['resources'] = resources
+    return state
+
+
+def make_resource(type_, name, *attributes, mode='managed', dependencies=None):
+    """A resource with one instance per attributes dict"""
+    instances = []
+    for attrs in attributes or ({},):
+        instance = {'schema_version': 0, 'attributes': attrs}
+        if dependencies:
+            instance['dependencies'] = list(dependencies)
+        instances.append(instance)
+    return {
+        'mode': mode,
+        'type': type_,
+        'name': name,
+        'provider': 'provider["registry.terraform.io/hashicorp/aws"]',
+        'instances': instances,
+    }
+
+
+@pytest.fixture
+def write_state(tmp_path):
+    """Write a state document to a .tfstate file and return its path"""
+    counter = iter(range(1 << 30))
+
+    def write(state, suffix='.tfstate'):
+        path = tmp_path / f"state-{next(counter)}{suffix}"
+        data = json.dumps(state).encode('utf-8')
+        if suffix.endswith('.b64'):
+            data = base64.b64encode(data)
+        elif suffix.endswith('.gz'):
+            import gzip
+            data = gzip.compress(data)
+        path.write_bytes(data)
+        return path
+
+    return write
+
+
+@pytest.fixture
+def mock_api():
+    """Start a mock evidence API with the given MockOptions keywords; returns the server"""
+    from nabla_evidence.mockserver import MockEvidenceServer, MockOptions
+
+    servers = []
+
+    def start(**options):
+        options.setdefault('controls', 5)
+        options.setdefault('artifacts', 0)
+        server = MockEvidenceServer(('127.0.0.1', 0), MockOptions(**options))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
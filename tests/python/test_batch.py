@@ -0,0 +1,71 @@
+from nabla_evidence.batch import discover_state_files, run_batch, workspace_names
+
+
+def test_discover_state_files_from_manifest(tmp_path):
+    (tmp_path / 'a.tfstate').write_text('{}')
+    (tmp_path / 'b.tfstate.b64').write_text('e30=')
+    manifest = tmp_path / 'workspaces.txt'
+    manifest.write_text('# prod\na.tfstate\n\n' + str(tmp_path / 'b.tfstate.b64') + '\n')
+
+    assert discover_state_files(manifest) == [tmp_path / 'a.tfstate', tmp_path / 'b.tfstate.b64']
+    assert discover_state_files(tmp_path) == [tmp_path / 'a.tfstate', tmp_path / 'b.tfstate.b64']
+
+
+def test_workspace_names_are_unique(tmp_path):
+    paths = [tmp_path / 'x' / 'prod.tfstate', tmp_path / 'y' / 'prod.tfstate.gz', tmp_path / 'dev.tfstate.b64']
+    assert workspace_names(paths) == ['prod', 'prod-2', 'dev']
+
+
+def test_missing_state_fails_only_its_workspace(tmp_path):
+    present = tmp_path / 'present.tfstate'
+    present.write_text('{}')
+    ran = []
+
+    succeeded = run_batch(
+        lambda path, workspace_dir, name: ran.append(name),
+        [tmp_path / 'missing.tfstate', present],
+        tmp_path / 'out',
+        workers=2
+    )
+
+    assert not succeeded
+    assert ran == ['present']
+
+
+def test_failing_job_does_not_stop_the_batch(tmp_path):
+    paths = []
+    for name in ('a', 'b', 'c'):
+        path = tmp_path / f'{name}.tfstate'
+        path.write_text('{}')
+        paths.append(path)
+    ran = []
+
+    def job(path, workspace_dir, name):
+        ran.append(name)
+        if name == 'b':
+            raise RuntimeError('boom')
+
+    assert not run_batch(job, paths, tmp_path / 'out', workers=1)
+    assert ran == ['a', 'b', 'c']
+
+
+def test_workspace_lines_are_prefixed_and_whole(tmp_path, capsys):
+    paths = []
+    for name in ('a', 'b'):
+        path = tmp_path / f'{name}.tfstate'
+        path.write_text('{}')
+        paths.append(path)
+
+    def job(path, workspace_dir, name):
+        for i in range(50):
+            print(f"step {i}", end='')
+            print(" done")
+
+    assert run_batch(job, paths, tmp_path / 'out', workers=2)
+
+    lines = capsys.readouterr().out.splitlines()
+    for name in ('a', 'b'):
+        assert [line for line in lines if line.startswith(f'[{name}] ')] == [
+            f'[{name}] step {i} done' for i in range(50)
+        ]
+    assert '✅ Workspace complete: a' in lines
@@ -0,0 +1,54 @@
+import os
+import time
+
+from conftest import make_resource, make_state
+from nabla_evidence.cache import ResponseCache
+
+
+def _response(assessment_id):
+    return {'id': assessment_id, 'status': 'completed', 'assessment': {}}
+
+
+def _age(path, atime=None, mtime=None):
+    stat = path.stat()
+    os.utime(path, (atime if atime is not None else stat.st_atime, mtime if mtime is not None else stat.st_mtime))
+
+
+def test_key_depends_on_state_content_and_options(write_state):
+    state = make_state([make_resource('aws_vpc', 'main', {'id': 'vpc-1'})])
+    raw, encoded = write_state(state), write_state(state, '.tfstate.b64')
+    key = ResponseCache.key(raw, 'run', 'json', False)
+    assert ResponseCache.key(encoded, 'run', 'json', False) == key
+    assert ResponseCache.key(raw, 'run', 'json', True) != key
+    other = write_state(make_state([make_resource('aws_vpc', 'main', {'id': 'vpc-2'})]))
+    assert ResponseCache.key(other, 'run', 'json', False) != key
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    cache = ResponseCache(tmp_path, ttl_seconds=60)
+    cache.put('a', _response('a-1'))
+    assert cache.get('a')['id'] == 'a-1'
+
+    _age(tmp_path / 'a.json', mtime=time.time() - 61)
+    assert cache.get('a') is None
+    assert not (tmp_path / 'a.json').exists()
+
+
+def test_refresh_skips_reads(tmp_path):
+    ResponseCache(tmp_path).put('a', _response('a-1'))
+    assert ResponseCache(tmp_path, refresh=True).get('a') is None
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = ResponseCache(tmp_path)
+    cache.put('a', _response('a-1'))
+    cache.put('b', _response('b-1'))
+    cache.max_bytes = 2 * (tmp_path / 'a.json').stat().st_size
+
+    now = time.time()
+    _age(tmp_path / 'a.json', atime=now - 200)
+    _age(tmp_path / 'b.json', atime=now - 100)
+    assert cache.get('a')['id'] == 'a-1'
+
+    cache.put('c', _response('c-1'))
+    assert sorted(path.name for path in tmp_path.glob('*.json')) == ['a.json', 'c.json']
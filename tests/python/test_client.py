@@ -0,0 +1,90 @@
+import base64
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from conftest import make_resource, make_state
+from nabla_evidence import client as client_module
+from nabla_evidence.client import APIError, EvidenceClient, RetryPolicy
+from nabla_evidence.response import read_response
+
+
+STATE = make_state([make_resource('aws_vpc', 'main', {'id': 'vpc-1'})])
+
+
+def test_rejected_gzip_falls_back_once(mock_api, write_state, capsys):
+    server = mock_api(reject_gzip=True)
+    client = EvidenceClient('test', server.url)
+    path = write_state(STATE)
+
+    assert client.analyze_terraform_state(path)['status']
+    assert client.analyze_terraform_state(path)['status']
+    assert not client.compress_uploads
+    assert capsys.readouterr().out.count('Compressed upload rejected (415') == 1
+
+
+def test_other_errors_keep_compression(write_state, monkeypatch):
+    client = EvidenceClient('test', 'http://127.0.0.1:9')
+
+    def bad_request(method, url, data=None, headers=None):
+        raise APIError("bad request", 400)
+
+    monkeypatch.setattr(client, '_request_json', bad_request)
+    with pytest.raises(APIError):
+        client.analyze_terraform_state(write_state(STATE))
+    assert client.compress_uploads
+
+
+def test_retry_honours_retry_after(monkeypatch):
+    client = EvidenceClient('test', 'http://127.0.0.1:9', retry_policy=RetryPolicy(backoff_base=100.0))
+    replies = [
+        APIError("throttled", 429, headers={'Retry-After': '2'}),
+        APIError("unavailable", 503, headers={'Retry-After': '0.5'}),
+        {'id': 'done'},
+    ]
+
+    def attempt(method, url, data, headers, timeout):
+        reply = replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    sleeps = []
+    monkeypatch.setattr(client, '_attempt_json', attempt)
+    monkeypatch.setattr(client_module.time, 'sleep', sleeps.append)
+    assert client._request_json('GET', 'http://127.0.0.1:9/') == {'id': 'done'}
+    assert sleeps == [2.0, 0.5]
+
+
+def test_hedged_loser_spool_is_discarded(monkeypatch):
+    client = EvidenceClient('test', 'http://127.0.0.1:9', retry_policy=RetryPolicy(hedge=True, hedge_after=0.05))
+    content = base64.b64encode(b'artifact').decode('ascii')
+    calls = []
+    release_loser = threading.Event()
+    loser_files = []
+
+    def send(method, url, data, headers, timeout):
+        calls.append(None)
+        first = len(calls) == 1
+        if first:
+            release_loser.wait(5)
+        body = json.dumps({'id': 'slow' if first else 'fast',
+                           'artifacts': [{'filename': 'a.bin', 'content_base64': content}]})
+        response = read_response([body.encode('utf-8')])
+        if first:
+            loser_files.append(response['artifacts'][0]['content_file'])
+        return response
+
+    monkeypatch.setattr(client, '_send_json', send)
+    winner = client._attempt_json('GET', 'http://127.0.0.1:9/', None, {}, 10.0)
+    assert winner['id'] == 'fast'
+
+    release_loser.set()
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline and (not loser_files or os.path.exists(loser_files[0])):
+        time.sleep(0.01)
+    assert loser_files and not os.path.exists(loser_files[0])
+    assert os.path.exists(winner['artifacts'][0]['content_file'])
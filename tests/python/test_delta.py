@@ -0,0 +1,123 @@
+import pytest
+
+from conftest import make_resource, make_state
+
+from nabla_evidence.client import EvidenceClient
+from nabla_evidence.delta import AmbiguousAddresses, diff_states, merge_delta_assessment
+
+
+def _assessment(*controls):
+    return {'id': 'base', 'assessment': {'framework': 'fedramp', 'controls': list(controls)}}
+
+
+def _control(control_id, status, findings=(), evidence=()):
+    return {'control_id': control_id, 'status': status, 'findings': list(findings), 'evidence': list(evidence)}
+
+
+def _states(write_state):
+    vpc = make_resource('aws_vpc', 'main', {'id': 'vpc-1', 'cidr_block': '10.0.0.0/16'})
+    bucket = make_resource('aws_s3_bucket', 'logs', {'id': 'logs'})
+    changed_vpc = make_resource('aws_vpc', 'main', {'id': 'vpc-1', 'cidr_block': '10.1.0.0/16'})
+    previous = write_state(make_state([vpc, bucket]))
+    current = write_state(make_state([changed_vpc, bucket]))
+    return previous, current
+
+
+def test_diff_states_selects_changed_resources_and_dependents(write_state):
+    vpc = make_resource('aws_vpc', 'main', {'id': 'vpc-1'})
+    subnet = make_resource('aws_subnet', 'a', {'id': 'subnet-1'}, dependencies=['aws_vpc.main'])
+    bucket = make_resource('aws_s3_bucket', 'logs', {'id': 'logs'})
+    previous = write_state(make_state([vpc, subnet, bucket]))
+    current = write_state(make_state([make_resource('aws_vpc', 'main', {'id': 'vpc-2'}), subnet]))
+
+    delta = diff_states(previous, current)
+
+    assert delta.changed == ['aws_vpc.main.0']
+    assert delta.removed == ['aws_s3_bucket.logs.0']
+    assert delta.touched == {'aws_vpc.main', 'aws_subnet.a', 'aws_s3_bucket.logs'}
+    assert [r['type'] for r in delta.resources] == ['aws_vpc', 'aws_subnet']
+
+
+def test_untouched_control_keeps_previous_status(write_state):
+    previous_state, current_state = _states(write_state)
+    delta = diff_states(previous_state, current_state)
+    previous = _assessment(
+        _control('AU-2', 'satisfied', evidence=['aws_s3_bucket.logs has access logging']),
+        _control('SC-7', 'satisfied', evidence=['aws_vpc.main has flow logs']),
+    )
+    # The partial delta state lacks the bucket, so the API reports it absent
+    fresh = _assessment(
+        _control('AU-2', 'not-satisfied', findings=['No aws_s3_bucket with access logging found']),
+        _control('SC-7', 'satisfied', evidence=['aws_vpc.main has flow logs']),
+    )
+
+    merged = merge_delta_assessment(previous, fresh, delta)
+
+    controls = {c['control_id']: c for c in merged['assessment']['controls']}
+    assert controls['AU-2']['status'] == 'satisfied'
+    assert controls['AU-2']['findings'] == []
+    assert controls['AU-2']['evidence'] == ['aws_s3_bucket.logs has access logging']
+    assert merged['assessment']['summary']['not_satisfied'] == 0
+
+
+def test_touched_control_takes_fresh_findings(write_state):
+    previous_state, current_state = _states(write_state)
+    delta = diff_states(previous_state, current_state)
+    previous = _assessment(_control('SC-7', 'satisfied', evidence=['aws_vpc.main has flow logs']))
+    fresh = _assessment(_control('SC-7', 'not-satisfied', findings=['aws_vpc.main allows 0.0.0.0/0 ingress']))
+
+    merged = merge_delta_assessment(previous, fresh, delta)
+
+    control = merged['assessment']['controls'][0]
+    assert control['status'] == 'not-satisfied'
+    assert control['findings'] == ['aws_vpc.main allows 0.0.0.0/0 ingress']
+    assert control['evidence'] == []
+    assert merged['delta']['changed_assets'] == 1
+
+
+def test_resolved_finding_marks_control_satisfied(write_state):
+    previous_state, current_state = _states(write_state)
+    delta = diff_states(previous_state, current_state)
+    previous = _assessment(_control('SC-7', 'not-satisfied', findings=['aws_vpc.main allows 0.0.0.0/0 ingress']))
+    fresh = _assessment(_control('SC-7', 'satisfied', evidence=['aws_vpc.main restricts ingress']))
+
+    merged = merge_delta_assessment(previous, fresh, delta)
+
+    control = merged['assessment']['controls'][0]
+    assert control['status'] == 'satisfied'
+    assert control['findings'] == []
+    assert control['evidence'] == ['aws_vpc.main restricts ingress']
+
+
+def _module_buckets(*ids):
+    return [
+        dict(make_resource('aws_s3_bucket', 'logs', {'id': bucket_id}), module=f'module.{bucket_id}')
+        for bucket_id in ids
+    ]
+
+
+def test_repeated_address_is_ambiguous(write_state):
+    single = write_state(make_state(_module_buckets('a')))
+    repeated = write_state(make_state(_module_buckets('a', 'b')))
+
+    with pytest.raises(AmbiguousAddresses, match='aws_s3_bucket.logs'):
+        diff_states(single, repeated)
+    with pytest.raises(AmbiguousAddresses):
+        diff_states(repeated, single)
+
+
+def test_delta_with_repeated_address_runs_full_assessment(write_state, monkeypatch):
+    previous_state = write_state(make_state(_module_buckets('a', 'b')))
+    current_state = write_state(make_state(_module_buckets('a', 'c')))
+    client = EvidenceClient('test', 'http://127.0.0.1:9')
+    submitted = []
+
+    def analyze(tfstate, **kwargs):
+        submitted.append(tfstate)
+        return {'id': 'full', 'assessment': {}}
+
+    monkeypatch.setattr(client, 'analyze_terraform_state', analyze)
+    response = client.analyze_terraform_state_delta(previous_state, current_state, _assessment())
+
+    assert response['id'] == 'full'
+    assert submitted == [current_state]
@@ -0,0 +1,32 @@
+from conftest import make_resource, make_state
+from nabla_evidence.inventory import asset_fieldnames, extract_asset_inventory
+
+
+def test_asset_type_is_the_resource_type(write_state):
+    path = write_state(make_state([
+        make_resource('aws_vpc', 'main', {'id': 'vpc-1', 'cidr_block': '10.0.0.0/16'}),
+        make_resource('azurerm_virtual_network', 'net', {'id': 'vnet-1'}),
+        make_resource('google_compute_network', 'net', {'id': 'net-1'}),
+        make_resource('aws_unregistered_thing', 'x', {'id': 'x-1'}),
+    ]))
+    assets = {asset['resource_type']: asset for asset in extract_asset_inventory(path)}
+    for resource_type, asset in assets.items():
+        assert asset['asset_type'] == resource_type
+    assert assets['aws_vpc']['display_name'] == 'VPC'
+    assert assets['aws_vpc']['cidr_block'] == '10.0.0.0/16'
+    assert assets['aws_unregistered_thing']['display_name'] == 'aws_unregistered_thing'
+
+
+def test_labelled_asset_types_are_kept(write_state):
+    path = write_state(make_state([
+        make_resource('aws_instance', 'web', {'id': 'i-1', 'instance_type': 't3.micro'}),
+        make_resource('aws_s3_bucket', 'logs', {'id': 'logs', 'bucket': 'logs'}),
+        make_resource('aws_db_instance', 'db', {'id': 'db-1', 'engine': 'postgres'}),
+    ]))
+    types = [asset['asset_type'] for asset in extract_asset_inventory(path)]
+    assert types == ['EC2 Instance', 'S3 Bucket', 'RDS Database']
+
+
+def test_fieldnames_include_display_name():
+    fields = asset_fieldnames()
+    assert 'asset_type' in fields and 'display_name' in fields
@@ -0,0 +1,51 @@
+import base64
+import json
+
+import pytest
+
+from conftest import make_resource, make_state
+from nabla_evidence import parallel
+from nabla_evidence.inventory import extract_asset_inventory
+
+
+def _tricky_state(count):
+    resources = []
+    for i in range(count):
+        resources.append(make_resource(
+            ['aws_instance', 'aws_s3_bucket', 'aws_vpc', 'google_compute_instance'][i % 4], f'r{i}',
+            {'id': f'id-{i}', 'name': f'"}}, {{"mode": "managed"}}, [{i}] \\ ☃',
+             'tags': {'Name': f'r{i}', 'braces': '{[()]}'}},
+            {'id': f'id-{i}-b', 'count': i * 1.5},
+        ))
+    return make_state(resources, outputs={'resources': {'value': ['not', 'these']}})
+
+
+@pytest.fixture
+def small_shards(monkeypatch):
+    monkeypatch.setattr(parallel, 'MIN_SHARD_BYTES', 4 << 10)
+
+
+def _rows(inventory):
+    return [dict(asset) for asset in inventory]
+
+
+@pytest.mark.parametrize('suffix', ['.tfstate', '.tfstate.gz', '.tfstate.b64'])
+def test_sharded_extraction_matches_serial(small_shards, write_state, suffix):
+    path = write_state(_tricky_state(120), suffix)
+    shards = list(parallel.iter_shards(parallel._shared_state(path), workers=2))
+    assert len(shards) > 1
+    serial = _rows(extract_asset_inventory(path))
+    assert [row for shard in shards for row in _rows(shard)] == serial
+    assert _rows(parallel.extract_sharded(path, workers=2)) == serial
+    assert [dict(asset) for asset in parallel.iter_sharded(str(path), workers=2)] == serial
+
+
+def test_sharded_base64_content_matches_serial(small_shards):
+    content = base64.b64encode(json.dumps(_tricky_state(80)).encode('utf-8')).decode('ascii')
+    assert _rows(parallel.extract_sharded(content, workers=2)) == _rows(extract_asset_inventory(content))
+
+
+def test_small_state_is_not_sharded(write_state):
+    path = write_state(_tricky_state(3))
+    with pytest.raises(parallel.Unshardable):
+        list(parallel.iter_shards(parallel._shared_state(path), workers=2))
@@ -0,0 +1,54 @@
+import base64
+import json
+import os
+import stat
+
+from nabla_evidence.artifacts import write_artifacts
+from nabla_evidence.response import is_spooled, read_response
+
+
+def _chunks(data, size=7):
+    return (data[i:i + size] for i in range(0, len(data), size))
+
+
+def test_read_response_spools_artifact_content():
+    content = os.urandom(5000)
+    body = json.dumps({
+        'id': 'a-1',
+        'artifacts': [{'filename': 'report.pdf', 'content_base64': base64.b64encode(content).decode('ascii')}],
+        'note': 'café \\/ done',
+    }).encode('utf-8')
+
+    response = read_response(_chunks(body))
+
+    artifact = response['artifacts'][0]
+    assert 'content_base64' not in artifact
+    assert is_spooled(artifact['content_file'])
+    with open(artifact['content_file'], 'rb') as f:
+        assert f.read() == content
+    assert response['note'] == 'café \\/ done'
+
+
+def test_invalid_artifact_content_is_reported_not_raised():
+    body = json.dumps({'artifacts': [{'filename': 'x.bin', 'content_base64': 'not base64!'}], 'id': 'a-2'})
+
+    response = read_response(_chunks(body.encode('utf-8')))
+
+    assert response['id'] == 'a-2'
+    assert response['artifacts'][0]['content_error'].startswith('Invalid base64 content')
+
+
+def test_saved_spooled_artifact_gets_umask_permissions(tmp_path):
+    body = json.dumps({'artifacts': [{'filename': 'report.bin', 'content_base64': base64.b64encode(b'x' * 100).decode()}]})
+
+    old_umask = os.umask(0o022)
+    try:
+        response = read_response(_chunks(body.encode('utf-8')))
+        writes = write_artifacts(response['artifacts'], tmp_path)
+    finally:
+        os.umask(old_umask)
+
+    assert [write.error for write in writes] == [None]
+    saved = tmp_path / 'report.bin'
+    assert saved.read_bytes() == b'x' * 100
+    assert stat.S_IMODE(saved.stat().st_mode) == 0o644
@@ -0,0 +1,91 @@
+import base64
+import json
+
+import pytest
+
+from conftest import make_resource, make_state
+from nabla_evidence.inventory import extract_asset_inventory
+from nabla_evidence.state import iter_state_resources, iter_tfstate_resources
+
+
+EDGE_RESOURCES = [
+    make_resource('aws_s3_bucket', 'escapes', {
+        'bucket': 'quote " backslash \\ slash / tab \t newline \n',
+        'control': '\x00\x1f\x7f',
+    }),
+    make_resource('aws_s3_bucket', 'unicode', {
+        'bucket': 'café ☃ \U0001f600 ퟿ ',
+        'tags': {'über': '\U0001f512'},
+    }),
+    make_resource('aws_instance', 'numbers', {
+        'count': 1234567890123456789,
+        'ratio': -0.000125,
+        'exponent': 6.02e+23,
+        'negative': -7,
+        'zero': 0,
+        'flags': [True, False, None],
+    }),
+    make_resource('aws_vpc', 'empty', {'cidr_block': '', 'tags': {}, 'ids': []}),
+]
+
+
+def _chunked(text, size):
+    return (text[i:i + size] for i in range(0, len(text), size))
+
+
+@pytest.mark.parametrize('ensure_ascii', [True, False])
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 5, 7, 64])
+def test_stream_matches_json_loads(chunk_size, ensure_ascii):
+    text = json.dumps(make_state(EDGE_RESOURCES), ensure_ascii=ensure_ascii)
+    header = {}
+    resources = list(iter_tfstate_resources(_chunked(text, chunk_size), header))
+    expected = json.loads(text)
+    assert resources == expected['resources']
+    assert header == {k: v for k, v in expected.items() if k != 'resources'}
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 11])
+def test_stream_matches_json_loads_with_whitespace(chunk_size):
+    text = json.dumps(make_state(EDGE_RESOURCES), indent='\t', separators=(' , ', ' : '))
+    assert list(iter_tfstate_resources(_chunked(text, chunk_size))) == json.loads(text)['resources']
+
+
+def test_stream_surrogate_pair_split_across_chunks():
+    text = '{"resources": [{"name": "\\ud83d\\ude00\\u00e9"}]}'
+    for size in range(1, len(text)):
+        assert list(iter_tfstate_resources(_chunked(text, size))) == [{'name': '\U0001f600é'}]
+
+
+@pytest.mark.parametrize('text', [
+    '{}',
+    '{"resources": []}',
+    '{"version": 4, "outputs": {"a": {"value": [1, 2]}}, "resources": [], "check_results": null}',
+])
+def test_stream_empty_resources(text):
+    assert list(iter_tfstate_resources(_chunked(text, 2))) == []
+
+
+@pytest.mark.parametrize('text', ['{"resources": [1, 2', '{"resources": [{"a": "b}]}', '[]'])
+def test_stream_rejects_invalid_json(text):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_tfstate_resources(_chunked(text, 3)))
+
+
+def test_state_given_as_str_path(write_state):
+    state = make_state([make_resource('aws_vpc', 'main', {'id': 'vpc-1'})])
+    for suffix in ('.tfstate', '.tfstate.b64', '.tfstate.gz'):
+        path = write_state(state, suffix)
+        assert list(iter_state_resources(str(path))) == state['resources']
+        assert len(extract_asset_inventory(str(path))) == 1
+
+
+def test_state_given_as_base64_content():
+    state = make_state([make_resource('aws_vpc', 'main', {'id': 'vpc-1'})])
+    content = base64.b64encode(json.dumps(state).encode()).decode()
+    assert list(iter_state_resources(content)) == state['resources']
+    assert len(extract_asset_inventory(content)) == 1
+
+
+def test_missing_str_path_is_reported(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        list(iter_state_resources(str(tmp_path / 'missing.tfstate')))
@@ -0,0 +1,94 @@
+import json
+import sqlite3
+
+from nabla_evidence.assessment import AssessmentIndex
+from nabla_evidence.inventory import extract_asset_inventory
+from nabla_evidence.store import AssessmentStore
+
+from conftest import make_resource, make_state
+
+RESPONSE = {
+    'id': 'assessment-1',
+    'created_at': '2026-01-01T00:00:00',
+    'assessment': {
+        'nist_800_53': {
+            'version': 'Rev. 5',
+            'summary': {'total_controls': 2, 'satisfied': 1, 'not_satisfied': 1, 'not_applicable': 0},
+            'controls': [
+                {'control_id': 'AC-2', 'title': 'Account Management', 'status': 'satisfied',
+                 'findings': [], 'evidence': ['aws_iam_user.admin has MFA']},
+                {'control_id': 'SC-7', 'title': 'Boundary Protection', 'status': 'not-satisfied',
+                 'findings': ['aws_security_group.web allows 0.0.0.0/0', 'aws_vpc.main has no flow logs'],
+                 'evidence': []},
+            ],
+        },
+    },
+}
+
+
+def _inventory(write_state):
+    state = write_state(make_state([
+        make_resource('aws_vpc', 'main', {'id': 'vpc-1', 'cidr_block': '10.0.0.0/16', 'tags': {'env': 'prod'}}),
+        make_resource('aws_s3_bucket', 'logs', {'id': 'logs', 'bucket': 'logs'}, {'id': 'logs-2', 'bucket': 'logs-2'}),
+    ]))
+    return state, extract_asset_inventory(state)
+
+
+def test_record_run_round_trip(tmp_path, write_state):
+    state, inventory = _inventory(write_state)
+    store = AssessmentStore(tmp_path / 'runs.db')
+
+    run_id, asset_count = store.record_run(AssessmentIndex(RESPONSE), inventory, 'prod', state)
+
+    assert asset_count == 3
+    conn = sqlite3.connect(str(store.path))
+    try:
+        assert conn.execute(
+            'SELECT assessment_id, name, state_path, created_at, total_assets FROM assessments WHERE id = ?',
+            (run_id,)
+        ).fetchone() == ('assessment-1', 'prod', str(state), '2026-01-01T00:00:00', 3)
+
+        controls = conn.execute(
+            'SELECT control_id, status, findings_count, findings FROM controls WHERE run_id = ? ORDER BY control_id',
+            (run_id,)
+        ).fetchall()
+        assert controls[0] == ('AC-2', 'satisfied', 0, '[]')
+        assert controls[1][:3] == ('SC-7', 'not-satisfied', 2)
+        assert json.loads(controls[1][3]) == RESPONSE['assessment']['nist_800_53']['controls'][1]['findings']
+
+        findings = conn.execute('SELECT control_id, finding, severity FROM findings WHERE run_id = ?', (run_id,))
+        assert sorted(findings) == [
+            ('AC-2', 'No findings', 'Info'),
+            ('SC-7', 'aws_security_group.web allows 0.0.0.0/0', 'High'),
+            ('SC-7', 'aws_vpc.main has no flow logs', 'High'),
+        ]
+
+        assert conn.execute(
+            'SELECT framework, satisfied, not_satisfied, compliance_percentage FROM summaries WHERE run_id = ?',
+            (run_id,)
+        ).fetchall() == [('NIST 800 53', 1, 1, 50.0)]
+
+        assets = conn.execute('SELECT asset_id, resource_type, attributes FROM assets WHERE run_id = ?', (run_id,))
+        stored = {asset_id: (resource_type, json.loads(attributes)) for asset_id, resource_type, attributes in assets}
+        assert set(stored) == {asset['asset_id'] for asset in inventory}
+        vpc_type, vpc = stored['aws_vpc.main.0']
+        assert vpc_type == 'aws_vpc'
+        assert vpc['tags'] == {'env': 'prod'}
+    finally:
+        conn.close()
+
+
+def test_runs_append(tmp_path, write_state):
+    state, inventory = _inventory(write_state)
+    store = AssessmentStore(tmp_path / 'runs.db')
+
+    first, _ = store.record_run(RESPONSE, inventory, 'prod', state)
+    second, count = store.record_run(RESPONSE, iter(inventory), 'prod', state)
+
+    assert second == first + 1
+    assert count == 3
+    conn = sqlite3.connect(str(store.path))
+    try:
+        assert conn.execute('SELECT run_id, COUNT(*) FROM assets GROUP BY run_id').fetchall() == [(first, 3), (second, 3)]
+    finally:
+        conn.close()